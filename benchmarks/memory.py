@@ -0,0 +1,197 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                             File: memory.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ~ Custom modules. ~ #
+from core import engine as eng
+from core import entropy as ent
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+ENGINES = ["numpy", "bitpack", "hashlife", "sparse", "python"]
+
+# ~ Engines too slow to step a large world in a benchmark. ~ #
+NO_STEP = {"python"}
+
+
+class LegacyCell:
+    """
+        ~ The Cell of versions before 2.6: one object with a __dict__ per
+          cell, kept in two matrices next to a list of states. ~
+    """
+
+    def __init__(self, x, y, state=None):
+        self.pos = (x, y)
+        self.state = state
+
+
+def traced(build):
+    """
+        ~ Measure the memory a function allocates and keeps. ~
+
+        Arguments:
+            build (func) : Builds and returns the object to measure.
+
+        Returns:
+            (tuple) : The object, bytes retained and peak bytes.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        kept = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return kept, retained, peak
+
+
+def legacy(states):
+    """
+        ~ Measure the pre-2.6 layout: states, cells and new_cells. ~
+
+        Arguments:
+            states (ndarray) : Cell states of shape (height, width).
+
+        Returns:
+            (dict) : Bytes retained and at peak.
+    """
+
+    def build():
+        rows = states.tolist()
+        cells = [[LegacyCell(x, y, state) for x, state in enumerate(row)]
+                 for y, row in enumerate(rows)]
+        new_cells = [[LegacyCell(x, y) for x in range(len(row))]
+                     for y, row in enumerate(rows)]
+
+        return rows, cells, new_cells
+
+    _, retained, peak = traced(build)
+
+    return {"retained": retained, "peak": peak}
+
+
+def engine(name, states):
+    """
+        ~ Measure an engine holding the world, and stepping it once. ~
+
+        Arguments:
+            name (str)       : Name of the engine.
+            states (ndarray) : Cell states of shape (height, width).
+
+        Returns:
+            (dict) : Bytes retained after loading and at peak.
+    """
+
+    height, width = states.shape
+
+    def build():
+        world = eng.create(name, width, height)
+        world.load(states)
+
+        return world
+
+    world, retained, peak = traced(build)
+    result = {"retained": retained, "peak": peak}
+
+    if name not in NO_STEP:
+        _, _, step_peak = traced(world.step)
+        result["step_peak"] = step_peak
+
+    world.close()
+
+    return result
+
+
+def main(argv=None):
+    """
+        ~ Compare the memory per cell of every storage layout. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (int) : The exit status.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Memory per cell of the world storage layouts.")
+    parser.add_argument("--size", type=int, default=1000,
+                        help="width and height of the world (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the initial states (default: 0)")
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as one JSON object")
+    args = parser.parse_args(argv)
+
+    cells = args.size*args.size
+    bits = ent.NumpySource(args.seed).bits(cells)
+    states = bits.reshape(args.size, args.size)
+
+    results = {"legacy": legacy(states)}
+
+    for name in ENGINES:
+        results[name] = engine(name, states)
+
+    for result in results.values():
+        for key in list(result):
+            result[f"{key}_per_cell"] = result[key]/cells
+
+    if args.json:
+        print(json.dumps({"size": args.size, "results": results}))
+        return 0
+
+    print(f"{args.size}x{args.size} world, bytes per cell:")
+    print(f"    {'layout':<10}{'retained':>10}{'peak':>10}{'step peak':>11}")
+
+    for name, result in results.items():
+        step = result.get("step_peak_per_cell")
+        step = f"{step:>11.3f}" if step is not None else f"{'-':>11}"
+
+        print(f"    {name:<10}{result['retained_per_cell']:>10.3f}"
+              f"{result['peak_per_cell']:>10.3f}{step}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: startup.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ~ Modules the headless path must never import. ~ #
+HEAVY = ["qiskit", "qiskit_aer", "pygame", "colorama"]
+
+
+def import_times(module, runs=5):
+    """
+        ~ Time importing a module in fresh interpreters with -X importtime. ~
+
+        Arguments:
+            module (str) : The module to import.
+            runs (int)   : Fresh interpreters to time. (Default: 5)
+
+        Returns:
+            (tuple) : The best run's {module: cumulative microseconds} and
+                      the heavy modules it imported.
+    """
+
+    best = None
+
+    for _ in range(runs):
+        code = (f"import sys, {module}; "
+                f"print(*(name for name in {HEAVY!r} if name in sys.modules))")
+        result = subprocess.run([sys.executable, "-X", "importtime",
+                                 "-c", code],
+                                cwd=ROOT, capture_output=True, text=True,
+                                check=True)
+
+        times = {}
+
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+
+            _, cumulative, name = line[len("import time:"):].split("|")
+
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+
+        # ~ The last line lists the heavy modules; some print banners. ~ #
+        lines = result.stdout.splitlines() or [""]
+
+        if best is None or times[module] < best[0][module]:
+            best = (times, lines[-1].split())
+
+    return best
+
+
+def main(argv=None):
+    """
+        ~ Report how long the headless path takes to import. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (int) : 1 if a heavy module was imported or the budget was
+                    exceeded, otherwise 0.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Track `python -X importtime` for the headless path.")
+    parser.add_argument("--module", default="core.batch",
+                        help="module to import (default: core.batch)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="fresh interpreters to time (default: 5)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="slowest imports to list (default: 10)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail above this many milliseconds")
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as one JSON object")
+    args = parser.parse_args(argv)
+
+    times, heavy = import_times(args.module, args.runs)
+    total = times[args.module]/1000
+    slowest = sorted(times.items(), key=lambda item: -item[1])[:args.top]
+
+    if args.json:
+        print(json.dumps({"module": args.module, "milliseconds": total,
+                          "heavy": heavy,
+                          "slowest": {name: us/1000 for name, us in slowest}}))
+    else:
+        print(f"import {args.module}: {total:.1f} ms (best of {args.runs})")
+
+        for name, us in slowest:
+            print(f"    {us/1000:8.1f} ms  {name}")
+
+        if heavy:
+            print(f"Imported heavy modules: {', '.join(heavy)}")
+
+    over = args.budget is not None and total > args.budget
+
+    return 1 if heavy or over else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
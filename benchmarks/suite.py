@@ -0,0 +1,457 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                             File: suite.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ~ Custom modules. ~ #
+from core import entropy as ent
+from core import rules
+from core import terminal
+from core import world
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+SIZES = [64, 256, 1024, 4096]
+DENSITIES = [0.1, 0.3, 0.5]
+ENGINES = ["numpy", "bitpack", "sparse", "hashlife", "python"]
+GROUPS = ["engines", "rules", "render", "entropy"]
+
+# ~ Rules every engine should step as fast as B3/S23, on worlds of a side,
+#   and the engines that claim it. ~ #
+RULES = ["B3/S23", "highlife", "daynight", "seeds"]
+RULE_SIZE = 1024
+RULE_ENGINES = ["numpy", "bitpack", "sparse"]
+
+# ~ Largest side each engine is stepped at, where a generation would
+#   otherwise take seconds. ~ #
+MAX_SIZE = {"python": 256, "hashlife": 1024}
+
+# ~ (width, height) of the rendered worlds: a terminal and a large window. ~ #
+RENDER_SIZES = [(80, 24), (320, 180)]
+
+# ~ Frames stepped ahead of time and cycled through by the renderers. ~ #
+RENDER_FRAMES = 16
+
+
+def timed(func, min_time, max_calls=None):
+    """
+        ~ Call a function until enough time has passed. ~
+
+        Arguments:
+            func (func)     : Called with no arguments.
+            min_time (float): Least seconds to keep calling.
+            max_calls (int) : Most calls. (Default: None)
+
+        Returns:
+            (tuple) : Calls made and seconds they took.
+    """
+
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+
+    while elapsed < min_time and (max_calls is None or calls < max_calls):
+        func()
+        calls += 1
+        elapsed = time.perf_counter()-start
+
+    return calls, elapsed
+
+
+def record(results, name, value, unit, better="higher"):
+    """
+        ~ Add one measurement to the results. ~
+
+        Arguments:
+            results (dict) : Measurements by name.
+            name (str)     : Name of the measurement.
+            value (float)  : The measured value.
+            unit (str)     : Unit of the value.
+            better (str)   : Whether 'higher' or 'lower' is better.
+                             (Default: 'higher')
+    """
+
+    results[name] = {"value": value, "unit": unit, "better": better}
+    print(f"    {name:<44}{value:>16,.3f} {unit}", file=sys.stderr)
+
+
+def bench_engines(results, sizes, densities, engines, min_time, seed,
+                  rule=None):
+    """
+        ~ Measure World.update on every engine, size and density. ~
+
+        Arguments:
+            results (dict)   : Measurements by name.
+            sizes (list)     : Sides of the square worlds.
+            densities (list) : Fractions of cells alive at the start.
+            engines (list)   : Names of the engines.
+            min_time (float) : Least seconds per measurement.
+            seed (int)       : Seed of the initial states.
+            rule (str)       : Rule of the worlds. (Default: B3/S23)
+    """
+
+    rng = np.random.default_rng(seed)
+
+    for size in sizes:
+        for density in densities:
+            states = (rng.random((size, size)) < density).astype(np.uint8)
+
+            for name in engines:
+                if size > MAX_SIZE.get(name, size):
+                    continue
+
+                life = world.World(size, size, engine=name, entropy="numpy",
+                                   seed=seed, seeds_per_generation=0,
+                                   rule=rule).wait()
+
+                try:
+                    life.engine.load(states)
+                    life.update()   # ~ Warm up caches and buffers. ~ #
+
+                    calls, elapsed = timed(life.update, min_time)
+                finally:
+                    life.engine.close()
+
+                rate = calls/elapsed
+                key = f"engine/{name}/{size}x{size}/d{density:g}"
+
+                if rule is not None:
+                    key += f"/{rules.notation(life.rule)}"
+
+                record(results, f"{key}/generations_per_s", rate, "gen/s")
+                record(results, f"{key}/cells_per_s", rate*size*size,
+                       "cells/s")
+
+
+def bench_rules(results, engines, min_time, seed):
+    """
+        ~ Measure every rule on the engines and how it compares to B3/S23. ~
+
+        Arguments:
+            results (dict)   : Measurements by name.
+            engines (list)   : Names of the engines.
+            min_time (float) : Least seconds per measurement.
+            seed (int)       : Seed of the initial states.
+    """
+
+    rng = np.random.default_rng(seed)
+    states = (rng.random((RULE_SIZE, RULE_SIZE)) < 0.3).astype(np.uint8)
+
+    for name in engines:
+        if name not in RULE_ENGINES:
+            continue
+
+        conway = None
+
+        for rule in RULES:
+            life = world.World(RULE_SIZE, RULE_SIZE, engine=name,
+                               entropy="numpy", seed=seed,
+                               seeds_per_generation=0, rule=rule).wait()
+
+            try:
+                life.engine.load(states)
+                life.update()   # ~ Warm up caches and buffers. ~ #
+
+                calls, elapsed = timed(life.update, min_time)
+            finally:
+                life.engine.close()
+
+            rate = calls/elapsed
+            conway = rate if conway is None else conway
+            key = f"rule/{name}/{rules.notation(life.rule)}"
+
+            record(results, f"{key}/generations_per_s", rate, "gen/s")
+            record(results, f"{key}/vs_conway", rate/conway, "x")
+
+
+def _frames(width, height, seed):
+    """
+        ~ Step a world ahead of time for the renderers to draw. ~
+
+        Arguments:
+            width (int)  : Width of the world.
+            height (int) : Height of the world.
+            seed (int)   : Seed of the world.
+
+        Returns:
+            (tuple) : The loaded world and a list of frames.
+    """
+
+    life = world.World(width, height, entropy="numpy", seed=seed,
+                       seeds_per_generation=0).wait()
+    frames = []
+
+    for _ in range(RENDER_FRAMES):
+        life.update()
+        frames.append(life.grid.copy())
+
+    return life, frames
+
+
+def bench_render(results, min_time, seed):
+    """
+        ~ Measure the frame time of World.render, the diff-based terminal
+          renderer and gui.Window.render under a dummy video driver. ~
+
+        Arguments:
+            results (dict)   : Measurements by name.
+            min_time (float) : Least seconds per measurement.
+            seed (int)       : Seed of the worlds.
+    """
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    import pygame as pg
+    from core import gui
+
+    pg.init()
+
+    for width, height in RENDER_SIZES:
+        life, frames = _frames(width, height, seed)
+        key = f"render/{width}x{height}"
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            def draw():
+                out.seek(0)
+                out.truncate()
+                life.render()
+
+            calls, elapsed = timed(draw, min_time)
+
+        record(results, f"{key}/world_ms", elapsed/calls*1000, "ms", "lower")
+
+        renderer = terminal.TerminalRenderer(io.StringIO())
+        frame = itertools.cycle(frames)
+
+        def draw():
+            renderer.stream.seek(0)
+            renderer.stream.truncate()
+            renderer.render(next(frame))
+
+        calls, elapsed = timed(draw, min_time)
+        record(results, f"{key}/terminal_ms", elapsed/calls*1000, "ms",
+               "lower")
+
+        window = gui.Window((width, height), None)
+        frame = itertools.cycle(frames)
+
+        def draw():
+            window.render(life, next(frame))
+
+        calls, elapsed = timed(draw, min_time)
+        record(results, f"{key}/gui_ms", elapsed/calls*1000, "ms", "lower")
+
+        life.engine.close()
+
+    pg.quit()
+
+
+def bench_entropy(results, min_time):
+    """
+        ~ Measure bits/s of QuantumMechanics.q_flip, q_randint and q_choice,
+          and of the classical entropy sources. ~
+
+        Arguments:
+            results (dict)   : Measurements by name.
+            min_time (float) : Least seconds per measurement.
+    """
+
+    from core.quantum import QuantumMechanics
+
+    qm = QuantumMechanics(warm_up=True)
+    flips = 1 << 16
+    draws = 1 << 12
+    names = list(world.PATTERNS.keys())
+
+    # ~ (name, call, bits drawn per call) ~ #
+    cases = [
+        ("q_flip", lambda: qm.q_flip(flips), flips),
+        ("q_randint", lambda: qm.q_randint(1023, count=draws), 10*draws),
+        ("q_choice", lambda: qm.q_choice(names, [5, 1, 1], count=draws),
+         2*draws),
+    ]
+
+    for name, call, bits in cases:
+        calls, elapsed = timed(call, min_time)
+        record(results, f"entropy/quantum/{name}/bits_per_s",
+               calls*bits/elapsed, "bits/s")
+
+    for source in (ent.NumpySource(0), ent.OSSource()):
+        calls, elapsed = timed(lambda: source.bits(1 << 20), min_time)
+        record(results, f"entropy/{source.name}/bits/bits_per_s",
+               calls*(1 << 20)/elapsed, "bits/s")
+
+
+def compare(results, baseline, tolerance):
+    """
+        ~ Compare results against a baseline and list the regressions. ~
+
+        Arguments:
+            results (dict)    : Measurements by name.
+            baseline (dict)   : Baseline measurements by name.
+            tolerance (float) : Allowed relative slowdown.
+
+        Returns:
+            (list) : (name, baseline, value, change) of every regression.
+    """
+
+    regressions = []
+
+    # ~ The table goes to stderr, so a report on stdout stays JSON. ~ #
+    print(f"\n    {'measurement':<44}{'baseline':>20}{'now':>20}"
+          f"{'change':>9}", file=sys.stderr)
+
+    for name, result in results.items():
+        base = baseline.get(name)
+
+        if base is None or not base["value"]:
+            continue
+
+        change = result["value"]/base["value"]-1
+        worse = -change if result["better"] == "higher" else change
+        flag = "  REGRESSION" if worse > tolerance else ""
+
+        print(f"    {name:<44}{base['value']:>20,.3f}"
+              f"{result['value']:>20,.3f}{change:>+9.1%}{flag}",
+              file=sys.stderr)
+
+        if flag:
+            regressions.append((name, base["value"], result["value"], change))
+
+    return regressions
+
+
+def main(argv=None):
+    """
+        ~ Run the benchmark suite. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (int) : 1 if anything regressed against the baseline, else 0.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the engines, renderers and entropy sources.")
+    parser.add_argument("--only", default=",".join(GROUPS),
+                        help="comma separated groups to run "
+                             f"(default: {','.join(GROUPS)})")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="world sides for the engines")
+    parser.add_argument("--densities", default=",".join(map(str, DENSITIES)),
+                        help="starting densities for the engines")
+    parser.add_argument("--engines", default=",".join(ENGINES),
+                        help="engines to step")
+    parser.add_argument("--rule", default=None,
+                        help="rule the engines run (default: B3/S23)")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="least seconds per measurement (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the worlds (default: 0)")
+    parser.add_argument("--output", default=None,
+                        help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="relative slowdown counted as a regression "
+                             "(default: 0.10)")
+    args = parser.parse_args(argv)
+
+    groups = args.only.split(",")
+
+    for group in groups:
+        if group not in GROUPS:
+            parser.error(f"unknown group: {group}")
+
+    results = {}
+
+    if "engines" in groups:
+        bench_engines(results, [int(size) for size in args.sizes.split(",")],
+                      [float(d) for d in args.densities.split(",")],
+                      args.engines.split(","), args.min_time, args.seed,
+                      args.rule)
+    if "rules" in groups:
+        bench_rules(results, args.engines.split(","), args.min_time,
+                    args.seed)
+    if "render" in groups:
+        bench_render(results, args.min_time, args.seed)
+    if "entropy" in groups:
+        bench_entropy(results, args.min_time)
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+        regressions = compare(results, baseline, args.tolerance)
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond "
+                  f"{args.tolerance:.0%}.", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
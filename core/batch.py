@@ -0,0 +1,392 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                             File: batch.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import argparse
+import json
+import sys
+import time
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import rules
+from core import stream as stm
+from core import world
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+ENGINES = ["numpy", "bitpack", "hashlife", "sparse", "python"]
+ENTROPY = ["quantum", "numpy", "os"]
+COMPRESSIONS = ["zlib", "rle", "none"]
+
+
+def run(width, height, generations, engine="numpy", workers=1,
+        seeds_per_generation=1, output=None, entropy="quantum", seed=None,
+        metrics=None, checkpoint=None, checkpoint_every=0, resume=None,
+        compression="zlib", stream=None, keyframe=256, stop_on_cycle=0,
+        rule=None):
+    """
+        ~ Load a world and run it for a number of generations with no
+          rendering. ~
+
+        ~ With seeding and periodic checkpoints off the generations are run
+          in one `advance`, so the 'hashlife' engine can jump instead of
+          stepping; streaming and cycle detection step every generation.
+          A resumed run takes its entropy source and seeding from the
+          checkpoint and runs `generations` more generations. ~
+
+        Arguments:
+            width (int)                : Width of the world.
+            height (int)               : Height of the world.
+            generations (int)          : Generations to run.
+            engine (str)               : Step engine. (Default: 'numpy')
+            workers (int)              : Processes stepping the world.
+                                         (Default: 1)
+            seeds_per_generation (int) : Patterns seeded per generation;
+                                         0 turns seeding off. (Default: 1)
+            output (str | None)        : Write the final generation here.
+                                         (Default: None)
+            entropy (str)              : Entropy source. (Default: 'quantum')
+            seed (int | None)          : Seed of the 'numpy' source.
+                                         (Default: None)
+            metrics (Metrics | None)   : Records profiling samples.
+                                         (Default: None)
+            checkpoint (str | None)    : Write a checkpoint of the final
+                                         generation here. (Default: None)
+            checkpoint_every (int)     : Also checkpoint every N generations
+                                         in the background; 0 turns it off.
+                                         (Default: 0)
+            resume (str | None)        : Resume from this checkpoint instead
+                                         of initializing. (Default: None)
+            compression (str)          : Checkpoint compression.
+                                         (Default: 'zlib')
+            stream (str | obj | None)  : Stream every generation here as
+                                         deltas. (Default: None)
+            keyframe (int)             : Generations between keyframes of
+                                         the stream. (Default: 256)
+            stop_on_cycle (int)        : End the run once the world repeats
+                                         itself with a period up to this;
+                                         0 turns it off. (Default: 0)
+            rule (str | None)          : Rule in B/S notation or by name;
+                                         a resumed run defaults to the
+                                         saved rule. (Default: B3/S23)
+
+        Returns:
+            (dict) : Timings and throughput of the run.
+    """
+
+    start = time.perf_counter()
+
+    if resume:
+        options = {} if rule is None else {"rule": rule}
+        life = world.World.from_checkpoint(resume, engine=engine,
+                                           workers=workers, metrics=metrics,
+                                           **options).wait()
+        width, height = life.width, life.height
+        entropy = life.entropy.name
+        seed = getattr(life.entropy, "seed", None)
+        seeds_per_generation = life.seeds_per_generation
+    else:
+        life = world.World(width, height, engine=engine, workers=workers,
+                           seeds_per_generation=seeds_per_generation,
+                           entropy=entropy, seed=seed,
+                           metrics=metrics, rule=rule).wait()
+
+    loaded = time.perf_counter()
+    start_generation = life.generation
+
+    if stop_on_cycle > 0:
+        life.detect_cycles(stop_on_cycle)
+
+    if checkpoint and checkpoint_every > 0:
+        life.autosave(checkpoint, checkpoint_every, compression)
+
+    streamed = None
+
+    try:
+        if stream is not None:
+            # ~ Streamed runs stop at a cycle like stepped ones. ~ #
+            until = None if life.cycles is None else \
+                (lambda: life.cycles.cycle is not None)
+
+            streamed = stm.record(life, stream, generations, keyframe,
+                                  until=until)
+        elif life.cycles is not None:
+            for _ in range(generations):
+                if life.cycles.cycle is not None:
+                    break
+
+                life.update()
+        elif seeds_per_generation > 0 or life.autosaver is not None:
+            for _ in range(generations):
+                life.update()
+        else:
+            life.advance(generations)
+
+        # ~ Make sure every generation is really done before timing. ~ #
+        population = int(np.count_nonzero(life.grid))
+        elapsed = time.perf_counter()-loaded
+
+        if output:
+            save(life.grid, output)
+
+        if life.autosaver is not None:
+            life.autosaver.close()
+        if checkpoint:
+            life.save_checkpoint(checkpoint, compression)
+    finally:
+        life.engine.close()
+
+    ran = life.generation-start_generation
+    rate = ran/elapsed if elapsed else float("inf")
+
+    stats = {
+        "width": width,
+        "height": height,
+        "engine": engine,
+        "workers": workers,
+        "entropy": entropy,
+        "rule": rules.notation(life.rule),
+        "seed": seed,
+        "generations": life.generation,
+        "population": population,
+        "load_seconds": loaded-start,
+        "run_seconds": elapsed,
+        "generations_per_second": rate,
+        "cells_per_second": rate*width*height,
+    }
+
+    if streamed is not None:
+        stats["stream_bytes"] = streamed.written
+    if life.cycles is not None:
+        cycle = life.cycles.cycle
+        stats["cycle"] = cycle._asdict() if cycle is not None else None
+
+    return stats
+
+
+def save(cells, path):
+    """
+        ~ Write the final cell states to a file. ~
+
+        ~ Paths ending in '.npy' get a NumPy array, anything else gets one
+          line of 0s and 1s per row. ~
+
+        Arguments:
+            cells (ndarray) : Cell states of shape (height, width).
+            path (str)      : Where to write.
+    """
+
+    if path.endswith(".npy"):
+        np.save(path, cells)
+        return
+
+    with open(path, "w") as file:
+        for row in cells:
+            file.write("".join(map(str, row.tolist())) + "\n")
+
+
+def parse_args(argv=None):
+    """
+        ~ Parse the batch command line. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (Namespace) : The parsed options.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Run the Game of Life headless for N generations.",
+    )
+    parser.add_argument("-W", "--width", type=int, default=256,
+                        help="width of the world (default: 256)")
+    parser.add_argument("-H", "--height", type=int, default=256,
+                        help="height of the world (default: 256)")
+    parser.add_argument("-n", "--generations", type=int, default=1000,
+                        help="generations to run (default: 1000)")
+    parser.add_argument("-e", "--engine", choices=ENGINES, default="numpy",
+                        help="step engine (default: numpy)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="processes stepping the world (default: 1)")
+    parser.add_argument("-s", "--seeds", type=int, default=1,
+                        help="patterns seeded per generation; 0 turns "
+                             "seeding off (default: 1)")
+    parser.add_argument("-r", "--entropy", choices=ENTROPY,
+                        default="quantum",
+                        help="source of the initial states and seeded "
+                             "patterns (default: quantum)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the numpy entropy source, for "
+                             "reproducible runs")
+    parser.add_argument("--rule", default=None,
+                        help="birth/survival rule in B/S notation or by "
+                             "name: " + ", ".join(rules.RULES) +
+                             " (default: B3/S23)")
+    parser.add_argument("-o", "--output", default=None,
+                        help="write the final generation to this file "
+                             "('.npy' or text)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="write a checkpoint of the final generation "
+                             "to this file")
+    parser.add_argument("--checkpoint-every", type=int, default=0,
+                        help="also checkpoint every N generations in the "
+                             "background (default: 0, off)")
+    parser.add_argument("--resume", default=None,
+                        help="resume from this checkpoint instead of "
+                             "initializing the world")
+    parser.add_argument("--compression", choices=COMPRESSIONS,
+                        default="zlib",
+                        help="checkpoint compression (default: zlib)")
+    parser.add_argument("--stream", default=None,
+                        help="stream every generation to this file as "
+                             "compressed deltas ('-' for stdout)")
+    parser.add_argument("--keyframe", type=int, default=256,
+                        help="generations between keyframes of the stream "
+                             "(default: 256)")
+    parser.add_argument("--stop-on-cycle", type=int, default=0,
+                        metavar="K",
+                        help="stop once the world repeats itself with a "
+                             "period of up to K generations (default: 0, "
+                             "off)")
+    parser.add_argument("--json", action="store_true",
+                        help="print the results as one JSON object")
+    parser.add_argument("--metrics", default=None,
+                        help="append profiling samples to this file as "
+                             "JSON lines")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve profiling metrics in Prometheus text "
+                             "format on this local port")
+    parser.add_argument("--metrics-interval", type=float, default=1.0,
+                        help="seconds between JSON lines writes "
+                             "(default: 1.0)")
+
+    args = parser.parse_args(argv)
+
+    if args.width < 1 or args.height < 1:
+        parser.error("width and height must be at least 1")
+    if args.generations < 0:
+        parser.error("generations must not be negative")
+    if args.seed is not None and args.entropy != "numpy":
+        parser.error("--seed needs --entropy numpy")
+    if args.checkpoint_every < 0:
+        parser.error("--checkpoint-every must not be negative")
+    if args.checkpoint_every and not args.checkpoint:
+        parser.error("--checkpoint-every needs --checkpoint")
+    if args.keyframe < 1:
+        parser.error("--keyframe must be at least 1")
+    if args.stop_on_cycle < 0:
+        parser.error("--stop-on-cycle must not be negative")
+    if args.rule is not None:
+        try:
+            rules.parse(args.rule)
+        except ValueError as error:
+            parser.error(str(error))
+
+    return args
+
+
+def main(argv=None):
+    """
+        ~ Run the batch command line and report throughput. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (int) : The exit status.
+    """
+
+    args = parse_args(argv)
+    metrics = writer = server = None
+
+    if args.metrics or args.metrics_port is not None:
+        # ~ Only profiled runs pay for loading the HTTP server. ~ #
+        from core import metrics as met
+
+        metrics = met.Metrics()
+
+    if args.metrics:
+        writer = met.JsonLinesWriter(metrics, open(args.metrics, "a"),
+                                     args.metrics_interval)
+    if args.metrics_port is not None:
+        server = met.PrometheusServer(metrics, args.metrics_port)
+
+    try:
+        stats = run(args.width, args.height, args.generations,
+                    engine=args.engine, workers=args.workers,
+                    seeds_per_generation=args.seeds, output=args.output,
+                    entropy=args.entropy, seed=args.seed, metrics=metrics,
+                    checkpoint=args.checkpoint,
+                    checkpoint_every=args.checkpoint_every,
+                    resume=args.resume, compression=args.compression,
+                    stream=sys.stdout.buffer if args.stream == "-"
+                    else args.stream,
+                    keyframe=args.keyframe,
+                    stop_on_cycle=args.stop_on_cycle, rule=args.rule)
+    finally:
+        if writer is not None:
+            writer.close()
+            writer.stream.close()
+        if server is not None:
+            server.close()
+
+    # ~ Keep the report out of a stream written to stdout. ~ #
+    out = sys.stderr if args.stream == "-" else sys.stdout
+
+    if args.json:
+        print(json.dumps(stats), file=out)
+    else:
+        print(f"{stats['width']}x{stats['height']} {stats['engine']} "
+              f"{stats['rule']}: "
+              f"{stats['generations']} generations in "
+              f"{stats['run_seconds']:.3f}s "
+              f"(loaded in {stats['load_seconds']:.3f}s)", file=out)
+        print(f"{stats['generations_per_second']:,.1f} generations/s, "
+              f"{stats['cells_per_second']:,.0f} cells/s", file=out)
+        print(f"Population: {stats['population']}", file=out)
+
+        if "stream_bytes" in stats:
+            print(f"Streamed: {stats['stream_bytes']:,} bytes", file=out)
+        if stats.get("cycle"):
+            print(f"Cycle: period {stats['cycle']['period']} from "
+                  f"generation {stats['cycle']['start']}", file=out)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: bitpack.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import rules
+from core.engine import Engine
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+WORD = 64
+WORD_DTYPE = np.dtype("<u8")
+ONE = np.uint64(1)
+TOP = np.uint64(WORD-1)
+
+# ~ Bytes of temporaries allowed per band of rows in a step. ~ #
+BAND_BYTES = 1 << 24
+
+# ~ Gates of a compiled rule network, by name. ~ #
+GATES = {
+    "and": np.bitwise_and,
+    "or": np.bitwise_or,
+    "xor": np.bitwise_xor,
+}
+
+
+def pack(states, width):
+    """
+        ~ Pack a 2D matrix of cell states into rows of 64-bit words. ~
+
+        ~ Bit i of word j in a row holds the cell at x = 64*j + i. ~
+
+        Arguments:
+            states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+            width (int)        : Width of the world.
+
+        Returns:
+            (ndarray) : Packed rows of shape (height, words).
+    """
+
+    # ~ packbits sets a bit for any nonzero state. ~ #
+    cells = np.asarray(states).reshape(-1, width)
+    words = -(-width//WORD)
+
+    row_bytes = np.packbits(cells, axis=1, bitorder="little")
+
+    if row_bytes.shape[1] == words*8:
+        return row_bytes.view(WORD_DTYPE)
+
+    packed = np.zeros((cells.shape[0], words*8), dtype=np.uint8)
+    packed[:, :row_bytes.shape[1]] = row_bytes
+
+    return packed.view(WORD_DTYPE)
+
+
+def unpack(words, width):
+    """
+        ~ Unpack rows of 64-bit words back into a uint8 cell matrix. ~
+
+        Arguments:
+            words (ndarray) : Packed rows of shape (height, words).
+            width (int)     : Width of the world.
+
+        Returns:
+            (ndarray) : Cell states of shape (height, width).
+    """
+
+    row_bytes = np.ascontiguousarray(words, dtype=WORD_DTYPE).view(np.uint8)
+    cells = np.unpackbits(row_bytes, axis=1, bitorder="little")
+
+    return cells[:, :width]
+
+
+def changes(rows, old, new):
+    """
+        ~ Find the words that differ between two sets of packed rows. ~
+
+        ~ When most words differ, every word is returned; finding the few
+          that did not would cost more than they save. ~
+
+        Arguments:
+            rows (ndarray) : Row number of each packed row.
+            old (ndarray)  : Old packed rows of shape (rows, words).
+            new (ndarray)  : New packed rows of the same shape.
+
+        Returns:
+            (tuple) : Flat indices and new values of the words.
+    """
+
+    differ = old != new
+
+    if 4*np.count_nonzero(differ) > differ.size:
+        index = rows[:, None]*old.shape[1] + np.arange(old.shape[1])
+
+        return index.ravel(), new.ravel()
+
+    row, word = np.nonzero(differ)
+
+    return rows[row]*old.shape[1] + word, new[row, word]
+
+
+class BitPackEngine(Engine):
+    """
+        ~ Bit-packed engine storing 64 cells per word and stepping them
+          with bitwise full-adder logic. ~
+
+        The eight neighbor bit-planes of a word are built by shifting it and
+        carrying bits in from the words (and rows) around it, then summed
+        bit-parallel into a 4-bit neighbor count. The rule is compiled once
+        into a small network of bitwise gates over the count and the cells,
+        so every rule steps the same way as B3/S23.
+
+        Methods:
+            load       : Load the cell states from a 2D matrix.
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            get        : Get the state of a single cell.
+            rows       : Return the cell states as a 2D matrix.
+            array      : Return the cell states as a uint8 array.
+            step       : Advance the world by one generation.
+            _rule      : Apply the rule network to the count bit-planes.
+    """
+
+    name = "bitpack"
+    reports_changes = True
+
+    def __init__(self, width, height, rule=None):
+        """
+            ~ Initialize the engine. ~
+
+            Arguments:
+                width (int)       : Width of the world.
+                height (int)      : Height of the world.
+                rule (str | Rule) : Rule in B/S notation. (Default: B3/S23)
+
+            Attributes:
+                words (int)      : Words per row.
+                tail (uint64)    : Mask of the real cells in the last word.
+                last_bit (int)   : Bit index of the last cell in a row.
+                band (int)       : Rows stepped at once to bound memory.
+                network (tuple)  : The rule compiled by rules.network.
+        """
+
+        super().__init__(width, height, rule)
+
+        self.words = -(-width//WORD)
+        self.last_bit = np.uint64((width-1)%WORD)
+        self.tail = np.uint64((1 << ((width-1)%WORD+1))-1)
+        self.band = max(1, min(height, BAND_BYTES//(self.words*8*16)))
+        self.network = rules.network(self.rule)
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        self.load_bands([(0, states)])
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time, packing each
+              band straight into the words. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+        """
+
+        self.grid = np.zeros((self.height, self.words), dtype=WORD_DTYPE)
+
+        for start, rows in bands:
+            words = pack(rows, self.width)
+            self.grid[start:start+len(words)] = words
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        index = set()
+
+        for x, y in points:
+            self.grid[y, x//WORD] |= ONE << np.uint64(x%WORD)
+            index.add(y*self.words + x//WORD)
+
+        if self.on_change is not None:
+            index = np.fromiter(index, dtype=np.intp, count=len(index))
+            self.on_change(index, self.grid.reshape(-1)[index])
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        return int((self.grid[y, x//WORD] >> np.uint64(x%WORD)) & ONE)
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        return self.array().tolist()
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        return unpack(self.grid, self.width)
+
+    def _shift_west(self, rows):
+        """
+            ~ Move every cell's west neighbor onto the cell's bit. ~
+
+            Arguments:
+                rows (ndarray) : Packed rows.
+
+            Returns:
+                (ndarray) : Bit-plane of west neighbors.
+        """
+
+        west = rows << ONE
+        west[:, 1:] |= rows[:, :-1] >> TOP
+
+        # ~ The first cell of a row wraps to the last cell. ~ #
+        west[:, 0] |= (rows[:, -1] >> self.last_bit) & ONE
+
+        return west
+
+    def _shift_east(self, rows):
+        """
+            ~ Move every cell's east neighbor onto the cell's bit. ~
+
+            Arguments:
+                rows (ndarray) : Packed rows.
+
+            Returns:
+                (ndarray) : Bit-plane of east neighbors.
+        """
+
+        east = rows >> ONE
+        east[:, :-1] |= rows[:, 1:] << TOP
+
+        # ~ The last cell of a row wraps to the first cell. ~ #
+        east[:, -1] |= (rows[:, 0] & ONE) << self.last_bit
+
+        return east
+
+    def _counts(self, rows):
+        """
+            ~ Sum the neighbors of the inner rows of a band into bit-planes. ~
+
+            Arguments:
+                rows (ndarray) : Packed rows with one halo row on each side.
+
+            Returns:
+                (tuple) : Count bit-planes (s0, s1, s2, s3), least significant
+                          first, for every inner row.
+        """
+
+        west = self._shift_west(rows)
+        east = self._shift_east(rows)
+
+        # ~ Two-bit sum of west, center and east for every row. ~ #
+        row_lo = west ^ rows ^ east
+        row_hi = (west & rows) | (east & (west ^ rows))
+
+        # ~ The middle row only counts its west and east neighbors. ~ #
+        mid_lo = west[1:-1] ^ east[1:-1]
+        mid_hi = west[1:-1] & east[1:-1]
+
+        up_lo, up_hi = row_lo[:-2], row_hi[:-2]
+        down_lo, down_hi = row_lo[2:], row_hi[2:]
+
+        # ~ Full adders: ones column, then the twos column with its carry. ~ #
+        ones = up_lo ^ down_lo
+        s0 = ones ^ mid_lo
+        carry = (up_lo & down_lo) | (mid_lo & ones)
+
+        twos = up_hi ^ down_hi
+        fours = (up_hi & down_hi) | (mid_hi & twos)
+        twos ^= mid_hi
+
+        s1 = twos ^ carry
+        carry &= twos
+        s2 = fours ^ carry
+        s3 = fours & carry
+
+        return s0, s1, s2, s3
+
+    def _rule(self, planes, cells):
+        """
+            ~ Apply the rule network to the count bit-planes of some rows. ~
+
+            Arguments:
+                planes (tuple)  : Count bit-planes (s0, s1, s2, s3).
+                cells (ndarray) : The rows' current packed cells.
+
+            Returns:
+                (ndarray) : The rows' next packed cells.
+        """
+
+        slots = [*planes, cells]
+
+        for op, left, right in self.network:
+            if op in GATES:
+                slots.append(GATES[op](slots[left], slots[right]))
+            elif op == "not":
+                slots.append(~slots[left])
+            elif op == "copy":
+                slots.append(slots[left].copy())
+            else:
+                slots.append(np.zeros_like(cells) if op == "zero" else
+                             np.full_like(cells, ~np.uint64(0)))
+
+        return slots[-1]
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        grid, height = self.grid, self.height
+
+        # ~ The world is stepped in place, a band at a time, so only the
+        #   rows a band overwrites that later bands still read are kept:
+        #   the last row of the band before and the first row of all. ~ #
+        first = grid[0].copy()
+        above = grid[-1].copy()
+
+        for start in range(0, height, self.band):
+            end = min(start+self.band, height)
+            below = first if end == height else grid[end]
+
+            # ~ The band plus one wrapped halo row above and below. ~ #
+            rows = np.concatenate((above[None], grid[start:end],
+                                   below[None]))
+            new = self._rule(self._counts(rows), rows[1:-1])
+
+            new[:, -1] &= self.tail
+
+            if self.on_change is not None:
+                self.on_change(*changes(np.arange(start, end), rows[1:-1],
+                                        new))
+
+            above = rows[-2]
+            grid[start:end] = new
@@ -0,0 +1,335 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: checkpoint.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Layout of a checkpoint file, all integers little-endian:
+
+        header   : HEADER (magic, version, compression, width, height,
+                   generation, payload offset, payload size, meta size)
+        meta     : UTF-8 JSON with the seed queue, entropy state and engine
+        padding  : Zeros up to a multiple of ALIGN bytes
+        payload  : The cells packed 8 per byte, one padded row at a time,
+                   stored raw, zlib compressed or run-length encoded
+
+    Raw payloads are memory-mapped straight out of the file on load.
+"""
+
+
+# ~ Standard libraries. ~ #
+import json
+import os
+import struct
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+MAGIC = b"LIFECKPT"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIIQQQI")
+ALIGN = 64
+
+COMPRESSIONS = {"none": 0, "zlib": 1, "rle": 2}
+COMPRESSION_NAMES = {code: name for name, code in COMPRESSIONS.items()}
+
+# ~ A loaded checkpoint. `packed` holds the cells 8 per byte; for raw files
+#   it is a read-only memory map of the file. ~ #
+Checkpoint = namedtuple("Checkpoint", ["width", "height", "generation",
+                                       "compression", "meta", "packed"])
+
+
+def pack(cells):
+    """
+        ~ Pack cell states 8 per byte, one padded row at a time. ~
+
+        Arguments:
+            cells (ndarray) : Cell states of shape (height, width).
+
+        Returns:
+            (ndarray) : Packed rows of shape (height, ceil(width/8)).
+    """
+
+    return np.packbits(np.asarray(cells, dtype=bool), axis=1)
+
+
+def unpack(checkpoint, start=0, end=None):
+    """
+        ~ Unpack the cells of a checkpoint, or of a band of its rows. ~
+
+        ~ Only the band's rows are touched, so a memory-mapped payload is
+          read a band at a time. ~
+
+        Arguments:
+            checkpoint (Checkpoint) : A loaded checkpoint.
+            start (int)             : First row. (Default: 0)
+            end (int | None)        : Row after the last row.
+                                      (Default: the height)
+
+        Returns:
+            (ndarray) : Cell states of shape (end-start, width).
+    """
+
+    return np.unpackbits(checkpoint.packed[start:end], axis=1,
+                         count=checkpoint.width)
+
+
+def _rle_encode(data):
+    """
+        ~ Run-length encode bytes as run lengths followed by run values. ~
+
+        Arguments:
+            data (ndarray) : Flat uint8 data.
+
+        Returns:
+            (bytes) : Run count, uint32 lengths, then the uint8 values.
+    """
+
+    if data.size == 0:
+        return struct.pack("<Q", 0)
+
+    starts = np.flatnonzero(np.diff(data))+1
+    starts = np.concatenate(([0], starts))
+    lengths = np.diff(np.append(starts, data.size)).astype("<u4")
+
+    return struct.pack("<Q", starts.size) + lengths.tobytes() + \
+        data[starts].tobytes()
+
+
+def _rle_decode(payload):
+    """
+        ~ Decode run-length encoded bytes. ~
+
+        Arguments:
+            payload (bytes) : Output of _rle_encode.
+
+        Returns:
+            (ndarray) : Flat uint8 data.
+    """
+
+    (runs,) = struct.unpack_from("<Q", payload)
+    lengths = np.frombuffer(payload, dtype="<u4", count=runs, offset=8)
+    values = np.frombuffer(payload, dtype=np.uint8, count=runs,
+                           offset=8+4*runs)
+
+    return np.repeat(values, lengths)
+
+
+def save(path, cells, generation=0, meta=None, compression="zlib"):
+    """
+        ~ Write a checkpoint, replacing any file at the path atomically. ~
+
+        Arguments:
+            path (str)         : Where to write.
+            cells (ndarray)    : Cell states of shape (height, width).
+            generation (int)   : Generation of the cells. (Default: 0)
+            meta (dict)        : JSON-able state saved alongside the cells.
+                                 (Default: None)
+            compression (str)  : 'none', 'zlib' or 'rle'. (Default: 'zlib')
+    """
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}!")
+
+    height, width = np.shape(cells)
+    packed = pack(cells)
+
+    if compression == "zlib":
+        payload = zlib.compress(packed.tobytes(), 6)
+    elif compression == "rle":
+        payload = _rle_encode(packed.ravel())
+    else:
+        payload = packed.tobytes()
+
+    meta_bytes = json.dumps(meta or {}).encode()
+    offset = -(-(HEADER.size+len(meta_bytes))//ALIGN)*ALIGN
+    padding = offset-HEADER.size-len(meta_bytes)
+
+    header = HEADER.pack(MAGIC, VERSION, COMPRESSIONS[compression], width,
+                         height, generation, offset, len(payload),
+                         len(meta_bytes))
+    temp = f"{path}.tmp"
+
+    with open(temp, "wb") as file:
+        file.write(header)
+        file.write(meta_bytes)
+        file.write(b"\0"*padding)
+        file.write(payload)
+
+    os.replace(temp, path)
+
+
+def load(path):
+    """
+        ~ Read a checkpoint. ~
+
+        ~ Raw payloads are memory-mapped rather than read, so only the
+          pages the caller touches are loaded. ~
+
+        Arguments:
+            path (str) : The checkpoint file.
+
+        Returns:
+            (Checkpoint) : The checkpoint.
+    """
+
+    with open(path, "rb") as file:
+        fields = HEADER.unpack(file.read(HEADER.size))
+        magic, version, compression, width, height, generation, \
+            offset, size, meta_size = fields
+
+        if magic != MAGIC:
+            raise ValueError(f"Not a checkpoint: {path}!")
+        if version != VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {version}!")
+        if compression not in COMPRESSION_NAMES:
+            raise ValueError(f"Unknown compression: {compression}!")
+
+        meta = json.loads(file.read(meta_size).decode() or "{}")
+        shape = (height, -(-width//8))
+
+        if COMPRESSION_NAMES[compression] != "none":
+            file.seek(offset)
+            payload = file.read(size)
+
+    name = COMPRESSION_NAMES[compression]
+
+    if name == "none":
+        packed = np.memmap(path, dtype=np.uint8, mode="r", offset=offset,
+                           shape=shape) if size else np.zeros(shape, np.uint8)
+    elif name == "zlib":
+        packed = np.frombuffer(zlib.decompress(payload), dtype=np.uint8)
+        packed = packed.reshape(shape)
+    else:
+        packed = _rle_decode(payload).reshape(shape)
+
+    return Checkpoint(width, height, generation, name, meta, packed)
+
+
+class AutoSaver:
+    """
+        ~ Checkpoints a world every N generations on a background thread. ~
+
+        ~ The stepping thread only copies the grid; packing, compressing
+          and writing happen off it. If the last checkpoint is still being
+          written when the next one is due, the new one is skipped rather
+          than queued. A checkpoint that failed is counted and its error
+          raised by the next `tick` or by `close`. ~
+
+        Methods:
+            __init__ : Initialize the saver.
+            tick     : Start a checkpoint if one is due.
+            _collect : Raise the error of a finished checkpoint, if any.
+            _write   : Write one checkpoint.
+            close    : Wait for the last checkpoint to finish.
+    """
+
+    def __init__(self, world, path, every, compression="zlib"):
+        """
+            ~ Initialize the saver. ~
+
+            Arguments:
+                world (World)     : The world to checkpoint.
+                path (str)        : Where to write.
+                every (int)       : Generations between checkpoints.
+                compression (str) : 'none', 'zlib' or 'rle'.
+                                    (Default: 'zlib')
+
+            Attributes:
+                path (str)        : Where to write.
+                every (int)       : Generations between checkpoints.
+                compression (str) : Payload compression.
+                saved (int)       : Checkpoints written.
+                skipped (int)     : Checkpoints skipped while busy.
+                failed (int)      : Checkpoints that raised an error.
+        """
+
+        if every < 1:
+            raise ValueError("Checkpoints must be at least 1 generation "
+                             "apart!")
+
+        self.world = world
+        self.path = path
+        self.every = every
+        self.compression = compression
+        self.saved = 0
+        self.skipped = 0
+        self.failed = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def tick(self):
+        """ ~ Start a checkpoint if the world's generation is due one. ~ """
+
+        if self._pending is not None and self._pending.done():
+            self._collect()
+
+        if self.world.generation % self.every:
+            return
+
+        if self._pending is not None:
+            self.skipped += 1
+            return
+
+        cells, generation, meta = self.world.snapshot()
+        self._pending = self._executor.submit(self._write, cells,
+                                              generation, meta)
+
+    def _collect(self):
+        """ ~ Forget the finished checkpoint, raising its error if any. ~ """
+
+        error = self._pending.exception()
+        self._pending = None
+
+        if error is not None:
+            self.failed += 1
+            raise error
+
+    def _write(self, cells, generation, meta):
+        """
+            ~ Write one checkpoint. ~
+
+            Arguments:
+                cells (ndarray)  : Copied cell states.
+                generation (int) : Their generation.
+                meta (dict)      : World state saved alongside them.
+        """
+
+        save(self.path, cells, generation, meta, self.compression)
+        self.saved += 1
+
+    def close(self):
+        """ ~ Wait for the last checkpoint to finish. ~ """
+
+        self._executor.shutdown(wait=True)
+
+        if self._pending is not None:
+            self._collect()
@@ -0,0 +1,213 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: cycles.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+from collections import deque, namedtuple
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import bitpack as bp
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX_2 = np.uint64(0x94D049BB133111EB)
+
+# ~ Hashes are sums wrapping at 64 bits. ~ #
+MASK = (1 << 64) - 1
+
+# ~ A state seen again `period` generations after `start`. ~ #
+Cycle = namedtuple("Cycle", ["start", "period", "generation"])
+
+
+def mix(indices, words, salt=0):
+    """
+        ~ Hash 64-cell words by their flat index. ~
+
+        ~ Each word is XORed with its index spread by the golden ratio and
+          mixed with splitmix64, so no table of a key per word is kept. ~
+
+        Arguments:
+            indices (ndarray) : Flat indices of the words.
+            words (ndarray)   : The words.
+            salt (int)        : Picks a different hash. (Default: 0)
+
+        Returns:
+            (ndarray) : One uint64 hash per word.
+    """
+
+    # ~ Arrays of integers wrap silently. ~ #
+    z = np.add(indices, salt+1, dtype=np.uint64, casting="unsafe")
+    z *= GOLDEN
+    z ^= words
+    z ^= z >> np.uint64(30)
+    z *= MIX_1
+    z ^= z >> np.uint64(27)
+    z *= MIX_2
+    z ^= z >> np.uint64(31)
+
+    return z
+
+
+class CycleDetector:
+    """
+        ~ Finds when a world returns to a state it was in up to
+          `max_period` generations ago. ~
+
+        ~ The hash of a state is the sum of the hashes of its 64-cell
+          words, laid out as in the bit-packed engine. The hash of every
+          word is kept, one per 64 cells, and engines that report the
+          words they change hand them to `change`, so each generation only
+          those are hashed again; for the others every generation is
+          hashed from its cells. A hash is remembered for `max_period`
+          generations. ~
+
+        Methods:
+            __init__ : Initialize the detector.
+            change   : Fold changed words into the next hash.
+            observe  : Hash a generation and look for a cycle.
+            reset    : Forget every state seen.
+    """
+
+    def __init__(self, max_period=64, on_cycle=None, salt=0):
+        """
+            ~ Initialize the detector. ~
+
+            Arguments:
+                max_period (int) : Longest period to detect. (Default: 64)
+                on_cycle (func)  : Called with the first Cycle found.
+                                   (Default: None)
+                salt (int)       : Picks a different hash. (Default: 0)
+
+            Attributes:
+                max_period (int)     : Longest period to detect.
+                on_cycle (func)      : Called with the first Cycle found.
+                salt (int)           : Picks the hash.
+                hash (int | None)    : Hash of the last state observed.
+                cycle (Cycle | None) : The first cycle found.
+        """
+
+        if max_period < 1:
+            raise ValueError("The longest period must be at least 1!")
+
+        self.max_period = max_period
+        self.on_cycle = on_cycle
+        self.salt = salt
+        self.hash = None
+        self.cycle = None
+
+        self._delta = 0
+        self._hashes = None
+        self._history = deque()
+        self._seen = {}
+
+    def change(self, indices, words):
+        """
+            ~ Fold words that changed since the last generation observed
+              into the next hash. ~
+
+            ~ Until a generation is observed with its cells there is
+              nothing to fold them into, so they are ignored. ~
+
+            Arguments:
+                indices (ndarray) : Flat indices of the words, each once.
+                words (ndarray)   : Their new values.
+        """
+
+        if self._hashes is None:
+            return
+
+        hashes = mix(indices, words, self.salt)
+        delta = hashes - self._hashes[indices]
+        self._hashes[indices] = hashes
+
+        self._delta += int(np.add.reduce(delta, dtype=np.uint64))
+
+    def observe(self, generation, cells=None):
+        """
+            ~ Hash a generation and look for a cycle. ~
+
+            Arguments:
+                generation (int) : The generation's number.
+                cells (ndarray)  : Its cell states, to hash it from scratch.
+                                   None folds in the changed words instead.
+                                   (Default: None)
+
+            Returns:
+                (Cycle | None) : The cycle this generation closes, if any.
+        """
+
+        if cells is not None:
+            words = bp.pack(cells, np.shape(cells)[1]).ravel()
+            self._hashes = mix(np.arange(words.size), words, self.salt)
+            self.hash = int(np.add.reduce(self._hashes, dtype=np.uint64))
+        elif self.hash is None:
+            raise ValueError("The first generation observed needs its cells!")
+        else:
+            self.hash = (self.hash + self._delta) & MASK
+
+        self._delta = 0
+        seen = self._seen.get(self.hash)
+
+        self._history.append((generation, self.hash))
+        self._seen[self.hash] = generation
+
+        # ~ Forget states too old to close a cycle we look for. ~ #
+        while self._history[0][0] < generation-self.max_period:
+            old, stale = self._history.popleft()
+
+            if self._seen.get(stale) == old:
+                del self._seen[stale]
+
+        if seen is None or not 0 < generation-seen <= self.max_period:
+            return None
+
+        cycle = Cycle(seen, generation-seen, generation)
+
+        if self.cycle is None:
+            self.cycle = cycle
+
+            if self.on_cycle is not None:
+                self.on_cycle(cycle)
+
+        return cycle
+
+    def reset(self):
+        """ ~ Forget every state seen, and the cycle found. ~ """
+
+        self.hash = None
+        self.cycle = None
+        self._delta = 0
+        self._hashes = None
+        self._history.clear()
+        self._seen.clear()
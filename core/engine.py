@@ -0,0 +1,706 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                             File: engine.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+from collections import namedtuple
+
+# ~ Custom modules. ~ #
+from core import rules
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Flat-index neighbor tables of a torus: the eight offsets that are valid
+#   for every interior cell, the (start, end) index runs of interior cells
+#   and the wrapped neighbors of each edge cell. ~ #
+Torus = namedtuple("Torus", ["offsets", "interior", "edges"])
+
+# ~ Neighbor tables by (width, height), shared by every world of a size. ~ #
+TORI = {}
+
+# ~ Cells of a band of rows the NumPy engine steps at once; its scratch
+#   buffers stay small enough to sit in cache. ~ #
+BAND_CELLS = 1 << 17
+
+
+def torus(width, height):
+    """
+        ~ Get the cached neighbor tables of a torus, building them once. ~
+
+        ~ Interior cells never wrap, so one set of flat offsets serves all
+          of them. Only the edge cells get their own wrapped neighbor
+          lists. ~
+
+        Arguments:
+            width (int)  : Width of the world.
+            height (int) : Height of the world.
+
+        Returns:
+            (Torus) : The neighbor tables.
+    """
+
+    table = TORI.get((width, height))
+
+    if table is not None:
+        return table
+
+    around = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+              if (dx, dy) != (0, 0)]
+    offsets = tuple(dy*width+dx for dx, dy in around)
+
+    interior = tuple((y*width+1, y*width+width-1)
+                     for y in range(1, height-1) if width > 2)
+
+    edges = {}
+
+    for y in range(height):
+        for x in range(width):
+            if 0 < x < width-1 and 0 < y < height-1:
+                continue
+
+            edges[y*width+x] = tuple(((y+dy)%height)*width + (x+dx)%width
+                                     for dx, dy in around)
+
+    return TORI.setdefault((width, height), Torus(offsets, interior, edges))
+
+
+def apply_masks(masks, count, cells, out, scratch):
+    """
+        ~ Find the next states of cells from their neighbor counts with a
+          rule compiled by rules.masks. ~
+
+        Arguments:
+            masks (tuple)     : The compiled rule.
+            count (ndarray)   : Live neighbor counts less the masks' offset.
+            cells (ndarray)   : The cells' current states.
+            out (ndarray)     : Where the next states go.
+            scratch (ndarray) : A uint8 buffer of the cells' shape.
+    """
+
+    import numpy as np
+
+    dead, live, _, eights = masks
+
+    # ~ Each cell's byte of the rule, shifted right by its count. ~ #
+    np.multiply(cells, dead ^ live, out=scratch)
+    scratch ^= dead
+    np.right_shift(scratch, count, out=scratch)
+    np.bitwise_and(scratch, 1, out=out)
+
+    if eights is not None:
+        born, survives = eights
+        eight = count == 8
+
+        if not born:
+            eight &= cells.view(bool)
+        elif not survives:
+            eight &= ~cells.view(bool)
+
+        out |= eight
+
+
+class Engine:
+    """
+        ~ Base class for the step engines that own the world's cell states. ~
+
+        Every engine works on a toroidal grid and applies the double-buffered
+        generation step, so swapping engines never changes the outcome.
+
+        Methods:
+            __init__ : Initialize the engine.
+            load       : Load the cell states from a 2D matrix.
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            get        : Get the state of a single cell.
+            rows       : Return the cell states as a 2D matrix.
+            array      : Return the cell states as a uint8 array.
+            step       : Advance the world by one generation.
+            advance    : Advance the world by many generations.
+            close      : Release anything the engine holds outside Python.
+    """
+
+    name = "base"
+
+    # ~ Whether step and seed hand the words they change to
+    #   `on_change`. ~ #
+    reports_changes = False
+
+    def __init__(self, width, height, rule=None):
+        """
+            ~ Initialize the engine. ~
+
+            Arguments:
+                width (int)        : Width of the world.
+                height (int)       : Height of the world.
+                rule (str | Rule)  : Rule in B/S notation. (Default: B3/S23)
+
+            Attributes:
+                width (int)        : Width of the world.
+                height (int)       : Height of the world.
+                rule (Rule)        : The rule the world runs.
+                conway (bool)      : Whether the rule is B3/S23, which some
+                                     engines have a hand-tuned step for.
+                next_state (tuple) : Next state of a cell by its state and
+                                     live neighbor count.
+                on_change (func)   : Called with the flat indices and new
+                                     values of the 64-cell words each step
+                                     or seed changes, on engines that
+                                     report them. Word j of row y holds
+                                     cells 64j to 64j+63 of the row, as in
+                                     the bit-packed engine.
+        """
+
+        self.width = width
+        self.height = height
+        self.rule = rules.parse(rule)
+        self.conway = self.rule == rules.CONWAY
+        self.next_state = rules.next_state(self.rule)
+        self.on_change = None
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        raise NotImplementedError
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time. ~
+
+            ~ Engines with a buffer of their own write every band straight
+              into it, so the world is never held one byte per cell on the
+              way in. This default gathers the bands and calls `load`. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+        """
+
+        import numpy as np
+
+        states = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        for start, rows in bands:
+            rows = np.asarray(rows, dtype=bool).reshape(-1, self.width)
+            states[start:start+len(rows)] = rows
+
+        self.load(states)
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        raise NotImplementedError
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        raise NotImplementedError
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        return [[self.get(x, y) for x in range(self.width)]
+                for y in range(self.height)]
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            ~ The array may be the engine's own buffer; copy it before
+              keeping it across a step. ~
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        import numpy as np
+
+        return np.array(self.rows(), dtype=np.uint8).reshape(self.height,
+                                                             self.width)
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        raise NotImplementedError
+
+    def advance(self, generations):
+        """
+            ~ Advance the world by many generations. ~
+
+            Arguments:
+                generations (int) : Number of generations to advance.
+        """
+
+        for _ in range(generations):
+            self.step()
+
+    def close(self):
+        """ ~ Release anything the engine holds outside Python. ~ """
+
+
+class PythonEngine(Engine):
+    """
+        ~ The original pure-Python engine that checks every neighbor
+          of every cell. ~
+
+        The cells live in a flat bytearray, one byte per cell, row by row.
+        Neighbors are found through the cached torus tables, so interior
+        cells add fixed offsets and only edge cells look up wrapped ones.
+
+        Methods:
+            load       : Load the cell states from a 2D matrix.
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            get        : Get the state of a single cell.
+            rows       : Return the cell states as a 2D matrix.
+            array      : Return the cell states as a uint8 array.
+            neighbors  : Return the neighbor states of a cell.
+            step       : Advance the world by one generation.
+    """
+
+    name = "python"
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        self.load_bands([(0, states)])
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+        """
+
+        self.grid = bytearray(self.width*self.height)
+        self.new_grid = bytearray(self.width*self.height)
+        self.torus = torus(self.width, self.height)
+
+        for start, rows in bands:
+            for y, row in enumerate(rows, start):
+                offset = y*self.width
+                self.grid[offset:offset+self.width] = bytes(map(bool, row))
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        for x, y in points:
+            self.grid[y*self.width+x] = 1
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        return self.grid[y*self.width+x]
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        width = self.width
+
+        return [list(self.grid[start:start+width])
+                for start in range(0, width*self.height, width)]
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : A view of the engine's buffer.
+        """
+
+        import numpy as np
+
+        return np.frombuffer(self.grid, dtype=np.uint8).reshape(
+            self.height, self.width)
+
+    def neighbors(self, x, y):
+        """
+            ~ Return the states of all neighbors of a cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (list) : The states of the cell's eight neighbors.
+        """
+
+        index = y*self.width+x
+        edge = self.torus.edges.get(index)
+
+        if edge is None:
+            return [self.grid[index+offset] for offset in self.torus.offsets]
+
+        return [self.grid[neighbor] for neighbor in edge]
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        grid, new_grid = self.grid, self.new_grid
+        nw, n, ne, w, e, sw, s, se = self.torus.offsets
+        next_state = self.next_state
+
+        # ~ Interior cells: fixed offsets, no wrapping. ~ #
+        for start, end in self.torus.interior:
+            for i in range(start, end):
+                live = (grid[i+nw] + grid[i+n] + grid[i+ne] + grid[i+w]
+                        + grid[i+e] + grid[i+sw] + grid[i+s] + grid[i+se])
+                new_grid[i] = next_state[grid[i]][live]
+
+        # ~ Edge cells: neighbors wrapped around the torus. ~ #
+        for i, edge in self.torus.edges.items():
+            live = 0
+
+            for neighbor in edge:
+                live += grid[neighbor]
+
+            new_grid[i] = next_state[grid[i]][live]
+
+        self.grid, self.new_grid = self.new_grid, self.grid
+
+
+class NumpyEngine(Engine):
+    """
+        ~ Vectorized engine keeping the world in a packed uint8 array. ~
+
+        The world is stepped in place, a band of rows at a time. Neighbor
+        counts are the sum of eight shifted slices of a padded copy of the
+        band, where the padding holds the wrapped edges of the torus, so the
+        only buffers besides the grid are one band's worth of scratch.
+
+        Methods:
+            load       : Load the cell states from a 2D matrix.
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            get        : Get the state of a single cell.
+            rows       : Return the cell states as a 2D matrix.
+            array      : Return the cell states as a uint8 array.
+            step       : Advance the world by one generation.
+    """
+
+    name = "numpy"
+    reports_changes = True
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        self.load_bands([(0, states)])
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+        """
+
+        import numpy as np
+
+        self.grid = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        for start, rows in bands:
+            rows = np.asarray(rows, dtype=bool).reshape(-1, self.width)
+            self.grid[start:start+len(rows)] = rows
+
+        # ~ Scratch buffers of one band, reused every band. ~ #
+        self.band = max(1, min(self.height, BAND_CELLS//self.width))
+        shape = (self.band, self.width)
+
+        self._padded = np.zeros((self.band+2, self.width+2), dtype=np.uint8)
+        self._count = np.zeros(shape, dtype=np.uint8)
+
+        # ~ Rules other than B3/S23 as bytes to shift by the counts, and
+        #   the buffer to shift them in. ~ #
+        self._masks = rules.masks(self.rule)
+
+        if not self.conway:
+            self._scratch = np.zeros(shape, dtype=np.uint8)
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        import numpy as np
+
+        index = np.array([y*self.width+x for x, y in points], dtype=np.intp)
+        cells = self.grid.reshape(-1)
+
+        if self.on_change is None:
+            cells[index] = 1
+            return
+
+        rows = np.unique(index//self.width)
+        old = self.grid[rows]
+
+        cells[index] = 1
+        self._report(rows, old, self.grid[rows])
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        return int(self.grid[y, x])
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        return self.grid.tolist()
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : The engine's current buffer.
+        """
+
+        return self.grid
+
+    def _step_band(self, padded, out):
+        """
+            ~ Step the inner rows of a padded band. ~
+
+            ~ Neighbor counts are the sum of the eight slices of the band
+              shifted around each cell. ~
+
+            Arguments:
+                padded (ndarray) : The band with its wrapped halo rows and
+                                   columns.
+                out (ndarray)    : Where the band's next states go.
+        """
+
+        import numpy as np
+
+        rows = len(out)
+        count = self._count[:rows]
+
+        if self._masks[2]:
+            # ~ Counts less one: a count of 0 wraps around and shifts every
+            #   bit out. ~ #
+            np.subtract(padded[:-2, :-2], 1, out=count)
+            count += padded[:-2, 1:-1]
+        else:
+            np.add(padded[:-2, :-2], padded[:-2, 1:-1], out=count)
+
+        count += padded[:-2, 2:]
+        count += padded[1:-1, :-2]
+        count += padded[1:-1, 2:]
+        count += padded[2:, :-2]
+        count += padded[2:, 1:-1]
+        count += padded[2:, 2:]
+
+        if self.conway:
+            # ~ Born with exactly three neighbors, survive with two or
+            #   three: either way the count OR the cell is 3. ~ #
+            count |= padded[1:-1, 1:-1]
+            np.equal(count, 3, out=out.view(bool))
+            return
+
+        apply_masks(self._masks, count, padded[1:-1, 1:-1], out,
+                    self._scratch[:rows])
+
+    def _report(self, rows, old, new):
+        """
+            ~ Hand the words of some rows that changed to `on_change`. ~
+
+            Arguments:
+                rows (ndarray) : Row numbers.
+                old (ndarray)  : The rows' old states.
+                new (ndarray)  : The rows' new states.
+        """
+
+        from core.bitpack import changes, pack
+
+        self.on_change(*changes(rows, pack(old, self.width),
+                                pack(new, self.width)))
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        self._step_bands(None if self.on_change is None else self._report)
+
+    def _step_bands(self, report=None):
+        """
+            ~ Advance the world by one generation, a band at a time. ~
+
+            Arguments:
+                report (func) : Called with each band's row numbers and
+                                its old and new states. (Default: None)
+        """
+
+        import numpy as np
+
+        grid, height, padded = self.grid, self.height, self._padded
+
+        if self.band >= height:
+            # ~ One band: the padding is filled before anything is
+            #   overwritten. ~ #
+            first, above = grid[0], grid[-1]
+        else:
+            # ~ Bands are stepped in place, so the rows a band overwrites
+            #   that later bands still read are kept: the last row of the
+            #   band before and the first row of all. ~ #
+            first, above = grid[0].copy(), grid[-1].copy()
+
+        for start in range(0, height, self.band):
+            end = min(start+self.band, height)
+            band = padded[:end-start+2]
+
+            # ~ Wrap the edges of the torus into the padding. ~ #
+            band[0, 1:-1] = above
+            band[1:-1, 1:-1] = grid[start:end]
+            band[-1, 1:-1] = first if end == height else grid[end]
+            band[:, 0] = band[:, -2]
+            band[:, -1] = band[:, 1]
+
+            above = band[-2, 1:-1].copy()
+            self._step_band(band, grid[start:end])
+
+            # ~ The band's old states are still in the padding. ~ #
+            if report is not None:
+                report(np.arange(start, end), band[1:-1, 1:-1],
+                       grid[start:end])
+
+
+def create(name, width, height, workers=1, rule=None):
+    """
+        ~ Create a step engine by name. ~
+
+        Arguments:
+            name (str)    : Name of the engine.
+                            ('numpy', 'bitpack', 'hashlife', 'sparse'
+                             or 'python')
+            width (int)   : Width of the world.
+            height (int)  : Height of the world.
+            workers (int) : Processes stepping the world. More than one runs
+                            the 'numpy' engine in parallel bands. (Default: 1)
+            rule (str)    : Rule in B/S notation. (Default: B3/S23)
+
+        Returns:
+            (Engine) : The requested step engine.
+    """
+
+    if workers > 1:
+        if name != "numpy":
+            raise ValueError(f"The {name} engine runs on a single worker!")
+
+        from core.parallel import ParallelEngine
+
+        return ParallelEngine(width, height, workers, rule)
+
+    if name == "numpy":
+        return NumpyEngine(width, height, rule)
+    elif name == "bitpack":
+        from core.bitpack import BitPackEngine
+
+        return BitPackEngine(width, height, rule)
+    elif name == "hashlife":
+        from core.hashlife import HashLifeEngine
+
+        return HashLifeEngine(width, height, rule)
+    elif name == "sparse":
+        from core.sparse import SparseEngine
+
+        return SparseEngine(width, height, rule)
+    elif name == "python":
+        return PythonEngine(width, height, rule)
+
+    raise ValueError(f"Unknown engine: {name}!")
@@ -0,0 +1,419 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: entropy.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import os
+import random
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+
+class EntropySource:
+    """
+        ~ Base class for the sources of every random decision in a world. ~
+
+        Methods:
+            bits    : Draw random bits.
+            choice  : Draw weighted choices from a list.
+            randint : Draw integers in a range.
+            state   : Capture the source's state for a checkpoint.
+            restore : Resume from a captured state.
+    """
+
+    name = "base"
+
+    # ~ Whether large worlds are worth initializing on a process pool. ~ #
+    pooled = False
+
+    # ~ Whether the same source gives the same draws every run. ~ #
+    reproducible = False
+
+    def bits(self, count):
+        """
+            ~ Draw random bits. ~
+
+            Arguments:
+                count (int) : How many bits to draw.
+
+            Returns:
+                (ndarray) : The bits as a uint8 array of 0s and 1s.
+        """
+
+        raise NotImplementedError
+
+    def choice(self, options, weights=None, count=1):
+        """
+            ~ Draw weighted choices from a list. ~
+
+            Arguments:
+                options (list) : The options to choose from.
+                weights (list) : Bias weights of the options. (Default: None)
+                count (int)    : How many choices to draw. (Default: 1)
+
+            Returns:
+                (list) : The chosen options.
+        """
+
+        raise NotImplementedError
+
+    def randint(self, end, start=0, count=1):
+        """
+            ~ Draw integers in a range. ~
+
+            Arguments:
+                end (int)   : The inclusive end of the range.
+                start (int) : The start of the range. (Default: 0)
+                count (int) : How many integers to draw. (Default: 1)
+
+            Returns:
+                (list[int]) : The integers.
+        """
+
+        raise NotImplementedError
+
+    def state(self):
+        """
+            ~ Capture the source's state for a checkpoint. ~
+
+            Returns:
+                (dict | None) : JSON-able state, or None if the source has
+                                none to resume.
+        """
+
+        return None
+
+    def restore(self, state):
+        """
+            ~ Resume from a captured state. ~
+
+            Arguments:
+                state (dict | None) : Output of `state`.
+        """
+
+
+class QuantumSource(EntropySource):
+    """
+        ~ Entropy measured from simulated qubits through QuantumMechanics. ~
+
+        Methods:
+            __init__ : Initialize the source.
+            bits     : Draw random bits.
+            choice   : Draw weighted choices from a list.
+            randint  : Draw integers in a range.
+    """
+
+    name = "quantum"
+    pooled = True
+
+    def __init__(self, qm=None):
+        """
+            ~ Initialize the source. ~
+
+            Arguments:
+                qm (obj) : Quantum mechanics handler.
+                           (Default: a new, warmed up handler)
+
+            Attributes:
+                qm (obj) : Quantum mechanics handler.
+        """
+
+        if qm is None:
+            from core.quantum import QuantumMechanics
+
+            qm = QuantumMechanics(warm_up=True)
+
+        self.qm = qm
+
+    def bits(self, count):
+        """
+            ~ Draw random bits. ~
+
+            Arguments:
+                count (int) : How many bits to draw.
+
+            Returns:
+                (ndarray) : The bits as a uint8 array of 0s and 1s.
+        """
+
+        return np.atleast_1d(self.qm.q_flip(count)).astype(np.uint8)
+
+    def choice(self, options, weights=None, count=1):
+        """
+            ~ Draw weighted choices from a list. ~
+
+            Arguments:
+                options (list) : The options to choose from.
+                weights (list) : Bias weights of the options. (Default: None)
+                count (int)    : How many choices to draw. (Default: 1)
+
+            Returns:
+                (list) : The chosen options.
+        """
+
+        return self.qm.q_choice(options, weights, count=count)
+
+    def randint(self, end, start=0, count=1):
+        """
+            ~ Draw integers in a range. ~
+
+            Arguments:
+                end (int)   : The inclusive end of the range.
+                start (int) : The start of the range. (Default: 0)
+                count (int) : How many integers to draw. (Default: 1)
+
+            Returns:
+                (list[int]) : The integers.
+        """
+
+        return self.qm.q_randint(end, start, count=count)
+
+
+class NumpySource(EntropySource):
+    """
+        ~ Fast, seedable entropy from a NumPy Generator. ~
+
+        ~ Bits come from whole random bytes unpacked eight at a time, so
+          a grid of any size is filled in one call. ~
+
+        Methods:
+            __init__ : Initialize the source.
+            bits     : Draw random bits.
+            choice   : Draw weighted choices from a list.
+            randint  : Draw integers in a range.
+            state    : Capture the generator's state.
+            restore  : Resume the generator from a captured state.
+    """
+
+    name = "numpy"
+
+    def __init__(self, seed=None):
+        """
+            ~ Initialize the source. ~
+
+            Arguments:
+                seed (int | None) : Seed of the generator; None draws one
+                                    from the OS. (Default: None)
+
+            Attributes:
+                seed (int | None)  : Seed of the generator.
+                rng (Generator)    : The NumPy generator.
+                reproducible (bool): Whether a seed was given.
+        """
+
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.reproducible = seed is not None
+
+    def bits(self, count):
+        """
+            ~ Draw random bits. ~
+
+            Arguments:
+                count (int) : How many bits to draw.
+
+            Returns:
+                (ndarray) : The bits as a uint8 array of 0s and 1s.
+        """
+
+        data = np.frombuffer(self.rng.bytes(-(-count//8)), dtype=np.uint8)
+
+        return np.unpackbits(data, count=count)
+
+    def choice(self, options, weights=None, count=1):
+        """
+            ~ Draw weighted choices from a list. ~
+
+            Arguments:
+                options (list) : The options to choose from.
+                weights (list) : Bias weights of the options. (Default: None)
+                count (int)    : How many choices to draw. (Default: 1)
+
+            Returns:
+                (list) : The chosen options.
+        """
+
+        if len(options) == 0:
+            raise ValueError("Choices cannot be empty!")
+
+        p = None
+
+        if weights is not None:
+            p = np.asarray(weights, dtype=float)
+            p /= p.sum()
+
+        picks = self.rng.choice(len(options), size=count, p=p)
+
+        return [options[i] for i in picks.tolist()]
+
+    def randint(self, end, start=0, count=1):
+        """
+            ~ Draw integers in a range. ~
+
+            Arguments:
+                end (int)   : The inclusive end of the range.
+                start (int) : The start of the range. (Default: 0)
+                count (int) : How many integers to draw. (Default: 1)
+
+            Returns:
+                (list[int]) : The integers.
+        """
+
+        if start > end:
+            start, end = end, start
+
+        return self.rng.integers(start, end+1, size=count).tolist()
+
+    def state(self):
+        """
+            ~ Capture the generator's state for a checkpoint. ~
+
+            Returns:
+                (dict) : The seed and the bit generator's state.
+        """
+
+        return {"seed": self.seed,
+                "bit_generator": self.rng.bit_generator.state}
+
+    def restore(self, state):
+        """
+            ~ Resume the generator from a captured state. ~
+
+            Arguments:
+                state (dict | None) : Output of `state`.
+        """
+
+        if not state:
+            return
+
+        self.seed = state["seed"]
+        self.reproducible = self.seed is not None
+        self.rng.bit_generator.state = state["bit_generator"]
+
+
+class OSSource(EntropySource):
+    """
+        ~ Entropy from the operating system's random device. ~
+
+        Methods:
+            __init__ : Initialize the source.
+            bits     : Draw random bits.
+            choice   : Draw weighted choices from a list.
+            randint  : Draw integers in a range.
+    """
+
+    name = "os"
+
+    def __init__(self):
+        """
+            ~ Initialize the source. ~
+
+            Attributes:
+                random (SystemRandom) : Draws choices and integers.
+        """
+
+        self.random = random.SystemRandom()
+
+    def bits(self, count):
+        """
+            ~ Draw random bits. ~
+
+            Arguments:
+                count (int) : How many bits to draw.
+
+            Returns:
+                (ndarray) : The bits as a uint8 array of 0s and 1s.
+        """
+
+        data = np.frombuffer(os.urandom(-(-count//8)), dtype=np.uint8)
+
+        return np.unpackbits(data, count=count)
+
+    def choice(self, options, weights=None, count=1):
+        """
+            ~ Draw weighted choices from a list. ~
+
+            Arguments:
+                options (list) : The options to choose from.
+                weights (list) : Bias weights of the options. (Default: None)
+                count (int)    : How many choices to draw. (Default: 1)
+
+            Returns:
+                (list) : The chosen options.
+        """
+
+        if len(options) == 0:
+            raise ValueError("Choices cannot be empty!")
+
+        return self.random.choices(options, weights, k=count)
+
+    def randint(self, end, start=0, count=1):
+        """
+            ~ Draw integers in a range. ~
+
+            Arguments:
+                end (int)   : The inclusive end of the range.
+                start (int) : The start of the range. (Default: 0)
+                count (int) : How many integers to draw. (Default: 1)
+
+            Returns:
+                (list[int]) : The integers.
+        """
+
+        if start > end:
+            start, end = end, start
+
+        return [self.random.randint(start, end) for _ in range(count)]
+
+
+def create(name, seed=None):
+    """
+        ~ Create an entropy source by name. ~
+
+        Arguments:
+            name (str)        : Name of the source.
+                                ('quantum', 'numpy' or 'os')
+            seed (int | None) : Seed of the 'numpy' source. (Default: None)
+
+        Returns:
+            (EntropySource) : The requested entropy source.
+    """
+
+    if seed is not None and name != "numpy":
+        raise ValueError(f"The {name} entropy source cannot be seeded!")
+
+    if name == "quantum":
+        return QuantumSource()
+    elif name == "numpy":
+        return NumpySource(seed)
+    elif name == "os":
+        return OSSource()
+
+    raise ValueError(f"Unknown entropy source: {name}!")
@@ -6,7 +6,7 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
                         more natural randomness.
                             File: gui.py
                             Date: 2025/10/09
-                        Version: 2.5-2025.10.14
+                        Version: 2.6-2026.10.18
 
 ===============================================================================
 
@@ -29,6 +29,7 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
 
 
 # ~ Third-party libraries. ~ #
+import numpy as np
 import pygame as pg
 
 
@@ -42,6 +43,9 @@ COLOR = {
     "pink": (255, 105, 180)
 }
 
+# ~ Palette index of each cell state. (0 = Dead, 1 = Alive) ~ #
+PALETTE = [COLOR['red'], COLOR['pink']]
+
 class Window:
     """
         ~ The window to display the program. ~
@@ -49,25 +53,32 @@ class Window:
         Methods:
             __init__      : Initialize the window.
             handle_events : Handle all of the events that go on.
+            _dirty_rect   : Find the area of the screen that changed.
             render        : Render the cells onto the window.
     """
     
-    def __init__(self, size, main, color=(0, 0, 0)):
+    def __init__(self, size, main, color=(0, 0, 0), dirty_rects=False):
         """
             ~ Initialize the Window and its variables. ~
 
             Arguments:
-                size (tuple)  : The size of the terminal.
-                main (obj)    : The instance of Main()
-                color (tuple) : The background color. (Default: (0, 0, 0))
+                size (tuple)       : The size of the terminal.
+                main (obj)         : The instance of Main()
+                color (tuple)      : The background color. (Default: (0, 0, 0))
+                dirty_rects (bool) : Only push the changed part of the frame
+                                     to the display. (Default: False)
 
             Attributes:
-                width (int)       : The width of the screen.
-                height (int)      : The height of the screen.
-                main (obj)        : The instance of Main().
-                cell_size (tuple) : Width and Height of the cells.
-                color (tuple)     : Background color of the Window.
-                screen (obj)      : Screen to render the cells to.
+                width (int)          : The width of the screen.
+                height (int)         : The height of the screen.
+                main (obj)           : The instance of Main().
+                cell_size (tuple)    : Width and Height of the cells.
+                color (tuple)        : Background color of the Window.
+                screen (obj)         : Screen to render the cells to.
+                cell_surface (obj)   : One palette pixel per cell.
+                grid_surface (obj)   : The cells scaled up to the screen.
+                dirty_rects (bool)   : Whether only changes are pushed.
+                previous (array)     : The last frame drawn, if any.
         """
         
         pg.init()
@@ -81,7 +92,16 @@ class Window:
         self.color = color
         pos = (self.width, self.height)
         self.screen = pg.display.set_mode(pos, pg.FULLSCREEN)
-        self.grid_surface = pg.Surface((self.width, self.height))
+        self.screen.fill(self.color)
+
+        self.cell_surface = pg.Surface(size, depth=8)
+        self.cell_surface.set_palette(PALETTE)
+
+        scaled = (size[0]*self.cell_size[0], size[1]*self.cell_size[1])
+        self.grid_surface = pg.Surface(scaled, depth=8)
+        self.grid_surface.set_palette(PALETTE)
+        self.dirty_rects = dirty_rects
+        self.previous = None
 
     def handle_events(self):
         """ ~ Handle each (relevant) event that happens in the window. ~ """
@@ -91,29 +111,66 @@ class Window:
             if event.type == pg.QUIT or ESCAPED:
                 self.main.kill()
 
-    def render(self, world):
+    def _dirty_rect(self, cells):
         """
-            ~ Render the cells to the window. ~
+            ~ Screen rectangle around the cells that changed. ~
 
             Arguments:
-                world (obj) : The world object.
+                cells (ndarray) : Cell states of shape (height, width).
+
+            Returns:
+                (Rect | None) : The changed area, or None if nothing changed.
+        """
+
+        changed = cells != self.previous
+        rows = np.flatnonzero(changed.any(axis=1))
+
+        if rows.size == 0:
+            return None
+
+        cols = np.flatnonzero(changed.any(axis=0))
+        cell_w, cell_h = self.cell_size
+
+        pos = (int(cols[0])*cell_w, int(rows[0])*cell_h)
+        size = ((int(cols[-1])-int(cols[0])+1)*cell_w,
+                (int(rows[-1])-int(rows[0])+1)*cell_h)
+
+        return pg.Rect(pos, size)
+
+    def render(self, world, cells=None):
         """
+            ~ Render the cells to the window. ~
 
-        self.grid_surface.fill(self.color)  # ~ Clear previous frame. ~ #
+            ~ The cell states are written straight into an 8-bit palette
+              surface, scaled to the screen in one call and blitted once. ~
 
-        for y in range(world.height):
-            for x in range(world.width):
-                cell = world.cells[y][x]
+            Arguments:
+                world (obj)     : The world object.
+                cells (ndarray) : Cell states to draw instead of the world's
+                                  current ones. (Default: None)
+        """
+
+        if cells is None:
+            cells = world.grid
 
-                color = COLOR['pink'] if cell.state else COLOR['red']
+        # ~ surfarray views are (x, y); the world array is (y, x). ~ #
+        pixels = pg.surfarray.pixels2d(self.cell_surface)
+        pixels[...] = cells.T
+        del pixels  # ~ Unlock the surface before scaling it. ~ #
 
-                pos = (x * self.cell_size[0], y * self.cell_size[1])
-                size = (self.cell_size[0], self.cell_size[1])
-                rect = pg.Rect(pos, size)
-                pg.draw.rect(self.grid_surface, color, rect)
+        pg.transform.scale(self.cell_surface, self.grid_surface.get_size(),
+                           self.grid_surface)
 
         # ~ Copy the surface to the screen. ~ #
         self.screen.blit(self.grid_surface, (0, 0))
-        pg.display.flip()
 
-            
+        if not self.dirty_rects or self.previous is None:
+            pg.display.flip()
+        else:
+            rect = self._dirty_rect(cells)
+
+            if rect is not None:
+                pg.display.update(rect)
+
+        if self.dirty_rects:
+            self.previous = cells.copy()
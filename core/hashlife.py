@@ -0,0 +1,626 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: hashlife.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ~ How the torus is handled. ~
+
+    A W x H torus evolves exactly like the infinite plane tiled with copies of
+    it, so HashLife runs on that tiling. The world is one root node, the
+    smallest square of at least 2W x 2H cells, holding the tiling from the
+    origin.
+
+    A block of the tiling only depends on where it starts modulo (W, H), so
+    a node of any level at any position is built from the root: aligned
+    blocks are read straight out of it and the rest are joined from four
+    blocks a level down, memoized by level and position. That is at most
+    W*H nodes a level, and far fewer once blocks are larger than the torus.
+
+    A jump of 2^j generations builds the block of level max(L+1, j+2)
+    centred on the origin, L being the root's level. Its RESULT is the
+    tiling from the origin advanced 2^j generations, and its top left
+    quadrants are the new root. So any 2^j is one RESULT whatever the size
+    of the torus, and repeated states are served straight from the RESULT
+    cache.
+"""
+
+
+# ~ Standard libraries. ~ #
+from collections import OrderedDict
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import rules
+from core.engine import Engine
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Center tables by rule, shared by every engine running it. ~ #
+CENTERS = {}
+
+
+def centers(rule):
+    """
+        ~ Compile a rule into the next center 2x2 of every 4x4 block. ~
+
+        ~ Built once per rule from its 512-entry neighborhood table: each
+          of the four center cells of all 65536 blocks is looked up at
+          once. ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (bytes) : For each 4x4 block, read row by row with the top left
+                      cell as bit 0, the index of its next center in
+                      `level_one` (nw, ne, sw, se as bits 0 to 3).
+    """
+
+    table = CENTERS.get(rule)
+
+    if table is not None:
+        return table
+
+    lookup = np.frombuffer(rules.lookup(rule), dtype=np.uint8)
+    blocks = np.arange(1 << 16, dtype=np.uint32)
+    table = np.zeros(1 << 16, dtype=np.uint8)
+
+    for bit, (x, y) in enumerate(((1, 1), (2, 1), (1, 2), (2, 2))):
+        neighborhood = np.zeros_like(blocks)
+
+        for row in range(3):
+            for column in range(3):
+                cell = (blocks >> ((y+row-1)*4 + x+column-1)) & 1
+                neighborhood |= cell << (row*3+column)
+
+        table |= lookup[neighborhood] << bit
+
+    return CENTERS.setdefault(rule, table.tobytes())
+
+
+class Node:
+    """
+        ~ A canonical quadtree node. ~
+
+        ~ Nodes are hash-consed, so two equal subtrees are always the same
+          object and can be compared and hashed by identity. ~
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        """
+            ~ Initialize the node. ~
+
+            Arguments:
+                nw, ne, sw, se (Node) : The four quadrants. (None for leaves)
+                level (int)           : The node covers 2^level cells a side.
+                population (int)      : Number of live cells in the node.
+        """
+
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class HashLifeEngine(Engine):
+    """
+        ~ HashLife engine on a hash-consed quadtree with a memoized,
+          size-bounded RESULT cache. ~
+
+        Methods:
+            __init__ : Initialize the engine.
+            load     : Load the cell states from a 2D matrix.
+            seed     : Bring a set of cells to life.
+            get      : Get the state of a single cell.
+            rows     : Return the cell states as a 2D matrix.
+            array    : Return the cell states as a uint8 array.
+            step     : Advance the world by one generation.
+            advance  : Advance the world by many generations.
+    """
+
+    name = "hashlife"
+
+    def __init__(self, width, height, rule=None, max_nodes=1 << 22,
+                 max_results=1 << 20):
+        """
+            ~ Initialize the engine. ~
+
+            Arguments:
+                width (int)       : Width of the world.
+                height (int)      : Height of the world.
+                rule (str | Rule) : Rule in B/S notation; births from no
+                                    neighbors (B0) are not supported.
+                                    (Default: B3/S23)
+                max_nodes (int)   : Canonical nodes kept before the tables are
+                                    rebuilt from the live world.
+                                    (Default: 4194304)
+                max_results (int) : RESULT entries kept, least recently used
+                                    first out. (Default: 1048576)
+
+            Attributes:
+                level (int)    : Level of the root, which holds the tiling
+                                 from the origin.
+                center (bytes) : Next center 2x2 of every 4x4 node.
+        """
+
+        super().__init__(width, height, rule)
+
+        # ~ Empty space must stay empty for empty nodes to be skipped. ~ #
+        if 0 in self.rule.birth:
+            raise ValueError("The hashlife engine cannot run rules with B0!")
+
+        self.center = centers(self.rule)
+
+        self.max_nodes = max_nodes
+        self.max_results = max_results
+
+        # ~ At least twice the torus, so every block of the tiling smaller
+        #   than the root that starts on the torus fits inside it. ~ #
+        self.level = (max(width, height)-1).bit_length()+1
+
+        self._reset_tables()
+
+    def _reset_tables(self):
+        """ ~ Start fresh canonical node and RESULT tables. ~ """
+
+        self.nodes = {}
+        self.results = OrderedDict()
+        self.empties = []
+
+        self.off = Node(None, None, None, None, 0, 0)
+        self.on = Node(None, None, None, None, 0, 1)
+
+        # ~ All sixteen 2x2 nodes, indexed by their bits (nw, ne, sw, se). ~ #
+        leaves = (self.off, self.on)
+        self.level_one = [self._join(leaves[index & 1], leaves[index >> 1 & 1],
+                                     leaves[index >> 2 & 1], leaves[index >> 3])
+                          for index in range(16)]
+
+    def _join(self, nw, ne, sw, se):
+        """
+            ~ Return the canonical node with the given quadrants. ~
+
+            Arguments:
+                nw, ne, sw, se (Node) : The four quadrants.
+
+            Returns:
+                (Node) : The canonical node.
+        """
+
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+
+        if node is None:
+            population = (nw.population + ne.population
+                          + sw.population + se.population)
+            node = Node(nw, ne, sw, se, nw.level+1, population)
+            self.nodes[key] = node
+
+        return node
+
+    def _empty(self, level):
+        """
+            ~ Return the canonical empty node of a level. ~
+
+            Arguments:
+                level (int) : Level of the node.
+
+            Returns:
+                (Node) : The empty node.
+        """
+
+        if not self.empties:
+            self.empties.append(self.off)
+
+        while len(self.empties) <= level:
+            empty = self.empties[-1]
+            self.empties.append(self._join(empty, empty, empty, empty))
+
+        return self.empties[level]
+
+    def _life_4x4(self, node):
+        """
+            ~ Advance the center 2x2 of a 4x4 node by one generation. ~
+
+            Arguments:
+                node (Node) : A level 2 node.
+
+            Returns:
+                (Node) : The level 1 center after one generation.
+        """
+
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        # ~ The 4x4 cells read row by row, the top left cell as bit 0. ~ #
+        index = 0
+        for bit, cell in enumerate((nw.nw, nw.ne, ne.nw, ne.ne,
+                                    nw.sw, nw.se, ne.sw, ne.se,
+                                    sw.nw, sw.ne, se.nw, se.ne,
+                                    sw.sw, sw.se, se.sw, se.se)):
+            index |= cell.population << bit
+
+        return self.level_one[self.center[index]]
+
+    def _successor(self, node, j):
+        """
+            ~ Return the center of a node advanced 2^j generations. ~
+
+            Arguments:
+                node (Node) : A node of level 2 or more.
+                j (int)     : Log2 of the generations to advance.
+                              (At most node.level-2)
+
+            Returns:
+                (Node) : The centered node one level down.
+        """
+
+        if node.population == 0:
+            return node.nw
+
+        key = (node, j)
+        result = self.results.get(key)
+
+        if result is not None:
+            self.results.move_to_end(key)
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            join, successor = self._join, self._successor
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            sub = min(j, node.level-3)
+
+            # ~ Nine overlapping sub-squares, each advanced 2^sub. ~ #
+            c1 = successor(nw, sub)
+            c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), sub)
+            c3 = successor(ne, sub)
+            c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), sub)
+            c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), sub)
+            c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), sub)
+            c7 = successor(sw, sub)
+            c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), sub)
+            c9 = successor(se, sub)
+
+            if j < node.level-2:
+                # ~ Already far enough, only recentre. ~ #
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw),
+                              join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw),
+                              join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = join(successor(join(c1, c2, c4, c5), sub),
+                              successor(join(c2, c3, c5, c6), sub),
+                              successor(join(c4, c5, c7, c8), sub),
+                              successor(join(c5, c6, c8, c9), sub))
+
+        self.results[key] = result
+
+        if len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+        return result
+
+    def _build(self, cells, level):
+        """
+            ~ Build the canonical quadtree of a square cell array. ~
+
+            Arguments:
+                cells (ndarray) : Square array of 2^level cells a side.
+                level (int)     : Level of the node to build.
+
+            Returns:
+                (Node) : The canonical node.
+        """
+
+        if not cells.any():
+            return self._empty(level)
+
+        if level == 0:
+            return self.on
+        elif level == 1:
+            index = (int(cells[0, 0]) | int(cells[0, 1]) << 1
+                     | int(cells[1, 0]) << 2 | int(cells[1, 1]) << 3)
+            return self.level_one[index]
+
+        half = 1 << (level-1)
+        return self._join(self._build(cells[:half, :half], level-1),
+                          self._build(cells[:half, half:], level-1),
+                          self._build(cells[half:, :half], level-1),
+                          self._build(cells[half:, half:], level-1))
+
+    def _expand(self, node, width, height):
+        """
+            ~ Expand the top left corner of a node into a cell array. ~
+
+            Arguments:
+                node (Node)  : The node to expand.
+                width (int)  : Width of the corner.
+                height (int) : Height of the corner.
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        cells = np.zeros((height, width), dtype=np.uint8)
+
+        def fill(node, x, y):
+            """ ~ Write the live cells of a node at (x, y). ~ """
+
+            if node.population == 0 or x >= width or y >= height:
+                return
+            if node.level == 0:
+                cells[y, x] = 1
+                return
+
+            half = 1 << (node.level-1)
+            fill(node.nw, x, y)
+            fill(node.ne, x+half, y)
+            fill(node.sw, x, y+half)
+            fill(node.se, x+half, y+half)
+
+        fill(node, 0, 0)
+
+        return cells
+
+    def _set(self, node, x, y):
+        """
+            ~ Return a copy of a node with one more live cell. ~
+
+            Arguments:
+                node (Node) : The node to change.
+                x (int)     : X coordinate inside the node.
+                y (int)     : Y coordinate inside the node.
+
+            Returns:
+                (Node) : The changed canonical node.
+        """
+
+        if node.level == 0:
+            return self.on
+
+        half = 1 << (node.level-1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        if y < half:
+            if x < half:
+                nw = self._set(nw, x, y)
+            else:
+                ne = self._set(ne, x-half, y)
+        else:
+            if x < half:
+                sw = self._set(sw, x, y-half)
+            else:
+                se = self._set(se, x-half, y-half)
+
+        return self._join(nw, ne, sw, se)
+
+    def _collect(self):
+        """ ~ Drop every cached node that the live world no longer uses. ~ """
+
+        old_root = self.root
+        self._reset_tables()
+
+        copies = {}
+
+        def copy(node):
+            """ ~ Re-intern a node into the fresh tables. ~ """
+
+            if node.level == 0:
+                return self.on if node.population else self.off
+
+            new = copies.get(node)
+
+            if new is None:
+                new = self._join(copy(node.nw), copy(node.ne),
+                                 copy(node.sw), copy(node.se))
+                copies[node] = new
+
+            return new
+
+        self.root = copy(old_root)
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        shape = (self.height, self.width)
+        cells = np.asarray(states, dtype=bool).reshape(shape).astype(np.uint8)
+
+        size = 1 << self.level
+        tiles = (-(-size//self.height), -(-size//self.width))
+        self.root = self._build(np.tile(cells, tiles)[:size, :size],
+                                self.level)
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        # ~ Every copy of the torus inside the root gets the cell. ~ #
+        size = 1 << self.level
+
+        for x, y in points:
+            for tile_y in range(y, size, self.height):
+                for tile_x in range(x, size, self.width):
+                    self.root = self._set(self.root, tile_x, tile_y)
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        return self._descend(x, y, 0).population
+
+    def _descend(self, x, y, level):
+        """
+            ~ Return the aligned node of a level at (x, y) in the root. ~
+
+            Arguments:
+                x (int)     : X coordinate, a multiple of the node's size.
+                y (int)     : Y coordinate, a multiple of the node's size.
+                level (int) : Level of the node.
+
+            Returns:
+                (Node) : The node.
+        """
+
+        node = self.root
+
+        while node.level > level:
+            half = 1 << (node.level-1)
+
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+
+            x, y = x%half, y%half
+
+        return node
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        return self.array().tolist()
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        return self._expand(self.root, self.width, self.height)
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        self.advance(1)
+
+    def _tile(self, level, x, y, tiles):
+        """
+            ~ Return the node of the tiling of a level at (x, y). ~
+
+            ~ Blocks aligned to their size are read out of the root; the
+              rest are joined from four blocks a level down. ~
+
+            Arguments:
+                level (int)  : Level of the node.
+                x (int)      : X coordinate of its top left cell.
+                y (int)      : Y coordinate of its top left cell.
+                tiles (dict) : Nodes built so far, by level and position on
+                               the torus.
+
+            Returns:
+                (Node) : The canonical node.
+        """
+
+        x, y = x%self.width, y%self.height
+        key = (level, x, y)
+        node = tiles.get(key)
+
+        if node is not None:
+            return node
+
+        size = 1 << level
+
+        if level <= self.level and not (x%size or y%size):
+            node = self._descend(x, y, level)
+        else:
+            half = size >> 1
+            tile = self._tile
+            node = self._join(tile(level-1, x, y, tiles),
+                              tile(level-1, x+half, y, tiles),
+                              tile(level-1, x, y+half, tiles),
+                              tile(level-1, x+half, y+half, tiles))
+
+        tiles[key] = node
+
+        return node
+
+    def _jump(self, j):
+        """
+            ~ Advance the torus by 2^j generations in one RESULT. ~
+
+            Arguments:
+                j (int) : Log2 of the generations to advance.
+        """
+
+        # ~ The block centred on the origin, big enough that its RESULT
+        #   covers the root and jumps 2^j. ~ #
+        level = max(self.level+1, j+2)
+        corner = -(1 << (level-2))
+        result = self._successor(self._tile(level, corner, corner, {}), j)
+
+        # ~ The RESULT starts at the origin; keep its top left corner. ~ #
+        while result.level > self.level:
+            result = result.nw
+
+        self.root = result
+
+    def advance(self, generations):
+        """
+            ~ Advance the world by many generations, jumping by the largest
+              power of two that fits each time. ~
+
+            Arguments:
+                generations (int) : Number of generations to advance.
+        """
+
+        while generations > 0:
+            j = generations.bit_length()-1
+            self._jump(j)
+            generations -= 1 << j
+
+            if len(self.nodes) > self.max_nodes:
+                self._collect()
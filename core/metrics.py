@@ -0,0 +1,277 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: metrics.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import json
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+PREFIX = "life"
+
+
+class Metrics:
+    """
+        ~ Ring buffer of profiling samples with running totals. ~
+
+        ~ Hooks hold a reference to a Metrics or None; with None they skip
+          every measurement, so a disabled world pays one attribute check
+          per hook and nothing else. ~
+
+        Methods:
+            __init__   : Initialize the buffer.
+            record     : Add a sample.
+            since      : Samples recorded after a sequence number.
+            snapshot   : Running totals and the latest gauges.
+            prometheus : The totals in Prometheus text format.
+    """
+
+    def __init__(self, capacity=4096):
+        """
+            ~ Initialize the buffer. ~
+
+            Arguments:
+                capacity (int) : Most samples kept. (Default: 4096)
+
+            Attributes:
+                samples (deque) : The latest samples, oldest first.
+                recorded (int)  : Samples recorded since the start.
+                counts (dict)   : Samples recorded per event.
+                seconds (dict)  : Seconds spent per event.
+                gauges (dict)   : Latest value of every numeric field.
+        """
+
+        self.samples = deque(maxlen=capacity)
+        self.recorded = 0
+        self.counts = {}
+        self.seconds = {}
+        self.gauges = {}
+        self._lock = Lock()
+
+    def record(self, event, seconds, **fields):
+        """
+            ~ Add a sample. ~
+
+            Arguments:
+                event (str)     : What was measured. ('update', 'seed',
+                                  'render' or 'circuit')
+                seconds (float) : How long it took.
+                **fields        : Other numbers describing the sample.
+        """
+
+        sample = {"time": time.time(), "event": event, "seconds": seconds}
+        sample.update(fields)
+
+        with self._lock:
+            self.samples.append(sample)
+            self.recorded += 1
+            self.counts[event] = self.counts.get(event, 0)+1
+            self.seconds[event] = self.seconds.get(event, 0.0)+seconds
+
+            for name, value in fields.items():
+                if isinstance(value, (int, float)):
+                    self.gauges[f"{event}_{name}"] = value
+
+    def since(self, recorded):
+        """
+            ~ Samples recorded after a sequence number. ~
+
+            ~ Samples that already fell out of the ring are skipped. ~
+
+            Arguments:
+                recorded (int) : `recorded` at the last call.
+
+            Returns:
+                (tuple) : The new samples and the current `recorded`.
+        """
+
+        with self._lock:
+            new = min(self.recorded-recorded, len(self.samples))
+            samples = list(self.samples)[len(self.samples)-new:]
+
+            return samples, self.recorded
+
+    def snapshot(self):
+        """
+            ~ Running totals and the latest gauges. ~
+
+            Returns:
+                (dict) : Counts and seconds per event and the gauges.
+        """
+
+        with self._lock:
+            return {
+                "counts": dict(self.counts),
+                "seconds": dict(self.seconds),
+                "gauges": dict(self.gauges),
+            }
+
+    def prometheus(self):
+        """
+            ~ The totals in Prometheus text format. ~
+
+            Returns:
+                (str) : One metric per line.
+        """
+
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {PREFIX}_events_total counter"]
+
+        for event, count in sorted(snapshot["counts"].items()):
+            lines.append(f'{PREFIX}_events_total{{event="{event}"}} {count}')
+
+        lines.append(f"# TYPE {PREFIX}_seconds_total counter")
+
+        for event, seconds in sorted(snapshot["seconds"].items()):
+            lines.append(f'{PREFIX}_seconds_total{{event="{event}"}} '
+                         f'{seconds:.9f}')
+
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+class JsonLinesWriter:
+    """
+        ~ Writes new samples as JSON lines every few seconds. ~
+
+        Methods:
+            __init__ : Initialize and start the writer.
+            flush    : Write the samples recorded since the last flush.
+            close    : Stop the writer and write what is left.
+            _run     : The writing loop.
+    """
+
+    def __init__(self, metrics, stream, interval=1.0):
+        """
+            ~ Initialize and start the writer. ~
+
+            Arguments:
+                metrics (Metrics) : Where the samples come from.
+                stream (obj)      : File to write to.
+                interval (float)  : Seconds between writes. (Default: 1.0)
+
+            Attributes:
+                metrics (Metrics) : Where the samples come from.
+                stream (obj)      : File to write to.
+                interval (float)  : Seconds between writes.
+        """
+
+        self.metrics = metrics
+        self.stream = stream
+        self.interval = interval
+
+        self._recorded = 0
+        self._stop = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def flush(self):
+        """ ~ Write the samples recorded since the last flush. ~ """
+
+        samples, self._recorded = self.metrics.since(self._recorded)
+
+        if samples:
+            self.stream.write("".join(json.dumps(sample) + "\n"
+                                      for sample in samples))
+            self.stream.flush()
+
+    def close(self):
+        """ ~ Stop the writer and write what is left. ~ """
+
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        """ ~ Flush every interval until closed. ~ """
+
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+
+class PrometheusServer:
+    """
+        ~ Local HTTP endpoint serving the metrics in Prometheus text
+          format. ~
+
+        Methods:
+            __init__ : Initialize and start the server.
+            close    : Stop the server.
+    """
+
+    def __init__(self, metrics, port=9108, host="127.0.0.1"):
+        """
+            ~ Initialize and start the server. ~
+
+            Arguments:
+                metrics (Metrics) : What to serve.
+                port (int)        : Port to listen on; 0 picks a free one.
+                                    (Default: 9108)
+                host (str)        : Address to bind. (Default: '127.0.0.1')
+
+            Attributes:
+                port (int) : The port listened on.
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+
+                body = metrics.prometheus().encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type",
+                                 "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        """ ~ Stop the server. ~ """
+
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,292 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: parallel.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import multiprocessing as mp
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import rules
+from core.engine import Engine, apply_masks
+
+
+# ~ Shared buffers attached once per worker process. ~ #
+_BUFFERS = []
+
+
+def _attach(names, shape):
+    """
+        ~ Attach a worker process to the shared double buffer. ~
+
+        Arguments:
+            names (tuple) : Names of the two shared memory blocks.
+            shape (tuple) : Shape (height, width) of the world.
+    """
+
+    for name in names:
+        block = shared_memory.SharedMemory(name=name)
+        grid = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+
+        _BUFFERS.append((block, grid))
+
+
+def _step_band(current, start, end, masks=None):
+    """
+        ~ Step one band of rows from the current buffer into the other. ~
+
+        ~ The rows just above and below the band are read straight out of
+          shared memory as its halo, so no cells are ever pickled. ~
+
+        Arguments:
+            current (int) : Index of the buffer holding this generation.
+            start (int)   : First row of the band.
+            end (int)     : Row after the last row of the band.
+            masks (tuple) : The rule compiled by rules.masks, or None for
+                            B3/S23. (Default: None)
+    """
+
+    src = _BUFFERS[current][1]
+    dst = _BUFFERS[1-current][1]
+    height, width = src.shape
+
+    # ~ The band with its wrapped halo rows and columns. ~ #
+    padded = np.empty((end-start+2, width+2), dtype=np.uint8)
+    padded[:, 1:-1] = src[np.arange(start-1, end+1)%height]
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+    count = padded[:-2, :-2] + padded[:-2, 1:-1]
+    count += padded[:-2, 2:]
+    count += padded[1:-1, :-2]
+    count += padded[1:-1, 2:]
+    count += padded[2:, :-2]
+    count += padded[2:, 1:-1]
+    count += padded[2:, 2:]
+
+    if masks is None:
+        # ~ Born with exactly three neighbors, survive with two or three. ~ #
+        alive = (count == 3) | ((count == 2) & (padded[1:-1, 1:-1] == 1))
+    else:
+        # ~ A count of 0 less the offset wraps around to a large byte. ~ #
+        count -= masks[2]
+        alive = np.empty_like(count)
+        apply_masks(masks, count, padded[1:-1, 1:-1], alive,
+                    np.empty_like(count))
+
+    dst[start:end] = alive
+
+
+def _release(executor, blocks):
+    """
+        ~ Shut the worker pool down and free the shared memory. ~
+
+        Arguments:
+            executor (obj) : The worker pool, if it was started.
+            blocks (list)  : The shared memory blocks.
+    """
+
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class ParallelEngine(Engine):
+    """
+        ~ Byte-grid engine that steps bands of rows on several cores. ~
+
+        Both buffers of the double buffer live in shared memory. Every
+        generation each worker process steps its band, reading its one-row
+        halo from shared memory, and the engine waits for all bands before
+        swapping buffers.
+
+        Methods:
+            __init__   : Initialize the engine.
+            load       : Load the cell states from a 2D matrix.
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            get        : Get the state of a single cell.
+            rows       : Return the cell states as a 2D matrix.
+            array      : Return the cell states as a uint8 array.
+            step       : Advance the world by one generation.
+            close      : Stop the workers and free the shared memory.
+    """
+
+    name = "parallel"
+
+    def __init__(self, width, height, workers=None, rule=None):
+        """
+            ~ Initialize the engine. ~
+
+            Arguments:
+                width (int)       : Width of the world.
+                height (int)      : Height of the world.
+                workers (int)     : Worker processes. (Default: CPU count)
+                rule (str | Rule) : Rule in B/S notation. (Default: B3/S23)
+
+            Attributes:
+                workers (int) : Worker processes.
+                bands (list)  : (start, end) rows stepped by each task.
+                current (int) : Index of the buffer holding this generation.
+        """
+
+        super().__init__(width, height, rule)
+
+        self.workers = max(1, min(workers or mp.cpu_count(), height))
+        self.current = 0
+
+        edges = np.linspace(0, height, self.workers+1).astype(int)
+        self.bands = [(int(start), int(end))
+                      for start, end in zip(edges[:-1], edges[1:])]
+
+        size = max(1, width*height)
+        self._blocks = [shared_memory.SharedMemory(create=True, size=size)
+                        for _ in range(2)]
+        self._grids = [np.ndarray((height, width), dtype=np.uint8,
+                                  buffer=block.buf)
+                       for block in self._blocks]
+
+        names = tuple(block.name for block in self._blocks)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_attach,
+            initargs=(names, (height, width)),
+        )
+        self._finalizer = weakref.finalize(self, _release,
+                                           self._executor, self._blocks)
+
+    @property
+    def grid(self):
+        """
+            ~ The buffer holding the current generation. ~
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        return self._grids[self.current]
+
+    def load(self, states):
+        """
+            ~ Load the cell states from a 2D matrix. ~
+
+            Arguments:
+                states (2D Matrix) : Rows of cell states. (1 = Alive, 0 = Dead)
+        """
+
+        self.load_bands([(0, states)])
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time, straight into
+              shared memory. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+        """
+
+        self.grid[:] = 0
+
+        for start, rows in bands:
+            rows = np.asarray(rows, dtype=bool).reshape(-1, self.width)
+            self.grid[start:start+len(rows)] = rows
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        for x, y in points:
+            self.grid[y, x] = 1
+
+    def get(self, x, y):
+        """
+            ~ Get the state of a single cell. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (int) : The state of the cell.
+        """
+
+        return int(self.grid[y, x])
+
+    def rows(self):
+        """
+            ~ Return the cell states as a 2D matrix. ~
+
+            Returns:
+                (2D Matrix) : A list of rows of cell states.
+        """
+
+        return self.grid.tolist()
+
+    def array(self):
+        """
+            ~ Return the cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : The shared buffer of the current generation.
+        """
+
+        return self.grid
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        masks = None if self.conway else rules.masks(self.rule)
+        futures = [self._executor.submit(_step_band, self.current, start, end,
+                                         masks)
+                   for start, end in self.bands]
+
+        # ~ Barrier: every band must finish before the buffers swap. ~ #
+        for future in as_completed(futures):
+            future.result()
+
+        self.current = 1-self.current
+
+    def close(self):
+        """ ~ Stop the workers and free the shared memory. ~ """
+
+        self._finalizer()
@@ -6,7 +6,7 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
                         more natural randomness.
                             File: quantum.py
                             Date: 2025/10/09
-                        Version: 2.5-2025.10.14
+                        Version: 2.6-2026.10.18
 
 ===============================================================================
 
@@ -30,10 +30,18 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
 
 # ~ Standard libraries. ~ #
 import math
+import time
+from threading import Lock
 
-# ~ Third-party libraries. ~ #
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+
+# ~ Initialize GLOBAL Variables. ~ #
+MAX_QBITS = 29
+BIT_VALUES = bytes.maketrans(b"01", b"\x00\x01")
+
+# ~ Transpiled circuits shared by every instance, keyed by width and
+#   simulator configuration. ~ #
+COMPILED = {}
+COMPILED_LOCK = Lock()
 
 
 class QuantumMechanics:
@@ -41,57 +49,251 @@ class QuantumMechanics:
         ~ Handles Quantum Computing functions for behavior
           approximating true randomness. ~
 
+        ~ Measured bits are kept in a bounded pool that is refilled in large
+          batches of shots, so most draws never touch the simulator. ~
+
         Methods:
             __init__       : Initialize the Mechanics System.
+            _config_key    : Private method to describe the simulator setup.
+            _compiled      : Private method to get a transpiled circuit.
             _run_circuit   : Private method to run simulated circuit.
+            _refill        : Private method to top up the entropy pool.
+            _bits          : Private method to draw bits from the pool.
+            _ints          : Private method to draw fixed-width integers.
+            pool_stats     : Report entropy pool statistics.
+            circuit_stats  : Report compiled-circuit cache statistics.
             q_choice       : Select a choice from a list.
             q_flip         : Simulate a coin flip.
             q_randint      : Get a random number in a range.
     """
 
-    def __init__(self):
+    def __init__(self, pool_size=1 << 17, warm_up=False):
         """
             ~ Initialize the Quantum System and needed variables. ~
 
+            Arguments:
+                pool_size (int) : Most bits kept in the entropy pool.
+                                  (Default: 131072)
+                warm_up (bool)  : Transpile the refill circuit right away.
+                                  (Default: False)
+
             Attributes:
                 simulator : The Simulator to run a Q-Circuit.
+                width     : Qubits measured per shot when refilling.
+                pool_size : Most bits kept in the entropy pool.
+                hits      : Draws served without refilling the pool.
+                refills   : Batches run to refill the pool.
+                bits_used : Bits handed out from the pool.
+                circuit_hits   : Compiled circuits found in the cache.
+                circuit_misses : Circuits that had to be transpiled.
+                transpile_time : Seconds spent transpiling.
+                metrics        : Records a sample per circuit run, if set.
         """
 
+        # ~ Qiskit takes seconds to import, so it loads with the first
+        #   handler instead of with this module. ~ #
+        from qiskit_aer import AerSimulator
+
         self.simulator = AerSimulator()
+        self.width = min(MAX_QBITS, self.simulator.num_qubits)
+        self.pool_size = max(pool_size, self.width)
+
+        self.hits = 0
+        self.refills = 0
+        self.bits_used = 0
+
+        self.circuit_hits = 0
+        self.circuit_misses = 0
+        self.transpile_time = 0.0
+        self.metrics = None
+
+        self._pool = b""
+        self._pos = 0
+        self._lock = Lock()
+
+        if warm_up:
+            self._compiled(self.width)
 
-    def _run_circuit(self, qbits):
+    def _config_key(self):
         """
-            ~ Measures the qubits placed in superposition using Hadamard gates,
-              collapsing them into a 1 or 0 to simulate a 50/50 quantum outcome. ~
+            ~ Describe the simulator setup a transpiled circuit depends on. ~
+
+            Returns:
+                (tuple) : The simulator name and its options.
+        """
+
+        options = tuple(sorted((name, repr(value)) for name, value
+                               in self.simulator.options.items()))
+
+        return (self.simulator.name, options)
+
+    def _compiled(self, qbits):
+        """
+            ~ Get the transpiled Hadamard-and-measure circuit for a width. ~
+
+            Arguments:
+                qbits (int) : How many qubits the circuit has.
+
+            Returns:
+                (obj) : The transpiled circuit.
+        """
+
+        key = (qbits, self._config_key())
+
+        with COMPILED_LOCK:
+            compiled = COMPILED.get(key)
+
+            if compiled is not None:
+                self.circuit_hits += 1
+                return compiled
+
+            from qiskit import QuantumCircuit, transpile
+
+            qc = QuantumCircuit(qbits, qbits)
+            qc.h(range(qbits))
+            qc.measure(range(qbits), range(qbits))
+
+            start = time.perf_counter()
+            compiled = transpile(qc, self.simulator)
+
+            self.transpile_time += time.perf_counter()-start
+            self.circuit_misses += 1
+            COMPILED[key] = compiled
+
+        return compiled
+
+    def _run_circuit(self, qbits, shots=1):
+        """
+            ~ Measures the qubits placed in superposition using Hadamard
+              gates, collapsing them into a 1 or 0 to simulate a 50/50
+              quantum outcome. ~
 
             Arguments:
                 qbits (int) : How many qubits to process.
+                shots (int) : How many times to run the circuit. (Default: 1)
 
             Returns:
-                (str) : Bitstring result of measured qubits.
+                (list[str]) : Bitstring result of measured qubits per shot.
         """
-        
-        qc = QuantumCircuit(qbits, qbits)
-        qc.h(range(qbits))
-        qc.measure(range(qbits), range(qbits))
 
-        compiled = transpile(qc, self.simulator)
-        job = self.simulator.run(compiled, shots=1, memory=True)
-        result = job.result()
+        start = time.perf_counter()
+        job = self.simulator.run(self._compiled(qbits), shots=shots,
+                                 memory=True)
+        memory = job.result().get_memory()
+
+        if self.metrics is not None:
+            self.metrics.record("circuit", time.perf_counter()-start,
+                                qubits=qbits, shots=shots,
+                                circuit_hits=self.circuit_hits,
+                                circuit_misses=self.circuit_misses)
 
-        return result.get_memory()[0]
+        return memory
 
-    def q_choice(self, options, weights=None):
+    def _refill(self, needed):
+        """
+            ~ Top up the entropy pool with one batch of shots. ~
+
+            Arguments:
+                needed (int) : Bits that must be available afterwards.
+        """
+
+        pool = self._pool[self._pos:]
+        missing = max(needed, self.pool_size)-len(pool)
+        shots = -(-missing//self.width)
+
+        bits = "".join(self._run_circuit(self.width, shots)).encode()
+
+        self._pool = pool+bits
+        self._pos = 0
+        self.refills += 1
+
+    def _bits(self, amount):
+        """
+            ~ Draw bits from the entropy pool, refilling it when it runs low. ~
+
+            Arguments:
+                amount (int) : How many bits to draw.
+
+            Returns:
+                (bytes) : The bits as ASCII '0' and '1' characters.
+        """
+
+        with self._lock:
+            if len(self._pool)-self._pos < amount:
+                self._refill(amount)
+            else:
+                self.hits += 1
+
+            bits = self._pool[self._pos:self._pos+amount]
+            self._pos += amount
+            self.bits_used += amount
+
+        return bits
+
+    def _ints(self, qbits, count):
+        """
+            ~ Draw several fixed-width integers from one pool draw. ~
+
+            Arguments:
+                qbits (int) : Bits per integer.
+                count (int) : How many integers to draw.
+
+            Returns:
+                (list[int]) : The integers.
+        """
+
+        if qbits == 0:
+            return [0]*count
+
+        bits = self._bits(qbits*count)
+
+        return [int(bits[i:i+qbits], 2) for i in range(0, qbits*count, qbits)]
+
+    def pool_stats(self):
+        """
+            ~ Report entropy pool statistics. ~
+
+            Returns:
+                (dict) : Pool hits, refills, bits used and bits left.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "refills": self.refills,
+                "bits_used": self.bits_used,
+                "bits_left": len(self._pool)-self._pos,
+            }
+
+    def circuit_stats(self):
+        """
+            ~ Report compiled-circuit cache statistics. ~
+
+            Returns:
+                (dict) : Cache hits, misses and seconds spent transpiling.
+        """
+
+        return {
+            "hits": self.circuit_hits,
+            "misses": self.circuit_misses,
+            "transpile_time": self.transpile_time,
+        }
+
+    def q_choice(self, options, weights=None, count=None):
         """
             ~ Select a random choice from an array using
               quantum-generated randomness. ~
 
             Arguments:
                 options (list | tuple) : The array of options to choose from.
-                weights (list | tuple) : Optional bias weights for weighted selection.
+                weights (list | tuple) : Optional bias weights for weighted
+                                         selection.
+                count (int | None)     : Draw this many choices at once.
+                                         (Default: None, a single choice)
 
             Returns:
-                (any) : A single item from the input array.
+                (any | list) : A single item from the input array, or a list
+                               of them when count is given.
         """
 
         choices = len(options)
@@ -113,13 +315,18 @@ class QuantumMechanics:
             cum_weights.append(cum_sum)
 
         qbits = math.ceil(math.log2(choices))
+        draws = 1 if count is None else count
+        picks = []
 
-        result = int(self._run_circuit(qbits), 2)%total
-        
-        for i, cum in enumerate(cum_weights):
-            if result < cum:
-                return options[i]
-                
+        for result in self._ints(qbits, draws):
+            result %= total
+
+            for i, cum in enumerate(cum_weights):
+                if result < cum:
+                    picks.append(options[i])
+                    break
+
+        return picks[0] if count is None else picks
 
     def q_flip(self, amount=1):
         """
@@ -133,29 +340,25 @@ class QuantumMechanics:
                                     depending on amount.
         """
 
-        max_qbits = 29
-        bits = []
-
-        while amount > 0:
-            batch_size = min(amount, max_qbits)
-
-            result = self._run_circuit(batch_size)
-            bits.extend([int(bit) for bit in result])
-            amount -= batch_size
+        bits = list(self._bits(amount).translate(BIT_VALUES))
 
         return bits[0] if len(bits) == 1 else bits
 
-    def q_randint(self, end, start=0):
+    def q_randint(self, end, start=0, count=None):
         """
             ~ Randomly select an integer within a specified range using
               quantum randomness. ~
 
             Arguments:
-                end (int)   : The inclusive end of the range.
-                start (int) : The start of the range. (Default: 0)
+                end (int)          : The inclusive end of the range.
+                start (int)        : The start of the range. (Default: 0)
+                count (int | None) : Draw this many integers at once.
+                                     (Default: None, a single integer)
 
             Returns:
-                (int) : A random integer between start and end, inclusive.
+                (int | list[int]) : A random integer between start and end,
+                                    inclusive, or a list of them when count
+                                    is given.
         """
 
         if start > end:
@@ -163,6 +366,8 @@ class QuantumMechanics:
 
         options = end-start+1
         qbits = math.ceil(math.log2(options))
-        result = self._run_circuit(qbits)
+        draws = 1 if count is None else count
+        numbers = [start + result%options
+                   for result in self._ints(qbits, draws)]
 
-        return start + int(result)%options
+        return numbers[0] if count is None else numbers
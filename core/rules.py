@@ -0,0 +1,429 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: rules.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import re
+from collections import namedtuple
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ A life-like rule: the live neighbor counts a dead cell is born with
+#   and a live cell survives with. ~ #
+Rule = namedtuple("Rule", ["birth", "survival"])
+
+CONWAY = Rule((3,), (2, 3))
+
+# ~ Well-known rules by name. ~ #
+RULES = {
+    "conway": "B3/S23",
+    "highlife": "B36/S23",
+    "daynight": "B3678/S34678",
+    "seeds": "B2/S",
+}
+
+NOTATION = re.compile(r"^B([0-8]*)/S([0-8]*)$", re.IGNORECASE)
+REVERSED = re.compile(r"^S([0-8]*)/B([0-8]*)$", re.IGNORECASE)
+CLASSIC = re.compile(r"^([0-8]*)/([0-8]*)$")
+
+# ~ Inputs of a rule network: the four bit-planes of the live neighbor
+#   count, least significant first, then the cell itself. A truth table
+#   over them has a bit per minterm. ~ #
+INPUTS = 5
+MINTERMS = 1 << INPUTS
+
+# ~ Compiled networks by rule, shared by every engine running one. ~ #
+NETWORKS = {}
+
+
+def parse(rule=None):
+    """
+        ~ Read a rule in B/S notation, by name, or as a Rule. ~
+
+        ~ 'B36/S23', 'S23/B36' and the classic survival/birth form '23/36'
+          are all HighLife. ~
+
+        Arguments:
+            rule (str | Rule | None) : The rule; None is Conway's.
+                                       (Default: None)
+
+        Returns:
+            (Rule) : The rule, with sorted counts.
+    """
+
+    if rule is None:
+        return CONWAY
+
+    if isinstance(rule, Rule):
+        birth, survival = rule
+    else:
+        text = RULES.get(rule.lower(), rule).replace(" ", "")
+
+        if match := NOTATION.match(text):
+            birth, survival = match.groups()
+        elif match := REVERSED.match(text):
+            survival, birth = match.groups()
+        elif match := CLASSIC.match(text):
+            survival, birth = match.groups()
+        else:
+            raise ValueError(f"Invalid rule: {rule}!")
+
+    birth = tuple(sorted({int(count) for count in birth}))
+    survival = tuple(sorted({int(count) for count in survival}))
+
+    if any(not 0 <= count <= 8 for count in birth+survival):
+        raise ValueError(f"Invalid rule: {rule}!")
+
+    return Rule(birth, survival)
+
+
+def notation(rule):
+    """
+        ~ Write a rule in B/S notation. ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (str) : The rule, as in 'B3/S23'.
+    """
+
+    return "B" + "".join(map(str, rule.birth)) + \
+        "/S" + "".join(map(str, rule.survival))
+
+
+def next_state(rule):
+    """
+        ~ Compile a rule into a per-count table. ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (tuple) : Two 9-byte tables, for dead and live cells, of the
+                      next state by live neighbor count.
+    """
+
+    return (bytes(int(count in rule.birth) for count in range(9)),
+            bytes(int(count in rule.survival) for count in range(9)))
+
+
+def lookup(rule):
+    """
+        ~ Compile a rule into a 512-entry neighborhood table. ~
+
+        ~ A neighborhood is indexed by its 3x3 cells read row by row, the
+          top left cell as bit 0, so the cell itself is bit 4. ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (bytes) : The next state of the center of every neighborhood.
+    """
+
+    table = next_state(rule)
+
+    return bytes(table[index >> 4 & 1][bin(index & ~(1 << 4)).count("1")]
+                 for index in range(512))
+
+
+def masks(rule):
+    """
+        ~ Compile a rule into a byte per state of the counts it lives with. ~
+
+        ~ Bit k of a state's byte is its next state with k + offset live
+          neighbors, so a vectorized engine finds every next state by
+          shifting each cell's byte right by its count less the offset and
+          keeping the low bit; shifts of eight or more leave nothing. A
+          byte holds eight of the nine counts, so the offset is 1 when the
+          rule names 8 but not 0. A rule naming both leaves count 8 out of
+          the bytes and in `eights`. ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (tuple) : The dead and live bytes, the offset, and whether dead
+                      and live cells live with 8 neighbors if the bytes
+                      leave it out, else None.
+    """
+
+    counts = set(rule.birth) | set(rule.survival)
+    offset = int(8 in counts and 0 not in counts)
+    dead, live = (sum(1 << (count-offset) for count in found
+                      if 0 <= count-offset < 8)
+                  for found in (rule.birth, rule.survival))
+    eights = None
+
+    if {0, 8} <= counts:
+        eights = (8 in rule.birth, 8 in rule.survival)
+
+    return dead, live, offset, eights
+
+
+def _cofactor(table, bit, value):
+    """
+        ~ A truth table with one input held at a value. ~
+
+        Arguments:
+            table (int) : The truth table.
+            bit (int)   : The input held.
+            value (int) : Its value.
+
+        Returns:
+            (int) : The truth table, the same for either value of the input.
+    """
+
+    mask = 1 << bit
+    held = [term | mask if value else term & ~mask
+            for term in range(MINTERMS)]
+
+    return sum(1 << term for term in range(MINTERMS)
+               if table >> held[term] & 1)
+
+
+def _invert(node):
+    """
+        ~ The complement of a network node. ~
+
+        Arguments:
+            node (int | str | tuple) : The node.
+
+        Returns:
+            (int | str | tuple) : Its complement.
+    """
+
+    if node in ("zero", "one"):
+        return "one" if node == "zero" else "zero"
+    if isinstance(node, tuple) and node[0] == "not":
+        return node[1]
+
+    return ("not", node)
+
+
+def _gate(op, left, right):
+    """
+        ~ A network gate, folding constants and double complements. ~
+
+        Arguments:
+            op (str)                  : 'and', 'or' or 'xor'.
+            left (int | str | tuple)  : The first operand.
+            right (int | str | tuple) : The second operand.
+
+        Returns:
+            (int | str | tuple) : The gate, or the simpler node it is.
+    """
+
+    for this, other in ((left, right), (right, left)):
+        if this == "zero":
+            return "zero" if op == "and" else other
+        if this == "one":
+            return {"and": other, "or": "one", "xor": _invert(other)}[op]
+
+    # ~ Two complements are cheaper as one: ~a & ~b is ~(a | b). ~ #
+    if op != "xor" and all(isinstance(node, tuple) and node[0] == "not"
+                           for node in (left, right)):
+        dual = "or" if op == "and" else "and"
+        return _invert(_gate(dual, left[1], right[1]))
+
+    return (op, left, right)
+
+
+def _size(node, seen=None):
+    """
+        ~ Gates in a network, counting shared nodes once. ~
+
+        Arguments:
+            node (int | str | tuple) : The network's output node.
+            seen (set)               : Nodes counted so far. (Default: None)
+
+        Returns:
+            (int) : The number of gates.
+    """
+
+    seen = set() if seen is None else seen
+
+    if isinstance(node, tuple) and node not in seen:
+        seen.add(node)
+
+        for child in node[1:]:
+            _size(child, seen)
+
+    return len(seen)
+
+
+def _mux(bit, low, high):
+    """
+        ~ The smallest network choosing between two by an input. ~
+
+        Arguments:
+            bit (int)                : The input choosing.
+            low (int | str | tuple)  : The network for when it is 0.
+            high (int | str | tuple) : The network for when it is 1.
+
+        Returns:
+            (int | str | tuple) : The network.
+    """
+
+    if high == "one":
+        return _gate("or", bit, low)
+    if low == "zero":
+        return _gate("and", bit, high)
+    if high == "zero":
+        return _gate("and", low, _invert(bit))
+    if low == "one":
+        return _gate("or", _invert(bit), high)
+
+    return min(_gate("or", _gate("and", bit, high),
+                     _gate("and", low, _invert(bit))),
+               _gate("xor", low, _gate("and", bit,
+                                       _gate("xor", low, high))),
+               key=_size)
+
+
+def _synthesize(on, care, inputs, memo):
+    """
+        ~ Find a small network for a truth table by splitting it on each
+          input in turn. ~
+
+        ~ Minterms outside `care` may go either way, which lets a network
+          ignore inputs the function doesn't need there. ~
+
+        Arguments:
+            on (int)          : Minterms where the output is 1.
+            care (int)        : Minterms whose output matters.
+            inputs (set)      : Inputs not split on yet.
+            memo (dict)       : Networks found so far.
+
+        Returns:
+            (int | str | tuple) : The network's output node.
+    """
+
+    on &= care
+    key = (on, care, inputs)
+
+    if key in memo:
+        return memo[key]
+
+    if on == 0:
+        return "zero"
+    if on == care:
+        return "one"
+
+    found = []
+
+    for bit in inputs:
+        rest = inputs - {bit}
+        low_on, low_care = _cofactor(on, bit, 0), _cofactor(care, bit, 0)
+        high_on, high_care = _cofactor(on, bit, 1), _cofactor(care, bit, 1)
+        both = low_care & high_care
+
+        # ~ The input doesn't matter where both halves are cared for. ~ #
+        if (low_on ^ high_on) & both == 0:
+            found.append(_synthesize(low_on | high_on, low_care | high_care,
+                                     rest, memo))
+            continue
+
+        # ~ Or it flips the output. ~ #
+        if (low_on ^ ~high_on) & both == 0:
+            flipped = low_on | ~high_on & high_care
+            found.append(_gate("xor", bit, _synthesize(
+                flipped, low_care | high_care, rest, memo)))
+
+        found.append(_mux(bit, _synthesize(low_on, low_care, rest, memo),
+                          _synthesize(high_on, high_care, rest, memo)))
+
+    memo[key] = min(found, key=_size)
+
+    return memo[key]
+
+
+def network(rule):
+    """
+        ~ Compile a rule into a small network of bitwise gates. ~
+
+        ~ The network maps the bit-planes of a neighbor count and the
+          cells to the next cells, so a bit-parallel engine runs any rule
+          with a handful of whole-word operations. Counts past 8 never
+          happen, which leaves room to simplify; B3/S23 comes out as
+          s1 & ~s2 & (s0 | cell). ~
+
+        Arguments:
+            rule (Rule) : The rule.
+
+        Returns:
+            (tuple) : Steps (op, left, right) in order, op being 'and',
+                      'or', 'xor', 'not', 'copy', 'zero' or 'one'. Operands
+                      are slots: the inputs first, then each step's result.
+                      The last step is the next cells.
+    """
+
+    if rule in NETWORKS:
+        return NETWORKS[rule]
+
+    on = care = 0
+
+    for term in range(MINTERMS):
+        count, state = term & 15, term >> 4
+
+        if count <= 8:
+            care |= 1 << term
+            on |= int(count in (rule.survival if state else rule.birth)) \
+                << term
+
+    root = _synthesize(on, care, frozenset(range(INPUTS)), {})
+    steps = []
+    slots = {}
+
+    def place(node):
+        """ ~ Add a node's steps, returning the slot of its result. ~ """
+
+        if isinstance(node, int):
+            return node
+
+        if node not in slots:
+            if node in ("zero", "one"):
+                steps.append((node, None, None))
+            elif node[0] == "not":
+                steps.append(("not", place(node[1]), None))
+            else:
+                steps.append((node[0], place(node[1]), place(node[2])))
+
+            slots[node] = INPUTS+len(steps)-1
+
+        return slots[node]
+
+    # ~ The next cells are always a fresh array. ~ #
+    if isinstance(root, int):
+        steps.append(("copy", root, None))
+    else:
+        place(root)
+
+    return NETWORKS.setdefault(rule, tuple(steps))
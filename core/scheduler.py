@@ -0,0 +1,169 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: scheduler.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import time
+from threading import Event, Thread
+
+
+class Ticker:
+    """
+        ~ Fixed-rate clock that drops ticks it has already missed. ~
+
+        Methods:
+            __init__ : Initialize the clock.
+            wait     : Sleep until the next tick.
+    """
+
+    def __init__(self, rate=None):
+        """
+            ~ Initialize the clock. ~
+
+            Arguments:
+                rate (float | None) : Ticks per second; None never sleeps.
+                                      (Default: None)
+
+            Attributes:
+                interval (float) : Seconds between ticks.
+                skipped (int)    : Ticks dropped because the caller was late.
+        """
+
+        self.interval = 1/rate if rate else 0
+        self.skipped = 0
+        self._next = time.perf_counter()
+
+    def wait(self, event=None):
+        """
+            ~ Sleep until the next tick, skipping any that were missed. ~
+
+            Arguments:
+                event (Event | None) : Wakes the sleep early when set.
+                                       (Default: None)
+        """
+
+        if not self.interval:
+            return
+
+        self._next += self.interval
+        now = time.perf_counter()
+
+        if now >= self._next:
+            # ~ Running late: drop the missed ticks instead of bursting. ~ #
+            missed = int((now-self._next)/self.interval)
+            self.skipped += missed
+            self._next += missed*self.interval
+            return
+
+        if event is None:
+            time.sleep(self._next-now)
+        else:
+            event.wait(self._next-now)
+
+
+class Simulation:
+    """
+        ~ Steps a world on its own thread and hands finished generations
+          to the renderer. ~
+
+        The renderer takes the latest published frame and flags that it
+        wants another; the stepping thread only copies the grid when that
+        flag is set. Frames are swapped by reference, so neither side ever
+        takes a lock or waits on the other.
+
+        Methods:
+            __init__ : Initialize the simulation.
+            start    : Start stepping in the background.
+            stop     : Stop stepping and wait for the thread.
+            frame    : Take the latest finished generation.
+            _run     : The stepping loop.
+    """
+
+    def __init__(self, world, rate=None):
+        """
+            ~ Initialize the simulation. ~
+
+            Arguments:
+                world (World)       : A loaded world.
+                rate (float | None) : Target generations per second;
+                                      None runs at full engine speed.
+                                      (Default: None)
+
+            Attributes:
+                world (World)  : The world being stepped.
+                ticker (obj)   : Paces the generations.
+        """
+
+        self.world = world
+        self.ticker = Ticker(rate)
+
+        self._frame = (world.generation, world.grid.copy())
+        self._wanted = False
+        self._stop = Event()
+        self._thread = Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """ ~ Start stepping in the background. ~ """
+
+        self._thread.start()
+
+    def stop(self):
+        """ ~ Stop stepping and wait for the thread. ~ """
+
+        self._stop.set()
+
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def frame(self):
+        """
+            ~ Take the latest finished generation. ~
+
+            Returns:
+                (tuple) : The generation number and its cell states.
+        """
+
+        frame = self._frame
+        self._wanted = True
+
+        return frame
+
+    def _run(self):
+        """ ~ Step the world until stopped, publishing wanted frames. ~ """
+
+        world = self.world
+
+        while not self._stop.is_set():
+            world.update()
+
+            if self._wanted:
+                self._wanted = False
+                self._frame = (world.generation, world.grid.copy())
+
+            self.ticker.wait(self._stop)
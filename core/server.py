@@ -0,0 +1,722 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: server.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Every message is MESSAGE (type, payload size) followed by the payload,
+    all integers little-endian.
+
+        Server to viewer:
+            HELLO : SIZE (width, height, generation)
+            FRAME : FRAME_HEAD (record kind, generation), then a zlib
+                    compressed record as written by core.stream: the full
+                    cells for a viewer's first frame, after that the delta
+                    from the last frame that viewer was sent
+            ERROR : UTF-8 text
+
+        Viewer to server:
+            SEED  : SEED_HEAD (x, y), then the pattern's name in UTF-8
+            PAUSE : One byte, 1 to pause and 0 to resume
+            STEP  : STEP_HEAD (generations), run even while paused
+            ACK   : Empty, once a frame is drawn and the next is wanted
+
+    A viewer has at most one frame in flight: the next is only sent once it
+    acknowledges the last, and then it is the newest generation, as one
+    delta from the frame the viewer has. A slow viewer so gets fewer,
+    coalesced frames instead of a backlog in the socket buffers.
+"""
+
+
+# ~ Standard libraries. ~ #
+import argparse
+import asyncio
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# ~ Custom modules. ~ #
+from core import stream as stm
+from core import world
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+MESSAGE = struct.Struct("<BI")
+SIZE = struct.Struct("<IIQ")
+FRAME_HEAD = struct.Struct("<BQ")
+SEED_HEAD = struct.Struct("<ii")
+STEP_HEAD = struct.Struct("<I")
+
+HELLO = 1
+FRAME = 2
+ERROR = 3
+SEED = 16
+PAUSE = 17
+STEP = 18
+ACK = 19
+
+# ~ Largest message either side accepts. ~ #
+MAX_MESSAGE = 1 << 30
+
+
+async def _read_message(reader):
+    """
+        ~ Read one message. ~
+
+        Arguments:
+            reader (StreamReader) : The socket to read.
+
+        Returns:
+            (tuple | None) : The type and payload, or None once closed.
+    """
+
+    try:
+        kind, size = MESSAGE.unpack(await reader.readexactly(MESSAGE.size))
+
+        if size > MAX_MESSAGE:
+            raise ValueError(f"Message of {size} bytes is too large!")
+
+        return kind, await reader.readexactly(size)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+def _message(kind, payload=b""):
+    """
+        ~ Frame one message. ~
+
+        Arguments:
+            kind (int)      : The message type.
+            payload (bytes) : Its payload. (Default: b'')
+
+        Returns:
+            (bytes) : The message, ready to write.
+    """
+
+    return MESSAGE.pack(kind, len(payload)) + payload
+
+
+class _Viewer:
+    """ ~ A connected viewer and the last frame it was sent. ~ """
+
+    __slots__ = ("writer", "last", "generation", "dirty", "acked")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.last = None
+        self.generation = None
+        self.dirty = asyncio.Event()
+        self.acked = asyncio.Event()
+        self.acked.set()
+
+
+class Server:
+    """
+        ~ Runs one world for many viewers over a local socket. ~
+
+        ~ The world is only ever touched on one dedicated executor thread:
+          stepping, seeding and copying frames are queued there in order,
+          so the event loop stays free to serve the viewers. ~
+
+        Methods:
+            __init__      : Initialize the server.
+            start         : Listen on a TCP port or a Unix socket.
+            serve_forever : Serve until cancelled.
+            close         : Stop stepping and disconnect every viewer.
+            _advance      : Run generations on the world's thread.
+            _seed         : Seed a pattern on the world's thread.
+            _publish      : Hand a new frame to every viewer.
+            _run          : The stepping loop.
+            _handle       : Serve one viewer's commands.
+            _send         : Send one viewer its frames.
+
+        Properties:
+            paused : Whether stepping is paused.
+    """
+
+    def __init__(self, world, rate=None):
+        """
+            ~ Initialize the server. ~
+
+            Arguments:
+                world (World)       : A loaded world.
+                rate (float | None) : Target generations per second;
+                                      None runs at full engine speed.
+                                      (Default: None)
+
+            Attributes:
+                world (World)    : The world being served.
+                rate (float)     : Target generations per second.
+                address (obj)    : (host, port) or the socket path once
+                                   started.
+                coalesced (int)  : Generations viewers skipped by being slow.
+        """
+
+        self.world = world
+        self.rate = rate
+        self.address = None
+        self.coalesced = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._frame = (world.generation, world.grid.copy())
+        self._viewers = set()
+        self._handlers = set()
+        self._running = None
+        self._server = None
+        self._stepper = None
+
+    @property
+    def paused(self):
+        """
+            ~ Whether stepping is paused. ~
+
+            Returns:
+                (bool) : True while paused.
+        """
+
+        return self._running is not None and not self._running.is_set()
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+            ~ Listen on a TCP port or a Unix socket and start stepping. ~
+
+            Arguments:
+                host (str)        : Address to bind. (Default: '127.0.0.1')
+                port (int)        : Port to listen on; 0 picks a free one.
+                                    (Default: 0)
+                path (str | None) : Listen on this Unix socket instead.
+                                    (Default: None)
+
+            Returns:
+                (Server) : The server.
+        """
+
+        self._running = asyncio.Event()
+        self._running.set()
+
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle,
+                                                           path)
+            self.address = path
+        else:
+            self._server = await asyncio.start_server(self._handle, host,
+                                                      port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+
+        self._stepper = asyncio.create_task(self._run())
+
+        return self
+
+    async def serve_forever(self):
+        """ ~ Serve until cancelled. ~ """
+
+        await self._server.serve_forever()
+
+    async def close(self):
+        """ ~ Stop stepping and disconnect every viewer. ~ """
+
+        self._stepper.cancel()
+        self._server.close()
+
+        # ~ Closing the sockets ends every handler on its own. ~ #
+        for viewer in list(self._viewers):
+            viewer.writer.close()
+
+        await asyncio.gather(self._stepper, *self._handlers,
+                             return_exceptions=True)
+        await self._server.wait_closed()
+        self._executor.shutdown(wait=True)
+
+    def _advance(self, generations):
+        """
+            ~ Run generations; called on the world's thread. ~
+
+            Arguments:
+                generations (int) : Generations to run.
+
+            Returns:
+                (tuple) : The generation number and a copy of its cells.
+        """
+
+        for _ in range(generations):
+            self.world.update()
+
+        return self.world.generation, self.world.grid.copy()
+
+    def _seed(self, pattern, x, y):
+        """
+            ~ Seed a pattern; called on the world's thread. ~
+
+            Arguments:
+                pattern (list) : Positions of the pattern's body.
+                x (int)        : Pattern's top left x.
+                y (int)        : Pattern's top left y.
+
+            Returns:
+                (tuple) : The generation number and a copy of its cells.
+        """
+
+        self.world.seed_pattern(pattern, x, y)
+
+        return self.world.generation, self.world.grid.copy()
+
+    def _publish(self, frame):
+        """
+            ~ Hand a new frame to every viewer. ~
+
+            Arguments:
+                frame (tuple) : The generation number and its cells.
+        """
+
+        self._frame = frame
+
+        for viewer in self._viewers:
+            viewer.dirty.set()
+
+    async def _run(self):
+        """ ~ Step the world on its thread until cancelled. ~ """
+
+        loop = asyncio.get_running_loop()
+        interval = 1/self.rate if self.rate else 0
+
+        while True:
+            await self._running.wait()
+
+            start = loop.time()
+            frame = await loop.run_in_executor(self._executor,
+                                               self._advance, 1)
+            self._publish(frame)
+
+            await asyncio.sleep(max(0, interval-(loop.time()-start)))
+
+    async def _handle(self, reader, writer):
+        """
+            ~ Serve one viewer: send its frames and run its commands. ~
+
+            Arguments:
+                reader (StreamReader) : The viewer's socket, to read.
+                writer (StreamWriter) : The viewer's socket, to write.
+        """
+
+        loop = asyncio.get_running_loop()
+        viewer = _Viewer(writer)
+        writer.write(_message(HELLO, SIZE.pack(self.world.width,
+                                               self.world.height,
+                                               self._frame[0])))
+
+        self._viewers.add(viewer)
+        self._handlers.add(asyncio.current_task())
+        viewer.dirty.set()
+        sender = asyncio.create_task(self._send(viewer))
+
+        try:
+            while True:
+                message = await _read_message(reader)
+
+                if message is None:
+                    break
+
+                kind, payload = message
+
+                if kind == ACK:
+                    viewer.acked.set()
+                elif kind == SEED:
+                    try:
+                        x, y = SEED_HEAD.unpack_from(payload)
+                        name = payload[SEED_HEAD.size:].decode()
+                    except (struct.error, UnicodeDecodeError):
+                        writer.write(_message(
+                            ERROR, b"Malformed SEED command!"))
+                        continue
+
+                    if name not in world.PATTERNS:
+                        writer.write(_message(
+                            ERROR, f"Unknown pattern: {name}!".encode()))
+                        continue
+
+                    frame = await loop.run_in_executor(
+                        self._executor, self._seed, world.PATTERNS[name],
+                        x, y)
+                    self._publish(frame)
+                elif kind == PAUSE:
+                    if payload[:1] == b"\1":
+                        self._running.clear()
+                    else:
+                        self._running.set()
+                elif kind == STEP:
+                    try:
+                        (generations,) = STEP_HEAD.unpack_from(payload)
+                    except struct.error:
+                        writer.write(_message(
+                            ERROR, b"Malformed STEP command!"))
+                        continue
+
+                    frame = await loop.run_in_executor(
+                        self._executor, self._advance, generations)
+                    self._publish(frame)
+                else:
+                    writer.write(_message(
+                        ERROR, f"Unknown command: {kind}!".encode()))
+        finally:
+            self._viewers.discard(viewer)
+            self._handlers.discard(asyncio.current_task())
+            sender.cancel()
+            writer.close()
+
+    async def _send(self, viewer):
+        """
+            ~ Send a viewer the newest frame each time it acknowledges the
+              last one. ~
+
+            Arguments:
+                viewer (_Viewer) : The viewer.
+        """
+
+        try:
+            while True:
+                await viewer.acked.wait()
+                await viewer.dirty.wait()
+                viewer.dirty.clear()
+
+                generation, cells = self._frame
+
+                if generation == viewer.generation and \
+                        viewer.last is cells:
+                    continue
+
+                if viewer.generation is not None:
+                    self.coalesced += max(0, generation-viewer.generation-1)
+
+                kind, payload = stm.encode(cells, viewer.last,
+                                           viewer.last is None)
+                payload = FRAME_HEAD.pack(kind, generation) + \
+                    zlib.compress(payload, 1)
+
+                viewer.acked.clear()
+                viewer.writer.write(_message(FRAME, payload))
+                await viewer.writer.drain()
+
+                viewer.last = cells
+                viewer.generation = generation
+        except ConnectionError:
+            viewer.writer.close()
+
+
+class Client:
+    """
+        ~ Watches and commands a served world. ~
+
+        Methods:
+            connect : Connect to a server.
+            frames  : Decode the frames sent.
+            seed    : Seed a pattern.
+            pause   : Pause or resume stepping.
+            step    : Run generations, even while paused.
+            close   : Disconnect.
+    """
+
+    def __init__(self, reader, writer):
+        """
+            ~ Initialize the client; use `connect` instead. ~
+
+            Arguments:
+                reader (StreamReader) : The socket, to read.
+                writer (StreamWriter) : The socket, to write.
+
+            Attributes:
+                width (int)    : Width of the world, once connected.
+                height (int)   : Height of the world, once connected.
+                errors (list)  : Error messages the server sent.
+        """
+
+        self.width = None
+        self.height = None
+        self.errors = []
+
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, address):
+        """
+            ~ Connect to a server. ~
+
+            Arguments:
+                address (tuple | str) : (host, port) or a Unix socket path.
+
+            Returns:
+                (Client) : The connected client.
+        """
+
+        if isinstance(address, str):
+            reader, writer = await asyncio.open_unix_connection(address)
+        else:
+            reader, writer = await asyncio.open_connection(*address)
+
+        client = cls(reader, writer)
+        message = await _read_message(reader)
+
+        if message is None or message[0] != HELLO:
+            writer.close()
+            raise ValueError("Not a Game of Life server!")
+
+        client.width, client.height, _ = SIZE.unpack(message[1])
+
+        return client
+
+    async def frames(self):
+        """
+            ~ Decode the frames sent, until the server disconnects. ~
+
+            ~ Each frame is acknowledged when the next one is asked for,
+              so the server sends frames at the pace they are used. ~
+
+            Yields:
+                (tuple) : The generation number and its cell states.
+        """
+
+        shape = (self.height, self.width)
+        last = None
+
+        while True:
+            message = await _read_message(self._reader)
+
+            if message is None:
+                return
+
+            kind, payload = message
+
+            if kind == ERROR:
+                self.errors.append(payload.decode())
+                continue
+            if kind != FRAME:
+                continue
+
+            record, generation = FRAME_HEAD.unpack_from(payload)
+            data = zlib.decompress(payload[FRAME_HEAD.size:])
+            last = stm.decode(record, data, last, shape)
+
+            yield generation, last
+
+            self._writer.write(_message(ACK))
+
+    async def seed(self, name, x, y):
+        """
+            ~ Seed a pattern. ~
+
+            Arguments:
+                name (str) : Name of the pattern. ('glider', 'blinker' or
+                             'block')
+                x (int)    : Pattern's top left x.
+                y (int)    : Pattern's top left y.
+        """
+
+        self._writer.write(_message(SEED, SEED_HEAD.pack(x, y) +
+                                    name.encode()))
+        await self._writer.drain()
+
+    async def pause(self, paused=True):
+        """
+            ~ Pause or resume stepping. ~
+
+            Arguments:
+                paused (bool) : True to pause, False to resume.
+                                (Default: True)
+        """
+
+        self._writer.write(_message(PAUSE, b"\1" if paused else b"\0"))
+        await self._writer.drain()
+
+    async def step(self, generations=1):
+        """
+            ~ Run generations, even while paused. ~
+
+            Arguments:
+                generations (int) : Generations to run. (Default: 1)
+        """
+
+        self._writer.write(_message(STEP, STEP_HEAD.pack(generations)))
+        await self._writer.drain()
+
+    async def close(self):
+        """ ~ Disconnect. ~ """
+
+        self._writer.close()
+
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def view(address, frames=None, stream=None):
+    """
+        ~ Draw a served world with the terminal renderer. ~
+
+        Arguments:
+            address (tuple | str) : (host, port) or a Unix socket path.
+            frames (int | None)   : Frames to draw; None draws until the
+                                    server disconnects. (Default: None)
+            stream (obj)          : Where to draw. (Default: sys.stdout)
+    """
+
+    from core import terminal
+
+    client = await Client.connect(address)
+    renderer = terminal.TerminalRenderer(stream)
+    drawn = 0
+
+    try:
+        async for _, cells in client.frames():
+            renderer.render(cells)
+            drawn += 1
+
+            if frames is not None and drawn >= frames:
+                break
+    finally:
+        renderer.close()
+        await client.close()
+
+
+async def _serve(args):
+    """
+        ~ Load a world and serve it until interrupted. ~
+
+        Arguments:
+            args (Namespace) : The parsed 'serve' options.
+    """
+
+    life = world.World(args.width, args.height, engine=args.engine,
+                       seeds_per_generation=args.seeds,
+                       entropy=args.entropy, seed=args.seed, rule=args.rule)
+    await asyncio.wrap_future(life.loading)
+
+    server = await Server(life, args.rate).start(args.host, args.port,
+                                                  args.unix)
+    print(f"Serving {args.width}x{args.height} on {server.address}",
+          file=sys.stderr)
+
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        life.engine.close()
+
+
+async def _command(args, address):
+    """
+        ~ Send one command to a server. ~
+
+        Arguments:
+            args (Namespace)      : The parsed options.
+            address (tuple | str) : Where the server listens.
+    """
+
+    client = await Client.connect(address)
+
+    try:
+        if args.command == "seed":
+            await client.seed(args.pattern, args.x, args.y)
+        elif args.command == "step":
+            await client.step(args.generations)
+        else:
+            await client.pause(args.command == "pause")
+    finally:
+        await client.close()
+
+
+def main(argv=None):
+    """
+        ~ Serve a world, watch one, or command one. ~
+
+        Arguments:
+            argv (list) : Arguments after the program name.
+                          (Default: sys.argv[1:])
+
+        Returns:
+            (int) : The exit status.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m core.server",
+        description="Serve one Game of Life world to many viewers.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to serve or connect to "
+                             "(default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9109,
+                        help="port to serve or connect to (default: 9109)")
+    parser.add_argument("--unix", default=None,
+                        help="use this Unix socket instead of TCP")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run a world")
+    serve.add_argument("-W", "--width", type=int, default=80)
+    serve.add_argument("-H", "--height", type=int, default=24)
+    serve.add_argument("-e", "--engine", default="numpy")
+    serve.add_argument("-s", "--seeds", type=int, default=1,
+                       help="patterns seeded per generation")
+    serve.add_argument("-r", "--entropy", default="numpy",
+                       help="entropy source (default: numpy)")
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--rule", default=None,
+                       help="rule in B/S notation (default: B3/S23)")
+    serve.add_argument("--rate", type=float, default=30,
+                       help="generations per second; 0 for full speed "
+                            "(default: 30)")
+
+    watch = commands.add_parser("view", help="draw a served world")
+    watch.add_argument("--frames", type=int, default=None,
+                       help="frames to draw before exiting")
+
+    seed = commands.add_parser("seed", help="seed a pattern")
+    seed.add_argument("pattern", choices=list(world.PATTERNS))
+    seed.add_argument("x", type=int)
+    seed.add_argument("y", type=int)
+
+    commands.add_parser("pause", help="pause stepping")
+    commands.add_parser("resume", help="resume stepping")
+
+    step = commands.add_parser("step", help="run generations")
+    step.add_argument("generations", type=int, nargs="?", default=1)
+
+    args = parser.parse_args(argv)
+    address = args.unix or (args.host, args.port)
+
+    try:
+        if args.command == "serve":
+            asyncio.run(_serve(args))
+        elif args.command == "view":
+            asyncio.run(view(address, args.frames))
+        else:
+            asyncio.run(_command(args, address))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                             File: sparse.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core.bitpack import WORD, WORD_DTYPE
+from core.engine import NumpyEngine
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Share of the area that may change before a dense step of the whole
+#   world is cheaper than tracking the cells around the changes. ~ #
+DENSE_FRACTION = 1/256
+
+# ~ Most dense steps taken in a row without counting the changes, while
+#   the world stays too busy for a sparse step. ~ #
+DENSE_SKIP = 32
+
+# ~ Spare bit of a cell's byte that marks it while gathering. ~ #
+MARK = 2
+
+
+class SparseEngine(NumpyEngine):
+    """
+        ~ Incremental engine that only re-evaluates cells next to the cells
+          that changed in the previous generation. ~
+
+        A cell can only change if it or one of its neighbors changed last
+        generation, so everything else is skipped and the cost of a step
+        follows the activity of the world instead of its area.
+
+        The cells around the changes are gathered by marking them in a
+        spare bit of the grid, so no sorting and no buffer besides the grid
+        is needed. Once more than DENSE_FRACTION of the world changes, it is
+        stepped densely like the NumPy engine instead.
+
+        Methods:
+            load_bands : Load the cell states a band of rows at a time.
+            seed       : Bring a set of cells to life.
+            step       : Advance the world by one generation.
+    """
+
+    name = "sparse"
+
+    def load_bands(self, bands):
+        """
+            ~ Load the cell states a band of rows at a time. ~
+
+            Arguments:
+                bands (iterable) : (start, rows) of every band, the rows
+                                   being a 2D matrix of cell states.
+
+            Attributes:
+                cells (ndarray)        : Flat view of the grid, row by row.
+                dirty (ndarray | None) : Flat indices changed since the last
+                                         step, or None when unknown.
+                limit (int)            : Most changes a sparse step takes.
+                active_size (int)      : Cells evaluated in the last
+                                         generation.
+        """
+
+        super().load_bands(bands)
+
+        self.cells = self.grid.reshape(-1)
+        self.limit = int(self.cells.size*DENSE_FRACTION)
+        self.active_size = 0
+
+        # ~ Next state by 9*state + count, for rules other than B3/S23. ~ #
+        self._table = np.frombuffer(b"".join(self.next_state),
+                                    dtype=np.uint8)
+
+        # ~ Nothing is known about a fresh world, so look at every cell. ~ #
+        self.dirty = None
+        self._seeded = []
+        self._skip = 0
+        self._backoff = 1
+
+    def seed(self, points):
+        """
+            ~ Bring a set of cells to life and mark them dirty. ~
+
+            Arguments:
+                points (iterable) : Wrapped (x, y) positions to set alive.
+        """
+
+        index = np.array([y*self.width+x for x, y in points], dtype=np.intp)
+
+        # ~ Only cells brought to life changed, each counted once. ~ #
+        index = np.unique(index[self.cells[index] == 0])
+
+        if self.on_change is not None:
+            rows = np.unique(index//self.width)
+            old = self.grid[rows]
+
+        self.cells[index] = 1
+
+        if self.dirty is not None:
+            self._seeded.append(index)
+        if self.on_change is not None:
+            self._report(rows, old, self.grid[rows])
+
+    def _words(self, index):
+        """
+            ~ Pack the 64-cell words at a set of flat word indices. ~
+
+            Arguments:
+                index (ndarray) : Flat indices of the words.
+
+            Returns:
+                (ndarray) : The words, laid out as in the bit-packed engine.
+        """
+
+        row, word = np.divmod(index, -(-self.width//WORD))
+        x = word[:, None]*WORD + np.arange(WORD)
+
+        bits = self.grid[row[:, None], np.minimum(x, self.width-1)]
+        bits &= x < self.width
+
+        return np.packbits(bits, axis=1,
+                           bitorder="little").view(WORD_DTYPE).ravel()
+
+    def _around(self, index):
+        """
+            ~ Yield the wrapped flat indices at each offset of the
+              neighborhood of a set of cells, the cells themselves first. ~
+
+            ~ Each offset maps distinct cells to distinct cells. ~
+
+            Arguments:
+                index (ndarray) : Flat indices of the cells.
+
+            Yields:
+                (ndarray) : Flat indices of the cells at one offset.
+        """
+
+        width, area = self.width, self.cells.size
+        column = index % width
+
+        left = index - 1
+        left[column == 0] += width
+
+        right = index + 1
+        right[column == width-1] -= width
+
+        for middle in (index, left, right):
+            above = middle - width
+            above[above < 0] += area
+
+            below = middle + width
+            below[below >= area] -= area
+
+            yield middle
+            yield above
+            yield below
+
+    def _step_dense(self):
+        """
+            ~ Step every cell, keeping the changes if they are few. ~
+
+            ~ Finding the changes costs about a third of a dense step, so
+              while they stay too many they are looked for ever more
+              rarely, up to every DENSE_SKIP steps. ~
+        """
+
+        self.active_size = self.cells.size
+        report = None if self.on_change is None else self._report
+
+        if self._skip:
+            self._skip -= 1
+            self._step_bands(report)
+            return
+
+        changed, count = [], 0
+
+        def collect(rows, old, new):
+            nonlocal count
+
+            if report is not None:
+                report(rows, old, new)
+
+            # ~ Past the limit the next step is dense anyway. ~ #
+            if count <= self.limit:
+                flipped = np.flatnonzero(old != new)
+                count += flipped.size
+                changed.append(flipped + rows[0]*self.width)
+
+        self._step_bands(collect)
+
+        if count <= self.limit:
+            self.dirty = np.concatenate(changed)
+            self._backoff = 1
+        else:
+            self.dirty = None
+            self._skip = self._backoff
+            self._backoff = min(2*self._backoff, DENSE_SKIP)
+
+    def step(self):
+        """ ~ Advance the world by one generation. ~ """
+
+        cells, dirty, seeded = self.cells, self.dirty, self._seeded
+        self._seeded = []
+
+        if dirty is None or dirty.size > self.limit:
+            self._step_dense()
+            return
+
+        if seeded:
+            # ~ Seeded cells that also changed last step are kept once. ~ #
+            seeded = np.concatenate(seeded)
+            cells[dirty] |= MARK
+            seeded = seeded[cells.take(seeded) < MARK]
+            cells[dirty] &= 1
+
+            dirty = np.concatenate((dirty, seeded))
+
+        if dirty.size == 0:
+            self.active_size = 0
+            return
+
+        # ~ Every cell that changed, plus its neighbors, may change next;
+        #   marking them keeps each one once. ~ #
+        found = []
+
+        for near in self._around(dirty):
+            near = near[cells.take(near) < MARK]
+            cells[near] |= MARK
+            found.append(near)
+
+        active = np.concatenate(found)
+        cells[active] &= 1
+
+        around = self._around(active)
+        state = cells.take(next(around))
+        live = np.zeros(active.size, dtype=np.uint8)
+
+        for near in around:
+            live += cells.take(near)
+
+        if self.conway:
+            # ~ Born with exactly three neighbors, survive with two or
+            #   three: either way the count OR the cell is 3. ~ #
+            new_state = (live | state) == 3
+        else:
+            new_state = self._table[9*state+live]
+
+        changed = active[new_state != state]
+
+        cells[changed] ^= 1
+        self.dirty = changed
+        self.active_size = active.size
+
+        if self.on_change is not None:
+            row, x = np.divmod(changed, self.width)
+            words = np.unique(row*(-(-self.width//WORD)) + x//WORD)
+            self.on_change(words, self._words(words))
@@ -0,0 +1,485 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                            File: stream.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Layout of a generation stream, all integers little-endian:
+
+        header  : HEADER (magic, version, width, height, keyframe interval)
+        records : One per generation, RECORD (kind, generation, payload
+                  size) followed by a zlib compressed payload:
+                      KEYFRAME : The cells packed 8 per byte
+                      INDICES  : Gaps between the sorted indices of the
+                                 cells that flipped, as uint32, or uint64
+                                 on worlds of more than 2^32 cells
+                      BITMAP   : The XOR with the last generation, packed
+                                 8 per byte
+
+    A delta is stored as INDICES or BITMAP, whichever is smaller before
+    compression, so a quiet generation costs a few bytes whatever the size
+    of the world. Every `keyframe` generations a full KEYFRAME is written
+    instead, which is where a reader seeking to a generation starts from.
+"""
+
+
+# ~ Standard libraries. ~ #
+import struct
+import zlib
+from queue import Queue
+from threading import Thread
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+MAGIC = b"LIFEDLTA"
+VERSION = 1
+HEADER = struct.Struct("<8sHIII")
+RECORD = struct.Struct("<BQI")
+
+KEYFRAME = 0
+INDICES = 1
+BITMAP = 2
+
+
+def gap_dtype(cells):
+    """
+        ~ Type of the gaps of an INDICES record, wide enough for any index. ~
+
+        Arguments:
+            cells (int) : Cells in the world.
+
+        Returns:
+            (str) : "<u4", or "<u8" past 2^32 cells.
+    """
+
+    return "<u4" if cells <= 1 << 32 else "<u8"
+
+
+def encode(cells, last, keyframe):
+    """
+        ~ Encode one generation as a record. ~
+
+        Arguments:
+            cells (ndarray)  : Cell states of shape (height, width).
+            last (ndarray)   : The previous generation's states, or None.
+            keyframe (bool)  : Whether to write the full generation.
+
+        Returns:
+            (tuple) : The record kind and its uncompressed payload.
+    """
+
+    if keyframe or last is None:
+        return KEYFRAME, np.packbits(cells).tobytes()
+
+    flips = np.flatnonzero(cells != last)
+    dtype = np.dtype(gap_dtype(cells.size))
+
+    # ~ Four or eight bytes per flipped cell against one bit per cell. ~ #
+    if 8*dtype.itemsize*flips.size < cells.size:
+        gaps = np.diff(flips, prepend=0).astype(dtype)
+        return INDICES, gaps.tobytes()
+
+    return BITMAP, np.packbits(cells != last).tobytes()
+
+
+def decode(kind, payload, last, shape):
+    """
+        ~ Apply one record to the previous generation. ~
+
+        Arguments:
+            kind (int)      : The record kind.
+            payload (bytes) : The uncompressed payload.
+            last (ndarray)  : The previous generation's states, or None.
+            shape (tuple)   : (height, width) of the world.
+
+        Returns:
+            (ndarray) : The generation's cell states.
+    """
+
+    cells = shape[0]*shape[1]
+
+    if kind == KEYFRAME:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        return np.unpackbits(data, count=cells).reshape(shape)
+
+    if last is None:
+        raise ValueError("A delta needs the generation before it!")
+
+    if kind == INDICES:
+        flips = np.cumsum(np.frombuffer(payload, dtype=gap_dtype(cells)),
+                          dtype=np.int64)
+        grid = last.copy()
+        grid.flat[flips] ^= 1
+        return grid
+
+    if kind == BITMAP:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        return last ^ np.unpackbits(data, count=cells).reshape(shape)
+
+    raise ValueError(f"Unknown record kind: {kind}!")
+
+
+class StreamWriter:
+    """
+        ~ Streams generations to a file or pipe as compressed deltas. ~
+
+        ~ `write` only copies the cells and queues them; computing the
+          delta, compressing and writing happen on a background thread.
+          The queue is bounded, so a slow disk or reader makes `write`
+          block instead of buffering a whole run in memory. ~
+
+        Methods:
+            __init__ : Initialize the writer and start its thread.
+            write    : Queue one generation.
+            close    : Write what is queued and stop.
+            _run     : The encoding loop.
+    """
+
+    def __init__(self, target, width, height, keyframe=256, level=6,
+                 buffer=64):
+        """
+            ~ Initialize the writer and start its thread. ~
+
+            Arguments:
+                target (str | obj) : Path to write, or a binary file or pipe.
+                width (int)        : Width of the world.
+                height (int)       : Height of the world.
+                keyframe (int)     : Generations between full keyframes.
+                                     (Default: 256)
+                level (int)        : zlib compression level. (Default: 6)
+                buffer (int)       : Most generations waiting to be written.
+                                     (Default: 64)
+
+            Attributes:
+                width (int)    : Width of the world.
+                height (int)   : Height of the world.
+                keyframe (int) : Generations between full keyframes.
+                level (int)    : zlib compression level.
+                records (int)  : Records written.
+                written (int)  : Bytes written, header included.
+        """
+
+        if keyframe < 1:
+            raise ValueError("Keyframes must be at least 1 generation "
+                             "apart!")
+
+        self.width = width
+        self.height = height
+        self.keyframe = keyframe
+        self.level = level
+        self.records = 0
+        self.written = 0
+
+        self._owned = isinstance(target, str)
+        self._file = open(target, "wb") if self._owned else target
+        self._queue = Queue(maxsize=max(1, buffer))
+        self._error = None
+
+        header = HEADER.pack(MAGIC, VERSION, width, height, keyframe)
+        self._file.write(header)
+        self.written += len(header)
+
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, generation, cells):
+        """
+            ~ Queue one generation, blocking while the queue is full. ~
+
+            Arguments:
+                generation (int) : The generation's number.
+                cells (ndarray)  : Cell states of shape (height, width).
+        """
+
+        if self._error is not None:
+            raise self._error
+
+        if np.shape(cells) != (self.height, self.width):
+            raise ValueError(f"Expected a {self.width}x{self.height} "
+                             "grid!")
+
+        self._queue.put((generation, np.array(cells, dtype=np.uint8)))
+
+    def close(self):
+        """ ~ Write what is queued, flush and stop. ~ """
+
+        self._queue.put(None)
+        self._thread.join()
+
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        """ ~ Encode and write queued generations until closed. ~ """
+
+        last = None
+        count = 0
+
+        while True:
+            item = self._queue.get()
+
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+
+            generation, cells = item
+
+            try:
+                kind, payload = encode(cells, last,
+                                       count % self.keyframe == 0)
+                payload = zlib.compress(payload, self.level)
+
+                self._file.write(RECORD.pack(kind, generation, len(payload)))
+                self._file.write(payload)
+            except Exception as error:
+                self._error = error
+                continue
+
+            self.records += 1
+            self.written += RECORD.size+len(payload)
+            last = cells
+            count += 1
+
+
+class StreamReader:
+    """
+        ~ Reads a generation stream back, in order or by generation. ~
+
+        ~ Iterating works on pipes. Seeking needs a file: the record
+          headers are scanned once, skipping the payloads, to find the
+          keyframes. ~
+
+        Methods:
+            __init__ : Open the stream and read its header.
+            __iter__ : Decode every generation in order.
+            seek     : Decode the cells of one generation.
+            close    : Close the stream.
+            _records : Read the record headers and payloads in order.
+            _scan    : Index the records of a file.
+
+        Properties:
+            generations : Generations in the stream, in order.
+    """
+
+    def __init__(self, source):
+        """
+            ~ Open the stream and read its header. ~
+
+            Arguments:
+                source (str | obj) : Path to read, or a binary file or pipe.
+
+            Attributes:
+                width (int)    : Width of the world.
+                height (int)   : Height of the world.
+                keyframe (int) : Generations between full keyframes.
+        """
+
+        self._owned = isinstance(source, str)
+        self._file = open(source, "rb") if self._owned else source
+        self._index = None
+
+        magic, version, self.width, self.height, self.keyframe = \
+            HEADER.unpack(self._file.read(HEADER.size))
+
+        if magic != MAGIC:
+            raise ValueError("Not a generation stream!")
+        if version != VERSION:
+            raise ValueError(f"Unsupported stream version: {version}!")
+
+    def __iter__(self):
+        """
+            ~ Decode every generation in order. ~
+
+            Yields:
+                (tuple) : The generation's number and its cell states.
+        """
+
+        shape = (self.height, self.width)
+        last = None
+
+        if self._file.seekable():
+            self._file.seek(HEADER.size)
+
+        for kind, generation, payload in self._records():
+            last = decode(kind, zlib.decompress(payload), last, shape)
+            yield generation, last
+
+    def seek(self, generation):
+        """
+            ~ Decode the cells of one generation. ~
+
+            ~ Starts at the last keyframe at or before the generation, so
+              at most `keyframe` records are decoded. ~
+
+            Arguments:
+                generation (int) : The generation to decode.
+
+            Returns:
+                (ndarray) : Its cell states.
+        """
+
+        index = self._scan()
+        numbers = [entry[1] for entry in index]
+        end = np.searchsorted(numbers, generation, side="right")
+
+        if end == 0 or numbers[end-1] != generation:
+            raise ValueError(f"Generation {generation} is not in the "
+                             "stream!")
+
+        start = end-1
+
+        while index[start][0] != KEYFRAME:
+            start -= 1
+
+        shape = (self.height, self.width)
+        last = None
+
+        for kind, _, offset, size in index[start:end]:
+            self._file.seek(offset)
+            last = decode(kind, zlib.decompress(self._file.read(size)),
+                          last, shape)
+
+        return last
+
+    @property
+    def generations(self):
+        """
+            ~ Generations in the stream, in order. ~
+
+            Returns:
+                (list[int]) : Their numbers.
+        """
+
+        return [entry[1] for entry in self._scan()]
+
+    def close(self):
+        """ ~ Close the stream if it was opened by path. ~ """
+
+        if self._owned:
+            self._file.close()
+
+    def _records(self):
+        """
+            ~ Read the records in order until the stream ends. ~
+
+            Yields:
+                (tuple) : Kind, generation and compressed payload.
+        """
+
+        while True:
+            head = self._file.read(RECORD.size)
+
+            if len(head) < RECORD.size:
+                return
+
+            kind, generation, size = RECORD.unpack(head)
+            payload = self._file.read(size)
+
+            # ~ A record cut off by a writer still running is left out. ~ #
+            if len(payload) < size:
+                return
+
+            yield kind, generation, payload
+
+    def _scan(self):
+        """
+            ~ Index the records of a file, once. ~
+
+            Returns:
+                (list) : Kind, generation, payload offset and size of every
+                         record.
+        """
+
+        if self._index is not None:
+            return self._index
+
+        self._index = []
+        end = self._file.seek(0, 2)
+        self._file.seek(HEADER.size)
+
+        while True:
+            head = self._file.read(RECORD.size)
+
+            if len(head) < RECORD.size:
+                break
+
+            kind, generation, size = RECORD.unpack(head)
+            offset = self._file.tell()
+
+            if offset+size > end:
+                break
+
+            self._index.append((kind, generation, offset, size))
+            self._file.seek(size, 1)
+
+        return self._index
+
+
+def record(world, target, generations, keyframe=256, level=6, buffer=64,
+           until=None):
+    """
+        ~ Run a loaded world and stream every generation it passes through,
+          the current one first. ~
+
+        Arguments:
+            world (World)      : The loaded world.
+            target (str | obj) : Path to write, or a binary file or pipe.
+            generations (int)  : Generations to run.
+            keyframe (int)     : Generations between full keyframes.
+                                 (Default: 256)
+            level (int)        : zlib compression level. (Default: 6)
+            buffer (int)       : Most generations waiting to be written.
+                                 (Default: 64)
+            until (func)       : Checked after every generation written;
+                                 the run ends early once it returns True.
+                                 (Default: None)
+
+        Returns:
+            (StreamWriter) : The closed writer, with its record and byte
+                             counts.
+    """
+
+    writer = StreamWriter(target, world.width, world.height, keyframe, level,
+                          buffer)
+
+    try:
+        for generation, cells in world.iter_generations(generations):
+            writer.write(generation, cells)
+
+            if until is not None and until():
+                break
+    finally:
+        writer.close()
+
+    return writer
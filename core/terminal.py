@@ -0,0 +1,295 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                           File: terminal.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+
+# ~ Standard libraries. ~ #
+import sys
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+CLEAR = "\x1b[2J"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+RESET = "\x1b[0m"
+CHARS = {0: ".", 1: "█"}
+COLORS = {0: "\x1b[31m", 1: "\x1b[35m"}   # ~ Red dead, magenta alive. ~ #
+
+# ~ Unchanged cells shorter than this between two changes are rewritten
+#   rather than skipped with a cursor move. ~ #
+GAP = 6
+
+# ~ Characters of a cursor move, to weigh moves against cells written. ~ #
+MOVE = 8
+
+
+def move(x, y):
+    """
+        ~ ANSI sequence moving the cursor to a cell. ~
+
+        Arguments:
+            x (int) : Column of the cell, from 0.
+            y (int) : Row of the cell, from 0.
+
+        Returns:
+            (str) : The escape sequence.
+    """
+
+    return f"\x1b[{y+1};{x+1}H"
+
+
+def paint(row, color=None):
+    """
+        ~ Colored text of a run of cells, one escape per change of color. ~
+
+        Arguments:
+            row (ndarray)      : Cell states of the run.
+            color (int | None) : State whose color is already active.
+                                 (Default: None)
+
+        Returns:
+            (tuple) : The text and the state whose color is left active.
+    """
+
+    import numpy as np
+
+    text = []
+    edges = np.flatnonzero(np.diff(row))+1
+    starts = [0, *edges.tolist()]
+    ends = [*edges.tolist(), len(row)]
+
+    for start, end in zip(starts, ends):
+        state = int(row[start])
+
+        if state != color:
+            text.append(COLORS[state])
+            color = state
+
+        text.append(CHARS[state]*(end-start))
+
+    return "".join(text), color
+
+
+def paint_spans(cells, starts, ends, color=None):
+    """
+        ~ Colored text of spans of a frame, each after a cursor move to its
+          first cell, with one escape per change of color. ~
+
+        ~ The runs of cells of one state are found for the whole frame at
+          once, so only the text is put together run by run. ~
+
+        Arguments:
+            cells (ndarray)    : Cell states of shape (height, width).
+            starts (ndarray)   : Flat index of the first cell of each span,
+                                 in order.
+            ends (ndarray)     : Flat index past the last cell of each span.
+                                 A span stays within one row.
+            color (int | None) : State whose color is already active.
+                                 (Default: None)
+
+        Returns:
+            (tuple) : The text and the state whose color is left active.
+    """
+
+    import numpy as np
+
+    width = cells.shape[1]
+    flat = cells.reshape(-1)
+
+    # ~ Cells inside a span, where a run may start. ~ #
+    depth = np.zeros(flat.size+1, dtype=np.int8)
+    depth[starts] += 1
+    depth[ends] -= 1
+    inside = np.cumsum(depth[:-1], dtype=np.int8) > 0
+
+    first = np.zeros(flat.size, dtype=bool)
+    first[starts] = True
+
+    # ~ Runs start at each span and wherever the state changes in one. ~ #
+    edge = first.copy()
+    edge[1:] |= (flat[1:] != flat[:-1]) & inside[1:]
+    runs = np.flatnonzero(edge)
+
+    span = np.searchsorted(starts, runs, side="right")-1
+    stops = np.minimum(np.append(runs[1:], flat.size), ends[span])
+
+    text = []
+
+    for start, stop, state, new in zip(runs.tolist(), stops.tolist(),
+                                       flat[runs].tolist(),
+                                       first[runs].tolist()):
+        if new:
+            text.append(move(start % width, start//width))
+
+        if state != color:
+            text.append(COLORS[state])
+            color = state
+
+        text.append(CHARS[state]*(stop-start))
+
+    return "".join(text), color
+
+
+def render_frame(cells):
+    """
+        ~ Colored text of a whole frame, drawn from the top-left corner. ~
+
+        Arguments:
+            cells (ndarray) : Cell states of shape (height, width).
+
+        Returns:
+            (str) : The frame with cursor moves between rows.
+    """
+
+    import numpy as np
+
+    height, width = cells.shape
+    starts = np.arange(height)*width
+
+    return paint_spans(cells, starts, starts+width)[0]
+
+
+class TerminalRenderer:
+    """
+        ~ Draws frames by rewriting only the cells that changed since the
+          last frame. ~
+
+        ~ A frame whose changes would take as much text as redrawing it
+          whole, as a busy world's do, is redrawn whole instead. ~
+
+        Methods:
+            __init__ : Initialize the renderer.
+            render   : Draw a frame.
+            close    : Restore the cursor and colors.
+    """
+
+    def __init__(self, stream=None):
+        """
+            ~ Initialize the renderer. ~
+
+            Arguments:
+                stream (obj) : Where to write. (Default: sys.stdout)
+
+            Attributes:
+                stream (obj)     : Where to write.
+                previous (array) : The last frame drawn, if any.
+        """
+
+        self.stream = stream or sys.stdout
+        self.previous = None
+
+    def render(self, cells):
+        """
+            ~ Draw a frame with one buffered write. ~
+
+            Arguments:
+                cells (ndarray) : Cell states of shape (height, width).
+        """
+
+        import numpy as np
+
+        previous = self.previous
+
+        if previous is None or previous.shape != cells.shape:
+            frame = HIDE_CURSOR + CLEAR + render_frame(cells)
+        else:
+            height, width = cells.shape
+            changed = np.flatnonzero(cells != previous)
+
+            # ~ Split the changes where the unchanged gap is long and
+            #   between rows. ~ #
+            breaks = np.flatnonzero((np.diff(changed) > GAP) |
+                                    (np.diff(changed//width) != 0))+1
+            starts = changed[np.r_[0, breaks]] if changed.size else changed
+            ends = changed[np.r_[breaks-1, -1]]+1 if changed.size else changed
+
+            # ~ Cells and moves written, against a whole frame's. ~ #
+            spans = int((ends-starts).sum()) + MOVE*starts.size
+
+            if spans >= height*(width+MOVE):
+                frame = render_frame(cells)
+            else:
+                frame = paint_spans(cells, starts, ends)[0]
+
+        self.previous = cells.copy()
+
+        if frame:
+            self.stream.write(frame)
+            self.stream.flush()
+
+    def close(self):
+        """ ~ Restore the cursor and colors and move below the frame. ~ """
+
+        height = 0 if self.previous is None else len(self.previous)
+
+        self.stream.write(RESET + SHOW_CURSOR + move(0, height))
+        self.stream.flush()
+
+
+class LoadingView:
+    """
+        ~ Draws a loading world row chunk by row chunk as its
+          LoadEvents arrive. ~
+
+        Methods:
+            __init__ : Initialize the view.
+            __call__ : Draw the rows of one LoadEvent.
+    """
+
+    def __init__(self, stream=None):
+        """
+            ~ Initialize the view. ~
+
+            Arguments:
+                stream (obj) : Where to write. (Default: sys.stdout)
+
+            Attributes:
+                stream (obj)    : Where to write.
+                started (bool)  : Whether the screen was cleared yet.
+        """
+
+        self.stream = stream or sys.stdout
+        self.started = False
+
+    def __call__(self, event):
+        """
+            ~ Draw the rows of one LoadEvent, leaving the rest untouched. ~
+
+            Arguments:
+                event (LoadEvent) : The rows that just loaded.
+        """
+
+        frame = [] if self.started else [CLEAR]
+        self.started = True
+
+        for y, row in enumerate(event.rows.tolist(), event.start):
+            frame.append(move(0, y))
+            frame.append("".join(map(CHARS.__getitem__, row)))
+
+        self.stream.write("".join(frame))
+        self.stream.flush()
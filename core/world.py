@@ -6,7 +6,7 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
                         more natural randomness.
                               File: world.py
                             Date: 2025/10/09
-                        Version: 2.5-2025.10.14
+                        Version: 2.6-2026.10.18
 
 ===============================================================================
 
@@ -31,18 +31,17 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
 # ~ Standard libraries. ~ #
 from threading import Thread
 import os
-import time
-import random
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from queue import Queue
-
-# ~ Third-party libraries. ~ #
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
-from colorama import Fore, Style, init
+import multiprocessing as mp
+from collections import namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from queue import Empty, Queue
+from time import perf_counter
 
 # ~ Custom modules. ~ #
 from core import quantum as q
+from core import engine as eng
+from core import rules
+from core import terminal
 
 
 # ~ Initialize GLOBAL Variables. ~ #
@@ -52,36 +51,99 @@ PATTERNS = {
     "block": [(0, 0), (1, 0), (0, 1), (1, 1)]
 }
 
-# ~ Initialize colorama with color reset. ~ #
-init(autoreset=True)
+# ~ Progress of a loading world: rows start-end just loaded, with their states. ~ #
+LoadEvent = namedtuple("LoadEvent", ["start", "end", "done", "total", "rows"])
+
+# ~ Worlds with fewer cells are initialized without a process pool. ~ #
+PROCESS_INIT_CELLS = 1 << 20
+
+# ~ Most cells drawn or unpacked at once while loading a world. ~ #
+BAND_CELLS = 1 << 22
+
+# ~ Quantum handler of an initialization worker process. ~ #
+_WORKER_QM = None
+
+
+def _init_worker():
+    """ ~ Give an initialization worker process its own simulator. ~ """
+
+    global _WORKER_QM
+
+    _WORKER_QM = q.QuantumMechanics(warm_up=True)
+
+
+def _quantum_rows(width, count):
+    """
+        ~ Flip the qubits for a chunk of rows in a worker process. ~
+
+        Arguments:
+            width (int) : Width of the world.
+            count (int) : Number of rows in the chunk.
+
+        Returns:
+            (ndarray) : The chunk's cell states packed 8 per byte.
+    """
+
+    import numpy as np
+
+    bits = np.atleast_1d(_WORKER_QM.q_flip(width*count)).astype(np.uint8)
 
+    return np.packbits(bits)
 
-class Cell:
+
+class CellView:
     """
-        ~ Handles the state and rendering of a Cell. ~
+        ~ A cell of a world, read live from the world's step engine. ~
+
+        ~ Holds no state of its own, so the cells themselves stay in the
+          engine's compact buffer. ~
 
         Methods:
-            __init__  : Initialize the Cell.
+            __init__  : Initialize the view.
             render    : Render the Cell with color.
+
+        Properties:
+            pos       : Position (x, y) of the cell.
+            state     : Current state of the cell.
     """
 
-    def __init__(self, x, y, state=None):
+    __slots__ = ("world", "x", "y")
+
+    def __init__(self, world, x, y):
         """
-            ~ Initialize the Cell and its variables. ~
+            ~ Initialize the view. ~
 
             Arguments:
-                x (int)            : The X coordinate of the Cell.
-                y (int)            : The Y coordinate of the Cell.
-                state (int | None) : The state of the cell.
-                                    (1 = Alive, 0 = Dead; Default: None)
+                world (World) : The world the cell lives in.
+                x (int)       : The X coordinate of the Cell.
+                y (int)       : The Y coordinate of the Cell.
+        """
 
-            Attributes:
-                pos (tuple): Position (x, y) of the cell.
-                state (int) : The state of the Cell.
+        self.world = world
+        self.x = x
+        self.y = y
+
+    @property
+    def pos(self):
+        """
+            ~ Position of the cell. ~
+
+            Returns:
+                (tuple) : Position (x, y) of the cell.
         """
 
-        self.pos = (x, y)
-        self.state = state
+        return (self.x, self.y)
+
+    @property
+    def state(self):
+        """
+            ~ Current state of the cell. ~
+
+            Returns:
+                (int) : The state of the cell. (1 = Alive, 0 = Dead)
+        """
+
+        return self.world.engine.get(self.x, self.y)
 
     def render(self):
         """
@@ -91,146 +153,468 @@ class Cell:
                 (str) : Colored character representation of the cell.
         """
 
-        if self.state:
-            color = Fore.MAGENTA
-            char = "█"
-        else:
-            color = Fore.RED
-            char = "."
+        state = self.state
+
+        return f"{terminal.COLORS[state]}{terminal.CHARS[state]}"
 
-        return f"{color}{char}"
 
-    
 class World:
     """
         ~ Handles the world grid, cell states and updates. ~
 
         Methods:
-            __init__       : Initialize the world.
-            init_states    : Initialize cell states.
-            pattern_select : Thread to select and queue patterns.
-            render         : Render the world.
-            seed_pattern   : Seed a pattern into the world.
-            check_cells    : Return neighbors of a cell.
-            update         : Update world with double-buffering.
+            __init__         : Initialize the world.
+            from_checkpoint  : Resume a world from a checkpoint file.
+            _load            : Load the world in the background.
+            _resume          : Restore the state saved in a checkpoint.
+            wait             : Block until the world has loaded.
+            init_states      : Initialize cell states on a worker pool.
+            _band_rows       : Rows per band when loading.
+            _draw_bands      : Draw the cell states a band at a time.
+            _draw_patterns   : Draw a batch of patterns to seed.
+            pattern_select   : Thread to select and queue patterns.
+            render           : Render the world.
+            seed_pattern     : Seed a pattern into the world.
+            cell             : View of a single cell.
+            check_cells      : Return neighbors of a cell.
+            update           : Update world with double-buffering.
+            _profiled_update : Update the world and record a sample.
+            advance          : Fast-forward the world many generations.
+            iter_generations : Update the world, yielding each generation.
+            snapshot         : Copy the state a checkpoint saves.
+            save_checkpoint  : Write a checkpoint of the world.
+            autosave         : Checkpoint every N generations.
+            detect_cycles    : Watch for the world repeating itself.
+            _observe         : Hand a generation to the cycle detector.
+
+        Properties:
+            grid             : Current cell states as an array.
+            cells            : Matrix of cell views.
     """
 
-    def __init__(self, width=10, height=10):
+    def __init__(self, width=10, height=10, engine="numpy", workers=1,
+                 on_progress=None, seeds_per_generation=1, seed_queue=64,
+                 entropy="quantum", seed=None, metrics=None, checkpoint=None,
+                 rule=None):
         """
             ~ Initialize the world. ~
 
+            ~ Returns right away; the cell states load in the background.
+              Wait on `loading` (or call `wait`) before updating. ~
+
             Arguments:
-                width (int)  : Width of the world. (Default: 10)
-                height (int) : Height of the world. (Default: 10)
+                width (int)                : Width of the world. (Default: 10)
+                height (int)               : Height of the world. (Default: 10)
+                engine (str)               : Step engine to run the world with.
+                                             ('numpy', 'bitpack', 'hashlife',
+                                              'sparse' or 'python';
+                                              Default: 'numpy')
+                workers (int)              : Processes stepping the world in
+                                             bands. (Default: 1)
+                on_progress (func)         : Called with a LoadEvent for every
+                                             chunk of rows loaded.
+                                             (Default: None)
+                seeds_per_generation (int) : Most patterns seeded per
+                                             generation; 0 turns seeding off.
+                                             (Default: 1)
+                seed_queue (int)           : Most patterns waiting to be
+                                             seeded. (Default: 64)
+                entropy (str | obj)        : Source of every random decision,
+                                             by name ('quantum', 'numpy' or
+                                             'os') or an EntropySource.
+                                             (Default: 'quantum')
+                seed (int | None)          : Seed of the 'numpy' source, which
+                                             makes runs reproducible.
+                                             (Default: None)
+                metrics (Metrics | None)   : Records profiling samples of
+                                             updates, seeding and circuits;
+                                             None turns profiling off.
+                                             (Default: None)
+                checkpoint (Checkpoint)    : Loaded checkpoint to resume from
+                                             instead of initializing the
+                                             cells. (Default: None)
+                rule (str | Rule)          : Birth and survival rule in B/S
+                                             notation ('B36/S23') or by
+                                             name ('highlife').
+                                             (Default: 'B3/S23')
 
             Variables:
-                qm (obj)             : Quantum mechanics handler.
-                width (int)          : Width of the world.
-                height (int)         : Height of the world.
-                states (int)         : Initialized states of the cells.
-                is_loaded (bool)     : Whether the world finished loading.
-                cells (2D Matrix)    : Matrix of cell objects.
-                new_cells (2D Matrix) : Matrix for double-buffering.
-                q (obj)              : Queue holding patterns to seed.
+                entropy (obj)              : Source of every random decision.
+                width (int)                : Width of the world.
+                height (int)               : Height of the world.
+                is_loaded (bool)           : Whether the world finished loading.
+                loading (Future)           : Resolves to the world once loaded.
+                engine (obj)               : Step engine holding the cells.
+                generation (int)           : Generations run since loading.
+                seeds_per_generation (int) : Patterns seeded per generation.
+                rule (Rule)                : Birth and survival rule.
+                q (obj)                    : Bounded queue of patterns to seed.
+                metrics (Metrics | None)   : Profiling samples, if enabled.
+                autosaver (AutoSaver)      : Periodic checkpoints, if enabled.
+                cycles (CycleDetector)     : Cycle detection, if enabled.
         """
 
-        self.qm = q.QuantumMechanics()
+        self.entropy = None
         self.width = width
         self.height = height
 
-        self.states = [[0]*self.width for _ in range(self.height)]
         self.is_loaded = False
+        self.loading = Future()
+        self.engine = None
+        self.generation = 0
+        self.seeds_per_generation = seeds_per_generation
+        self.rule = rules.parse(rule)
+        self.q = Queue(maxsize=max(1, seed_queue))
+        self.metrics = metrics
+        self.autosaver = None
+        self.cycles = None
 
         # ~ Initialize cell states in the background. ~ #
-        Thread(target=self.init_states, daemon=True).start()
+        Thread(target=self._load,
+               args=(engine, workers, on_progress, entropy, seed, checkpoint),
+               daemon=True).start()
+
+    @classmethod
+    def from_checkpoint(cls, path, engine=None, workers=None, **options):
+        """
+            ~ Resume a world from a checkpoint file. ~
+
+            ~ The cells, generation, seed queue and entropy state come from
+              the file, so init_states never runs. Like the constructor,
+              this returns right away and loads in the background. ~
+
+            Arguments:
+                path (str)    : The checkpoint file.
+                engine (str)  : Step engine. (Default: the saved engine)
+                workers (int) : Processes stepping the world.
+                                (Default: the saved count)
+                **options     : Other World arguments. The entropy source
+                                defaults to the saved one, and
+                                seeds_per_generation and rule to the
+                                saved values.
+
+            Returns:
+                (World) : The resuming world.
+        """
 
-        # ~ Loading animation. ~ #
-        while not self.is_loaded:
-            os.system("clear")
+        from core import checkpoint as ckpt
 
-            for y in range(self.height):
-                row = "".join("█" if cell else "." for cell in self.states[y])
-                print(row)
-                
-            time.sleep(0.1)
+        checkpoint = ckpt.load(path)
+        meta = checkpoint.meta
 
-        # ~ Initialize cell objects and buffers. ~ #
-        self.cells = [[Cell(x, y, self.states[y][x]) for x in range(width)]
-                        for y in range(height)]
-        self.new_cells = [[Cell(x, y, 0) for x in range(width)] 
-                        for y in range(height)]
-        self.q = Queue()
+        options.setdefault("entropy", meta.get("entropy", {}).get("name",
+                                                                 "quantum"))
+        options.setdefault("seeds_per_generation",
+                           meta.get("seeds_per_generation", 1))
+        options.setdefault("rule", meta.get("rule"))
 
-        Thread(target=self.pattern_select, daemon=True).start()
+        return cls(checkpoint.width, checkpoint.height,
+                   engine=engine or meta.get("engine", "numpy"),
+                   workers=workers or meta.get("workers", 1),
+                   checkpoint=checkpoint, **options)
 
-    def init_states(self, chunk=10):
+    def _load(self, engine, workers, on_progress, entropy, seed, checkpoint):
         """
-            ~ Initialize cell states in chunks using threads. ~
-            
+            ~ Load the world in the background and resolve `loading`. ~
+
             Arguments:
-                chunk : Number of rows per thread. (Default: 10)
+                engine (str)            : Step engine to run the world with.
+                workers (int)           : Processes stepping the world.
+                on_progress (func)      : Receives a LoadEvent per chunk of
+                                          rows.
+                entropy (str | obj)     : Entropy source or its name.
+                seed (int | None)       : Seed of the 'numpy' source.
+                checkpoint (Checkpoint) : Checkpoint to resume, if any.
         """
-        
-        cells = self.width*self.height
-        self.states = [[0]*self.width for _ in range(self.height)]
-        
-        def worker(start):
-            """
-                ~ Worker thread to initialize a chunk of rows. ~
 
-                Arguments:
-                    start : Start index of rows for this chunk.
-            """
+        try:
+            if isinstance(entropy, str):
+                from core import entropy as ent
 
-            end = min(start+chunk, self.height)
-            for y in range(start, end):
-                bits = self.qm.q_flip(self.width)
-                self.states[y] = bits
+                entropy = ent.create(entropy, seed)
 
-            print(f"Initialized rows {start+1}-{end}/{self.height}")
+            self.entropy = entropy
 
+            # ~ Profile the simulator's circuits too. ~ #
+            qm = getattr(entropy, "qm", None)
 
-        threads = []
-        for start in range(0, self.height, chunk):
-            t = Thread(target=worker, args=(start,))
-            t.start()
-            threads.append(t)
+            if self.metrics is not None and qm is not None:
+                qm.metrics = self.metrics
 
-        for t in threads:
-            t.join()
+            # ~ The cell states load straight into the step engine. ~ #
+            self.engine = eng.create(engine, self.width, self.height, workers,
+                                     self.rule)
+
+            if checkpoint is None:
+                self.init_states(progress=on_progress)
+            else:
+                self._resume(checkpoint, on_progress)
+        except BaseException as error:
+            self.loading.set_exception(error)
+            return
 
         self.is_loaded = True
 
-        print("World state initialized!")
+        # ~ Reproducible sources draw their patterns in step instead. ~ #
+        if self.seeds_per_generation > 0 and not self.entropy.reproducible:
+            Thread(target=self.pattern_select, daemon=True).start()
+
+        self.loading.set_result(self)
+
+    def _resume(self, checkpoint, progress=None):
+        """
+            ~ Restore the cells, generation, seed queue and entropy state
+              saved in a checkpoint. ~
+
+            Arguments:
+                checkpoint (Checkpoint) : The loaded checkpoint.
+                progress (func)         : Called with a LoadEvent for every
+                                          band of rows. (Default: None)
+        """
+
+        if (checkpoint.width, checkpoint.height) != (self.width, self.height):
+            raise ValueError(f"The checkpoint is {checkpoint.width}x"
+                             f"{checkpoint.height}, not {self.width}x"
+                             f"{self.height}!")
+
+        meta = checkpoint.meta
+        saved = meta.get("entropy", {})
+
+        if saved.get("name") == self.entropy.name:
+            self.entropy.restore(saved.get("state"))
+
+        self.generation = checkpoint.generation
+
+        for pattern, x, y in meta.get("queue", []):
+            if not self.q.full():
+                self.q.put_nowait(([tuple(pos) for pos in pattern], x, y))
+
+        from core import checkpoint as ckpt
+
+        def bands():
+            """ ~ Unpack the saved cells a band of rows at a time. ~ """
+
+            step = self._band_rows()
+
+            for start in range(0, self.height, step):
+                end = min(start+step, self.height)
+                rows = ckpt.unpack(checkpoint, start, end)
+
+                yield start, rows
+
+                if progress:
+                    progress(LoadEvent(start, end, end, self.height, rows))
+
+        self.engine.load_bands(bands())
+
+    def wait(self, timeout=None):
+        """
+            ~ Block until the world has loaded. ~
+
+            Arguments:
+                timeout (float) : Most seconds to wait. (Default: None)
+
+            Returns:
+                (World) : This world, once loaded.
+        """
+
+        return self.loading.result(timeout)
+
+    @property
+    def grid(self):
+        """
+            ~ The current cell states as a uint8 array. ~
+
+            Returns:
+                (ndarray) : Cell states of shape (height, width).
+        """
+
+        return self.engine.array()
+
+    @property
+    def cells(self):
+        """
+            ~ The world as a matrix of cell views. ~
+
+            ~ Prefer `cell` or `grid`; this builds one view per cell. ~
+
+            Returns:
+                (2D Matrix) : Matrix of CellView objects.
+        """
+
+        return [[CellView(self, x, y) for x in range(self.width)]
+                for y in range(self.height)]
+
+    def cell(self, x, y):
+        """
+            ~ View of a single cell, wrapped onto the torus. ~
+
+            Arguments:
+                x (int) : The X coordinate of the cell.
+                y (int) : The Y coordinate of the cell.
+
+            Returns:
+                (CellView) : The cell, read live from the engine.
+        """
+
+        return CellView(self, x%self.width, y%self.height)
+
+    def init_states(self, chunk=None, workers=None, progress=None,
+                    entropy=None):
+        """
+            ~ Initialize the engine's cell states from an entropy source. ~
+
+            ~ The cells are drawn a band of rows at a time and loaded into
+              the engine as each band arrives, so the world is never held
+              as one byte per cell outside it. Large worlds on a pooled
+              source (quantum) are flipped in chunks of rows on a bounded
+              pool of worker processes, each with its own simulator. Small
+              worlds are flipped in this process, where the pool's start-up
+              would cost more than it saves. ~
+
+            Arguments:
+                chunk (int)      : Number of rows per band. (Default: 10 on
+                                   a pooled source, otherwise up to
+                                   BAND_CELLS cells' worth)
+                workers (int)    : Worker processes; more than 1 needs a
+                                   pooled source. (Default: CPU count for
+                                   large worlds on a pooled source,
+                                   otherwise 1)
+                progress (func)  : Called with a LoadEvent for every band
+                                   of rows initialized. (Default: None)
+                entropy (obj)    : Entropy source. (Default: the world's)
+        """
+
+        entropy = entropy or self.entropy
+
+        # ~ Worker processes flip qubits; they can't draw from the others. ~ #
+        if workers is not None and workers > 1 and not entropy.pooled:
+            raise ValueError(f"The {entropy.name} entropy source can't be "
+                             "drawn on worker processes!")
+
+        self.engine.load_bands(self._draw_bands(chunk, workers, progress,
+                                                entropy))
+
+    def _band_rows(self):
+        """
+            ~ Rows per band when loading without a process pool. ~
+
+            ~ A multiple of 32, so a source drawing whole 32-bit words
+              gives the same cells a band at a time as for the whole grid
+              at once. ~
+
+            Returns:
+                (int) : Rows per band.
+        """
+
+        return max(32, BAND_CELLS//max(1, self.width)//32*32)
+
+    def _draw_bands(self, chunk, workers, progress, entropy):
+        """
+            ~ Draw the cell states a band of rows at a time. ~
+
+            Arguments:
+                chunk (int | None) : Number of rows per band.
+                workers (int)      : Worker processes, or None.
+                progress (func)    : Called with a LoadEvent after every
+                                     band is loaded.
+                entropy (obj)      : Entropy source.
+
+            Yields:
+                (tuple) : The band's first row and its cell states.
+        """
+
+        cells = self.width*self.height
+
+        if chunk is None:
+            chunk = 10 if entropy.pooled else self._band_rows()
+
+        chunks = [(start, min(start+chunk, self.height))
+                  for start in range(0, self.height, chunk)]
+        done = 0
+
+        if workers is None:
+            pooled = entropy.pooled and cells >= PROCESS_INIT_CELLS
+            workers = os.cpu_count() if pooled else 1
+
+        if workers <= 1:
+            for start, end in chunks:
+                bits = entropy.bits(self.width*(end-start))
+                rows = bits.reshape(end-start, self.width)
+
+                yield start, rows
+
+                done += end-start
+                if progress:
+                    progress(LoadEvent(start, end, done, self.height, rows))
+            return
+
+        import numpy as np
+
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   mp_context=mp.get_context("spawn"),
+                                   initializer=_init_worker)
+
+        with pool:
+            futures = {pool.submit(_quantum_rows, self.width, end-start):
+                       (start, end) for start, end in chunks}
+
+            for future in as_completed(futures):
+                start, end = futures[future]
+                size = (end-start)*self.width
+                bits = np.unpackbits(future.result(), count=size)
+                rows = bits.reshape(end-start, self.width)
+
+                yield start, rows
+
+                done += end-start
+                if progress:
+                    progress(LoadEvent(start, end, done, self.height, rows))
+
+    def _draw_patterns(self, count):
+        """
+            ~ Draw a batch of weighted patterns and where to seed them. ~
+
+            Arguments:
+                count (int) : How many patterns to draw.
+
+            Returns:
+                (list) : (pattern, x, y) for every pattern.
+        """
+
+        names = list(PATTERNS.keys())
+        weights = [5, 1, 1]
+
+        patterns = self.entropy.choice(names, weights, count=count)
+        xs = self.entropy.randint(self.width-1, 0, count=count)
+        ys = self.entropy.randint(self.height-1, 0, count=count)
+
+        return [(PATTERNS[name], x, y) for name, x, y in zip(patterns, xs, ys)]
 
     def pattern_select(self):
         """
             ~ Randomly select and queue patterns for the world. ~
 
-            ~ Patterns are biased by weight. ~
+            ~ Patterns are biased by weight and drawn a generation's worth
+              at a time. The queue is bounded, so this blocks while it is
+              full instead of spinning. ~
         """
 
-        weights = [5, 1, 1]
         while True:
-            pattern = self.qm.q_choice(list(PATTERNS.keys()), weights)
-            pattern = PATTERNS[pattern]
-            x = self.qm.q_randint(self.width-1, 0)
-            y = self.qm.q_randint(self.height-1, 0)
-
-            self.q.put((pattern, x, y))
+            for item in self._draw_patterns(max(1, self.seeds_per_generation)):
+                self.q.put(item)
 
     def render(self):
         """ ~ Render the world to the screen. ~ """
 
-        output = ""
+        output = []
+        color = None
 
-        for y in range(self.height):
-            for x in range(self.width):
-                output += self.cells[y][x].render()
+        for row in self.grid:
+            text, color = terminal.paint(row, color)
+            output.append(text)
 
-            output += "\n"
-
-        print(output)
+        print("\n".join(output) + terminal.RESET)
 
     def seed_pattern(self, pattern, top_left_x, top_left_y):
         """
@@ -242,11 +626,20 @@ class World:
                 top_left_y (int) : Patterns top left position of Y.
         """
 
+        start = perf_counter()
+        points = []
+
         for pos in pattern:
             x = (top_left_x+pos[0])%self.width
             y = (top_left_y+pos[1])%self.height
 
-            self.cells[y][x].state = 1
+            points.append((x, y))
+
+        self.engine.seed(points)
+
+        if self.metrics is not None:
+            self.metrics.record("seed", perf_counter()-start,
+                                cells=len(points))
 
     def check_cells(self, cell):
         """
@@ -256,47 +649,255 @@ class World:
                 cell (obj) : The cell to check the neighbors of.
 
             Returns:
-                (array) : All of the cells neighbors.
+                (array) : Views of all of the cells neighbors.
         """
 
-        neighbors = []
         x, y = cell.pos
-        pos = (-1, 0, 1)
+        table = eng.torus(self.width, self.height)
+        index = y*self.width+x
+
+        # ~ Only edge cells wrap; interior cells add fixed offsets. ~ #
+        around = table.edges.get(index)
 
-        for pos_y in pos:
-            for pos_x in pos:
-                if pos_x == 0 and pos_y == 0:
-                    continue
+        if around is None:
+            around = [index+offset for offset in table.offsets]
 
-                neigh_x, neigh_y = (x+pos_x)%self.width, (y+pos_y)%self.height
+        return [CellView(self, *divmod(neighbor, self.width)[::-1])
+                for neighbor in around]
 
-                if 0 <= neigh_x < self.width and 0 <= neigh_y < self.height:
-                    neighbors.append(self.cells[neigh_y][neigh_x])
+    def _seed_queued(self):
+        """
+            ~ Seed up to one generation's budget of queued patterns. ~
+
+            ~ A reproducible entropy source has no producer thread; its
+              patterns are drawn right here, after any left in the queue
+              by a checkpoint, so the same seed always seeds the same
+              generations. ~
+        """
+
+        budget = self.seeds_per_generation
+
+        for _ in range(budget):
+            try:
+                pattern, x, y = self.q.get_nowait()
+            except Empty:
+                break
+
+            self.seed_pattern(pattern, x, y)
+            budget -= 1
 
-        return neighbors
+        if budget > 0 and self.entropy.reproducible:
+            for pattern, x, y in self._draw_patterns(budget):
+                self.seed_pattern(pattern, x, y)
 
     def update(self):
         """ ~ Update the world with a double-buffer and seeded patterns. ~ """
 
-        # ~ Seed patterns from the queue. ~ #
-        while not self.q.empty():
-            pattern, x, y = self.q.get()
+        if self.metrics is not None:
+            self._profiled_update()
+            return
 
-            self.seed_pattern(pattern, x, y)
+        # ~ Seed patterns from the queue. ~ #
+        self._seed_queued()
 
         # ~ Update cell states based on neighbors. ~ #
-        for y in range(self.height):
-            for x in  range(self.width):
-                cell = self.cells[y][x]
-                live = sum(1 for c in self.check_cells(cell) if c.state)
-                new_state = cell.state
-
-                if cell.state and (live < 2 or live > 3):
-                        new_state = 0
-                elif not cell.state and live == 3:
-                        new_state = 1
-
-                self.new_cells[y][x].state = new_state
-        
-        self.cells, self.new_cells = self.new_cells, self.cells
+        self.engine.step()
+        self.generation += 1
+
+        if self.cycles is not None:
+            self._observe()
+        if self.autosaver is not None:
+            self.autosaver.tick()
+
+    def _profiled_update(self):
+        """ ~ Update the world and record how it went. ~ """
+
+        import numpy as np
+
+        start = perf_counter()
+        self._seed_queued()
+        seeded = perf_counter()
+
+        # ~ Copied outside the timings, to count births and deaths. ~ #
+        before = self.grid.copy()
+        stepping = perf_counter()
+
+        self.engine.step()
+        self.generation += 1
+        done = perf_counter()
+
+        after = self.grid
+
+        self.metrics.record(
+            "update", (seeded-start)+(done-stepping),
+            generation=self.generation,
+            seed_seconds=seeded-start,
+            step_seconds=done-stepping,
+            population=int(np.count_nonzero(after)),
+            births=int(np.count_nonzero(after > before)),
+            deaths=int(np.count_nonzero(before > after)),
+            queue=self.q.qsize(),
+        )
+
+        if self.cycles is not None:
+            self._observe()
+        if self.autosaver is not None:
+            self.autosaver.tick()
+
+    def advance(self, generations):
+        """
+            ~ Fast-forward the world many generations at once. ~
+
+            ~ One generation's patterns are seeded before the jump; none are
+              seeded while it runs. With the 'hashlife' engine this jumps
+              2^k generations per step instead of stepping one by one. ~
+
+            Arguments:
+                generations (int) : Number of generations to advance.
+        """
+
+        self._seed_queued()
+
+        self.engine.advance(generations)
+        self.generation += generations
+
+        # ~ Periods found across a jump may be multiples of the real one. ~ #
+        if self.cycles is not None:
+            self._observe()
+
+    def iter_generations(self, generations=None):
+        """
+            ~ Update the world, yielding every generation it passes
+              through, the current one first. ~
+
+            ~ The yielded cells may be a view of the engine's buffer; copy
+              them to keep them past the next generation. ~
+
+            Arguments:
+                generations (int | None) : Generations to run; None runs
+                                           until the caller stops.
+                                           (Default: None)
+
+            Yields:
+                (tuple) : The generation's number and its cell states.
+        """
+
+        yield self.generation, self.grid
+
+        count = 0
+
+        while generations is None or count < generations:
+            self.update()
+            count += 1
+
+            yield self.generation, self.grid
+
+    def snapshot(self):
+        """
+            ~ Copy everything a checkpoint saves, on the calling thread. ~
+
+            Returns:
+                (tuple) : Copied cell states, the generation and a dict of
+                          the engine, seed queue and entropy state.
+        """
+
+        name = self.engine.name
+        workers = getattr(self.engine, "workers", 1)
+
+        # ~ The parallel engine is the numpy engine over several workers. ~ #
+        if name == "parallel":
+            name = "numpy"
+
+        with self.q.mutex:
+            queue = [[[list(pos) for pos in pattern], x, y]
+                     for pattern, x, y in self.q.queue]
+
+        meta = {
+            "engine": name,
+            "workers": workers,
+            "seeds_per_generation": self.seeds_per_generation,
+            "rule": rules.notation(self.rule),
+            "entropy": {"name": self.entropy.name,
+                        "state": self.entropy.state()},
+            "queue": queue,
+        }
+
+        return self.grid.copy(), self.generation, meta
+
+    def save_checkpoint(self, path, compression="zlib"):
+        """
+            ~ Write a checkpoint of the world. ~
+
+            Arguments:
+                path (str)        : Where to write.
+                compression (str) : 'none', 'zlib' or 'rle'. (Default: 'zlib')
+        """
+
+        from core import checkpoint as ckpt
+
+        cells, generation, meta = self.snapshot()
+
+        ckpt.save(path, cells, generation, meta, compression)
+
+    def autosave(self, path, every, compression="zlib"):
+        """
+            ~ Checkpoint the world every N generations in the background. ~
+
+            Arguments:
+                path (str)        : Where to write; each checkpoint replaces
+                                    the last.
+                every (int)       : Generations between checkpoints.
+                compression (str) : 'none', 'zlib' or 'rle'. (Default: 'zlib')
+
+            Returns:
+                (AutoSaver) : The saver; close it to wait for the last write
+                              and raise its error, if any.
+        """
+
+        from core import checkpoint as ckpt
+
+        self.autosaver = ckpt.AutoSaver(self, path, every, compression)
+
+        return self.autosaver
+
+    def detect_cycles(self, max_period=64, on_cycle=None):
+        """
+            ~ Watch for the world returning to a state it was in up to
+              `max_period` generations ago. ~
+
+            ~ Once a cycle is found, `cycles.cycle` holds it. With seeding
+              on, a cycle only means a state came back; the next pattern
+              may still break it. ~
+
+            Arguments:
+                max_period (int) : Longest period to detect. (Default: 64)
+                on_cycle (func)  : Called with the first Cycle found.
+                                   (Default: None)
+
+            Returns:
+                (CycleDetector) : The detector.
+        """
+
+        from core import cycles as cyc
+
+        self.cycles = cyc.CycleDetector(max_period, on_cycle)
+        self.cycles.observe(self.generation, self.grid)
+
+        if self.engine.reports_changes:
+            self.engine.on_change = self.cycles.change
+
+        return self.cycles
+
+    def _observe(self):
+        """
+            ~ Hand the generation to the cycle detector. ~
+
+            ~ The cells are only passed, and hashed from scratch, when the
+              engine does not report the words it changes. ~
+        """
+
+        if self.engine.reports_changes:
+            self.cycles.observe(self.generation)
+        else:
+            self.cycles.observe(self.generation, self.grid)
 
@@ -6,7 +6,7 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
                         more natural randomness.
                               File: main.py
                             Date: 2025/10/09
-                        Version: 2.5-2025.10.14
+                        Version: 2.6-2026.10.18
 
 ===============================================================================
 
@@ -30,10 +30,12 @@ Description: A recreation of Conway's Game of Life using Quantum Computing for
 # ~ Standard libraries. ~ #
 import time
 import os
+import sys
 
 # ~ Custom modules. ~ #
 from core import world
-from core import gui
+from core import terminal
+from core import scheduler
 
 
 class Main:
@@ -44,32 +46,60 @@ class Main:
             __init__    : Initialize the main loop.
             init_gui    : Initialize the graphical GUI Window.
             kill        : Stop the main loop.
+            _new_frame  : Take the latest generation to draw.
             render_text : Render simulation as a text-based terminal display.
             render_gui  : Render simulation as a pygame GUI
             execute     : Execute the main loop.
     """
 
-    def __init__(self, render_type='text'):
+    def __init__(self, render_type='text', gps=None, fps=30, metrics=None):
         """
             ~ Initialize program variables. ~
 
             Arguments:
                 render_type (str) : Determines how the program will be rendered
                                     (Default is 'text')
+                gps (float)       : Target generations per second; None runs
+                                    at full engine speed. (Default: None)
+                fps (float)       : Target frames per second; None renders as
+                                    fast as possible. (Default: 30)
+                metrics (obj)     : Records profiling samples of the world
+                                    and the renderer; None turns profiling
+                                    off. (Default: None)
         
             Attributes:
                 width (int)      : Terminal width in columns.
                 height (int)     : Terminal height in lines.
                 world (World)    : Instance of the World class.
+                terminal (obj)   : Diff-based terminal renderer.
+                gps (float)      : Target generations per second.
+                fps (float)      : Target frames per second.
+                simulation (obj) : Steps the world on its own thread.
+                metrics (obj)    : Profiling samples, if enabled.
+                _frame (tuple)   : The last generation drawn.
                 _running (bool)  : Tracks if the program is running.
                 _gui_init (bool) : Tracks if the GUI has been initialized.
         """
 
+        if render_type == "text":
+            # ~ ANSI colors need translating on older Windows consoles. ~ #
+            import colorama
+
+            colorama.just_fix_windows_console()
+
         term_size = os.get_terminal_size()
         self.width, self.height = term_size.columns, term_size.lines
 
         self.render_type = render_type
-        self.world = world.World(self.width, self.height)
+        self.world = world.World(self.width, self.height,
+                                 on_progress=terminal.LoadingView(),
+                                 metrics=metrics)
+        self.terminal = terminal.TerminalRenderer()
+        self.gps = gps
+        self.fps = fps
+        self.simulation = None
+        self.metrics = metrics
+        self._frame = None
         self._running = True
         self._gui_init = False
 
@@ -77,6 +107,7 @@ class Main:
         """ ~ Initialize the pygame GUI window. ~ """
 
         import pygame as pg
+        from core import gui
         
         pg.init()
 
@@ -87,42 +118,80 @@ class Main:
         """ ~ Stop the main loop. ~ """
         self._running = False
 
+    def _new_frame(self):
+        """
+            ~ Take the latest generation if it has not been drawn yet. ~
+
+            Returns:
+                (ndarray | None) : Its cell states, or None if already drawn.
+        """
+
+        frame = self.simulation.frame()
+
+        if frame is self._frame:
+            return None
+
+        self._frame = frame
+
+        return frame[1]
+
     def render_text(self):
         """
             ~ Render the simulation as text in the terminal. ~
 
-            The world is rendered and then updated.
+            Only the cells that changed since the last frame are redrawn.
+            The world is stepped by the simulation thread.
         """
 
-        self.world.render()
-        self.world.update()
+        cells = self._new_frame()
 
-        os.system('clear')  # ~ Clear the terminal for the next frame. ~ #
-        #time.sleep(1)      # ~ Uncomment to slow down text rendering. ~ #
+        if cells is not None:
+            start = time.perf_counter()
+            self.terminal.render(cells)
+
+            if self.metrics is not None:
+                self.metrics.record("render", time.perf_counter()-start,
+                                    mode="text", generation=self._frame[0])
 
     def render_gui(self):
         """
             ~ Render the simulation as a graphical pygame GUI ~
 
-            Handles window rendering, events, and world updates.
+            Handles window rendering and events. The world is stepped by
+            the simulation thread.
         """
 
-        self.window.render(self.world)
+        cells = self._new_frame()
+
+        if cells is not None:
+            start = time.perf_counter()
+            self.window.render(self.world, cells)
+
+            if self.metrics is not None:
+                self.metrics.record("render", time.perf_counter()-start,
+                                    mode="gui", generation=self._frame[0])
         self.window.handle_events()
-        self.world.update()
 
     def execute(self):
         """
             ~ Run the main game loop. ~
 
-            Checks if the world is loaded and renders depending
-            on the selected type.
+            Waits for the world to load, starts stepping it on its own
+            thread at the target generation rate and renders the latest
+            generation at the target frame rate, skipping frames when
+            rendering falls behind.
 
             Initializes the GUI if needed.
         """
 
-        while self._running:
-            if self.world.is_loaded:
+        self.world.wait()
+
+        self.simulation = scheduler.Simulation(self.world, self.gps)
+        self.simulation.start()
+        ticker = scheduler.Ticker(self.fps)
+
+        try:
+            while self._running:
                 if self.render_type == "text":
                     self.render_text()
                 elif self.render_type == "gui":
@@ -130,8 +199,21 @@ class Main:
                         self.init_gui()
                     self.render_gui()
 
+                ticker.wait()
+        finally:
+            self.simulation.stop()
+
+            if self.render_type == "text":
+                self.terminal.close()
+
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # ~ Any arguments run the headless batch mode instead of the menu. ~ #
+        from core import batch
+
+        sys.exit(batch.main(sys.argv[1:]))
+
     os.system('clear') # TODO: Make a helper function for cross-platform.
     # TODO: Consider adding a menu function  for cleaner input handling.
     print("""
@@ -0,0 +1,206 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_checkpoint.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Checkpoints round-trip the cells and the world, and a resumed world runs
+    on exactly as one that never stopped.
+"""
+
+
+# ~ Standard libraries. ~ #
+import os
+import tempfile
+import unittest
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import checkpoint as ckpt
+from core import world
+
+
+class CheckpointTest(unittest.TestCase):
+    """
+        ~ Saves and loads checkpoints and resumes worlds from them. ~
+
+        Methods:
+            setUp              : Make a folder for the checkpoints.
+            tearDown           : Remove it.
+            test_round_trip    : Every compression on awkward sizes.
+            test_bands         : unpack reads any band of rows.
+            test_bad_file      : Files that aren't checkpoints are refused.
+            test_resume        : A resumed world matches an unbroken run.
+            test_autosave      : Checkpoints every N generations.
+            test_autosave_fail : A failed checkpoint is counted and raised.
+    """
+
+    def setUp(self):
+        """ ~ Make a folder for the checkpoints. ~ """
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "world.ckpt")
+
+    def tearDown(self):
+        """ ~ Remove the folder. ~ """
+
+        self.folder.cleanup()
+
+    def test_round_trip(self):
+        """ ~ Cells, generation and meta survive every compression. ~ """
+
+        rng = np.random.default_rng(0)
+        meta = {"rule": "B36/S23", "queue": [[[[0, 1]], 2, 3]]}
+
+        for compression in ckpt.COMPRESSIONS:
+            for width, height in [(1, 1), (13, 7), (8, 3), (100, 33)]:
+                with self.subTest(compression=compression, width=width,
+                                  height=height):
+                    cells = (rng.random((height, width)) < 0.4)
+                    cells = cells.astype(np.uint8)
+
+                    ckpt.save(self.path, cells, 42, meta, compression)
+                    loaded = ckpt.load(self.path)
+
+                    self.assertEqual((loaded.width, loaded.height),
+                                     (width, height))
+                    self.assertEqual(loaded.generation, 42)
+                    self.assertEqual(loaded.compression, compression)
+                    self.assertEqual(loaded.meta, meta)
+                    np.testing.assert_array_equal(ckpt.unpack(loaded), cells)
+
+                    # ~ The memory map must let go before the next save. ~ #
+                    del loaded
+
+    def test_bands(self):
+        """ ~ Unpacking a band of rows gives just those rows. ~ """
+
+        cells = np.random.default_rng(1).random((20, 11)) < 0.5
+
+        ckpt.save(self.path, cells, compression="none")
+        loaded = ckpt.load(self.path)
+
+        for start, end in [(0, 1), (3, 9), (19, 20)]:
+            with self.subTest(start=start, end=end):
+                np.testing.assert_array_equal(
+                    ckpt.unpack(loaded, start, end), cells[start:end])
+
+        del loaded
+
+    def test_bad_file(self):
+        """ ~ A file that isn't a checkpoint raises a ValueError. ~ """
+
+        with open(self.path, "wb") as file:
+            file.write(b"\0"*ckpt.HEADER.size)
+
+        with self.assertRaises(ValueError):
+            ckpt.load(self.path)
+
+        with self.assertRaises(ValueError):
+            ckpt.save(self.path, np.zeros((2, 2)), compression="lzma")
+
+    def test_resume(self):
+        """ ~ Stopping at a checkpoint and resuming changes nothing. ~ """
+
+        options = {"entropy": "numpy", "seed": 5, "seeds_per_generation": 2,
+                   "rule": "highlife"}
+
+        for engine in ("numpy", "python"):
+            for compression in ckpt.COMPRESSIONS:
+                with self.subTest(engine=engine, compression=compression):
+                    unbroken = world.World(37, 21, engine=engine,
+                                           **options).wait()
+
+                    for _ in range(30):
+                        unbroken.update()
+
+                    first = world.World(37, 21, engine=engine,
+                                        **options).wait()
+
+                    for _ in range(12):
+                        first.update()
+
+                    first.save_checkpoint(self.path, compression)
+
+                    resumed = world.World.from_checkpoint(self.path).wait()
+
+                    self.assertEqual(resumed.engine.name, engine)
+                    self.assertEqual(resumed.rule, unbroken.rule)
+
+                    for _ in range(18):
+                        resumed.update()
+
+                    self.assertEqual(resumed.generation, 30)
+                    np.testing.assert_array_equal(resumed.grid,
+                                                  unbroken.grid)
+
+                    del resumed
+
+    def test_autosave(self):
+        """ ~ The autosaver leaves the last generation due a checkpoint. ~ """
+
+        life = world.World(20, 10, entropy="numpy", seed=2,
+                           seeds_per_generation=0).wait()
+        saver = life.autosave(self.path, 5)
+
+        for _ in range(12):
+            life.update()
+
+        saver.close()
+
+        # ~ Generation 10 is skipped if 5 is still being written. ~ #
+        self.assertEqual(saver.saved+saver.skipped, 2)
+        self.assertEqual(saver.failed, 0)
+        self.assertEqual(ckpt.load(self.path).generation,
+                         5 if saver.skipped else 10)
+
+    def test_autosave_fail(self):
+        """ ~ A checkpoint that can't be written raises, and is counted. ~ """
+
+        path = os.path.join(self.folder.name, "missing", "world.ckpt")
+        life = world.World(20, 10, entropy="numpy", seed=2,
+                           seeds_per_generation=0).wait()
+        saver = life.autosave(path, 1)
+
+        with self.assertRaises(OSError):
+            for _ in range(5):
+                life.update()
+                saver._pending.exception()
+
+        self.assertEqual(saver.failed, 1)
+
+        # ~ The next one fails as well, and close raises it. ~ #
+        life.update()
+
+        with self.assertRaises(OSError):
+            saver.close()
+
+        self.assertEqual(saver.failed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_cycles.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Cycle detection, alone and in batch runs.
+"""
+
+
+# ~ Standard libraries. ~ #
+import os
+import tempfile
+import unittest
+
+# ~ Custom modules. ~ #
+from core import batch
+from core import cycles as cyc
+from core import engine as eng
+from core import stream as stm
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Live cells of small patterns, as (x, y). ~ #
+BLOCK = [(1, 1), (2, 1), (1, 2), (2, 2)]
+BLINKER = [(1, 2), (2, 2), (3, 2)]
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+# ~ Engines that report their changed words, and ones that don't. ~ #
+ENGINES = ["numpy", "bitpack", "sparse", "python"]
+
+# ~ A 16x16 soup that settles into a still life at generation 141. ~ #
+SOUP = {"width": 16, "height": 16, "entropy": "numpy", "seed": 1,
+        "seeds_per_generation": 0, "stop_on_cycle": 8}
+
+
+def watch(name, width, height, points, max_period, generations):
+    """
+        ~ Step a pattern on an engine and watch it with a detector. ~
+
+        Arguments:
+            name (str)        : Name of the engine.
+            width (int)       : Width of the world.
+            height (int)      : Height of the world.
+            points (list)     : Live cells, as (x, y).
+            max_period (int)  : Longest period to detect.
+            generations (int) : Generations to step.
+
+        Returns:
+            (tuple) : The detector and every Cycle handed to on_cycle.
+    """
+
+    engine = eng.create(name, width, height)
+    engine.load([[0]*width for _ in range(height)])
+    engine.seed(points)
+
+    found = []
+    detector = cyc.CycleDetector(max_period, found.append)
+    detector.observe(0, engine.array())
+
+    if engine.reports_changes:
+        engine.on_change = detector.change
+
+    for generation in range(1, generations+1):
+        engine.step()
+        detector.observe(generation,
+                         None if engine.reports_changes else engine.array())
+
+    return detector, found
+
+
+class CycleDetectorTest(unittest.TestCase):
+    """
+        ~ Finds the periods of known patterns. ~
+
+        Methods:
+            test_still_life : A block repeats every generation.
+            test_blinker    : A blinker repeats every other generation.
+            test_glider     : A glider comes home after crossing the torus.
+            test_too_long   : Periods past max_period go unnoticed.
+            test_reset      : A reset detector starts over.
+            test_errors     : Bad periods and missing cells are refused.
+    """
+
+    def test_still_life(self):
+        """ ~ A block closes a cycle of period 1 straight away. ~ """
+
+        for name in ENGINES:
+            with self.subTest(engine=name):
+                detector, found = watch(name, 6, 6, BLOCK, 8, 5)
+
+                self.assertEqual(detector.cycle, cyc.Cycle(0, 1, 1))
+                self.assertEqual(found, [cyc.Cycle(0, 1, 1)])
+
+    def test_blinker(self):
+        """ ~ A blinker closes a cycle of period 2. ~ """
+
+        for name in ENGINES:
+            with self.subTest(engine=name):
+                detector, found = watch(name, 5, 5, BLINKER, 8, 6)
+
+                self.assertEqual(detector.cycle, cyc.Cycle(0, 2, 2))
+                self.assertEqual(len(found), 1)
+
+    def test_glider(self):
+        """ ~ A glider on an NxN torus is back after 4N generations. ~ """
+
+        for name in ENGINES:
+            for size in (8, 13):
+                with self.subTest(engine=name, size=size):
+                    period = 4*size
+                    detector, _ = watch(name, size, size, GLIDER, 64,
+                                        period+3)
+
+                    self.assertEqual(detector.cycle,
+                                     cyc.Cycle(0, period, period))
+
+    def test_too_long(self):
+        """ ~ A cycle longer than max_period is not reported. ~ """
+
+        for name in ("numpy", "bitpack"):
+            with self.subTest(engine=name):
+                detector, found = watch(name, 8, 8, GLIDER, 31, 70)
+
+                self.assertIsNone(detector.cycle)
+                self.assertEqual(found, [])
+
+    def test_reset(self):
+        """ ~ After a reset the same cycle is found again. ~ """
+
+        detector, _ = watch("numpy", 5, 5, BLINKER, 8, 3)
+        detector.reset()
+
+        self.assertIsNone(detector.cycle)
+        self.assertIsNone(detector.hash)
+
+        engine = eng.create("numpy", 5, 5)
+        engine.load([[0]*5 for _ in range(5)])
+        engine.seed(BLINKER)
+
+        for generation in range(10, 13):
+            detector.observe(generation, engine.array())
+            engine.step()
+
+        self.assertEqual(detector.cycle, cyc.Cycle(10, 2, 12))
+
+    def test_errors(self):
+        """ ~ Bad periods and a first generation without cells raise. ~ """
+
+        with self.assertRaises(ValueError):
+            cyc.CycleDetector(0)
+
+        with self.assertRaises(ValueError):
+            cyc.CycleDetector().observe(0)
+
+
+class BatchCycleTest(unittest.TestCase):
+    """
+        ~ Batch runs stop once the world cycles. ~
+
+        Methods:
+            test_stream : A streamed run stops where a stepped one does.
+    """
+
+    def test_stream(self):
+        """ ~ Streaming a run doesn't skip the cycle check. ~ """
+
+        stepped = batch.run(generations=2000, **SOUP)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "run.life")
+            streamed = batch.run(generations=2000, stream=path, **SOUP)
+
+            reader = stm.StreamReader(path)
+
+            try:
+                written = reader.generations
+            finally:
+                reader.close()
+
+        self.assertIsNotNone(stepped["cycle"])
+        self.assertLess(stepped["generations"], 2000)
+        self.assertEqual(streamed["cycle"], stepped["cycle"])
+        self.assertEqual(streamed["generations"], stepped["generations"])
+        self.assertEqual(written[-1], stepped["generations"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,490 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_engine.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Every engine is checked cell for cell against the pure-Python engine on
+    random tori of awkward sizes, and every engine and the Python engine
+    against a port of the original per-cell loop of World.update.
+"""
+
+
+# ~ Standard libraries. ~ #
+import itertools
+import random
+import unittest
+
+# ~ Custom modules. ~ #
+from core import bitpack
+from core import engine as eng
+from core import rules
+from core import sparse
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Word edges, odd sizes and the degenerate 1xN and Nx1 tori. ~ #
+SIZES = [(1, 1), (1, 7), (7, 1), (2, 2), (3, 5), (8, 8), (13, 21),
+         (63, 5), (64, 3), (65, 4), (100, 60), (130, 9)]
+
+ENGINES = ["numpy", "bitpack", "hashlife", "sparse"]
+
+RULES = ["B3/S23", "highlife", "daynight", "seeds", "B1/S12", "B0/S8",
+         "B/S", "B012345678/S012345678"]
+
+GENERATIONS = 12
+
+# ~ Live cells of known patterns, as (x, y). ~ #
+BLINKER = [(1, 0), (1, 1), (1, 2)]
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+def random_states(width, height, rng, density=0.4):
+    """
+        ~ Draw a random 2D matrix of cell states. ~
+
+        Arguments:
+            width (int)       : Width of the world.
+            height (int)      : Height of the world.
+            rng (Random)      : Source of the states.
+            density (float)   : Chance of a cell being alive. (Default: 0.4)
+
+        Returns:
+            (2D Matrix) : Rows of cell states.
+    """
+
+    return [[int(rng.random() < density) for _ in range(width)]
+            for _ in range(height)]
+
+
+def baseline_update(states):
+    """
+        ~ One generation of Conway's Game of Life, as the first World.update
+          ran it: cell by cell, counting the live cells of check_cells. ~
+
+        ~ Kept word for word but for the Cell objects, as the oracle every
+          engine must agree with. ~
+
+        Arguments:
+            states (2D Matrix) : Rows of cell states.
+
+        Returns:
+            (2D Matrix) : Rows of the next generation's cell states.
+    """
+
+    height, width = len(states), len(states[0])
+    new_states = [[0]*width for _ in range(height)]
+
+    def check_cells(x, y):
+        neighbors = []
+        pos = (-1, 0, 1)
+
+        for pos_y in pos:
+            for pos_x in pos:
+                if pos_x == 0 and pos_y == 0:
+                    continue
+
+                neigh_x, neigh_y = (x+pos_x)%width, (y+pos_y)%height
+
+                if 0 <= neigh_x < width and 0 <= neigh_y < height:
+                    neighbors.append(states[neigh_y][neigh_x])
+
+        return neighbors
+
+    for y in range(height):
+        for x in range(width):
+            state = states[y][x]
+            live = sum(1 for c in check_cells(x, y) if c)
+            new_state = state
+
+            if state and (live < 2 or live > 3):
+                new_state = 0
+            elif not state and live == 3:
+                new_state = 1
+
+            new_states[y][x] = new_state
+
+    return new_states
+
+
+def place(points, width, height, dx=0, dy=0):
+    """
+        ~ Rows of cell states with a pattern placed on an empty torus. ~
+
+        Arguments:
+            points (list) : Live cells of the pattern, as (x, y).
+            width (int)   : Width of the world.
+            height (int)  : Height of the world.
+            dx (int)      : Shift of the pattern to the right. (Default: 0)
+            dy (int)      : Shift of the pattern down. (Default: 0)
+
+        Returns:
+            (2D Matrix) : Rows of cell states.
+    """
+
+    states = [[0]*width for _ in range(height)]
+
+    for x, y in points:
+        states[(y+dy) % height][(x+dx) % width] = 1
+
+    return states
+
+
+def supports(name, rule):
+    """
+        ~ Whether an engine can run a rule. ~
+
+        Arguments:
+            name (str)  : Name of the engine.
+            rule (Rule) : The rule.
+
+        Returns:
+            (bool) : False for B0 rules on the hashlife engine.
+    """
+
+    return not (name == "hashlife" and 0 in rule.birth)
+
+
+class EngineTest(unittest.TestCase):
+    """
+        ~ Compares every engine with the pure-Python engine. ~
+
+        Methods:
+            compare           : Step engines side by side with the reference.
+            test_baseline     : Every engine against the original loop.
+            test_blinker      : A blinker flips between its two phases.
+            test_glider       : A glider moves one cell down and right in 4.
+            test_numpy        : NumPy engine on every size.
+            test_engines      : Every engine on every size.
+            test_rules        : Every engine on other rules.
+            test_advance      : Jumps match one step at a time.
+            test_bands        : The NumPy engine a few rows at a time.
+            test_sparse       : Sparse and dense steps of the sparse engine.
+            test_parallel     : Banded stepping on a process pool.
+            test_changes      : Reported words are the words that changed.
+            test_rows_and_get : rows, get and array agree.
+            test_compiled     : Rule networks and masks match the rule.
+    """
+
+    def compare(self, names, width, height, rule=None, seed=0):
+        """
+            ~ Step engines next to the pure-Python engine and compare every
+              generation, seeding a few cells along the way. ~
+
+            Arguments:
+                names (list)      : Names of the engines to check.
+                width (int)       : Width of the world.
+                height (int)      : Height of the world.
+                rule (str | None) : Rule in B/S notation. (Default: B3/S23)
+                seed (int)        : Seed of the random states. (Default: 0)
+        """
+
+        rng = random.Random(seed)
+        states = random_states(width, height, rng)
+
+        reference = eng.create("python", width, height, rule=rule)
+        reference.load(states)
+
+        engines = [eng.create(name, width, height, rule=rule)
+                   for name in names]
+
+        for engine in engines:
+            engine.load(states)
+
+        for generation in range(GENERATIONS):
+            if generation % 4 == 1:
+                points = [(rng.randrange(width), rng.randrange(height))
+                          for _ in range(3)]
+                reference.seed(points)
+
+                for engine in engines:
+                    engine.seed(points)
+
+            reference.step()
+            expected = reference.rows()
+
+            for engine in engines:
+                engine.step()
+
+                self.assertEqual(engine.rows(), expected,
+                                 f"{engine.name} {width}x{height} "
+                                 f"{rule} generation {generation+1}")
+
+    def test_baseline(self):
+        """ ~ Every engine steps as the original per-cell loop did. ~ """
+
+        for seed, (width, height) in enumerate(SIZES):
+            states = random_states(width, height, random.Random(seed))
+            engines = [eng.create(name, width, height)
+                       for name in ENGINES + ["python"]]
+
+            for engine in engines:
+                engine.load(states)
+
+            for generation in range(GENERATIONS):
+                states = baseline_update(states)
+
+                for engine in engines:
+                    with self.subTest(engine=engine.name, width=width,
+                                      height=height, generation=generation):
+                        engine.step()
+
+                        self.assertEqual(engine.rows(), states)
+
+    def test_blinker(self):
+        """ ~ A blinker is horizontal on odd generations, else vertical. ~ """
+
+        vertical = place(BLINKER, 5, 5, 1, 1)
+        horizontal = place([(y, x) for x, y in BLINKER], 5, 5, 1, 1)
+
+        self.assertEqual(baseline_update(vertical), horizontal)
+
+        for name in ENGINES + ["python"]:
+            engine = eng.create(name, 5, 5)
+            engine.load(vertical)
+
+            for generation in range(1, 7):
+                with self.subTest(engine=name, generation=generation):
+                    engine.step()
+
+                    self.assertEqual(engine.rows(), horizontal
+                                     if generation % 2 else vertical)
+
+    def test_glider(self):
+        """ ~ Every 4 generations a glider is one cell down and right. ~ """
+
+        for width, height in [(8, 8), (10, 7), (70, 5)]:
+            states = place(GLIDER, width, height)
+
+            for name in ENGINES + ["python"]:
+                engine = eng.create(name, width, height)
+                engine.load(states)
+
+                for shift in range(1, 4):
+                    with self.subTest(engine=name, width=width,
+                                      height=height, shift=shift):
+                        engine.advance(4)
+
+                        self.assertEqual(engine.rows(),
+                                         place(GLIDER, width, height,
+                                               shift, shift))
+
+    def test_numpy(self):
+        """ ~ The NumPy engine matches the Python engine on every size. ~ """
+
+        for seed, (width, height) in enumerate(SIZES):
+            with self.subTest(width=width, height=height):
+                self.compare(["numpy"], width, height, seed=seed)
+
+    def test_engines(self):
+        """ ~ Every engine matches the Python engine on every size. ~ """
+
+        for seed, (width, height) in enumerate(SIZES):
+            with self.subTest(width=width, height=height):
+                self.compare(ENGINES, width, height, seed=seed)
+
+    def test_rules(self):
+        """ ~ Every engine runs other rules like the Python engine. ~ """
+
+        for text in RULES:
+            rule = rules.parse(text)
+            names = [name for name in ENGINES if supports(name, rule)]
+
+            for width, height in [(1, 5), (9, 7), (66, 10)]:
+                with self.subTest(rule=text, width=width, height=height):
+                    self.compare(names, width, height, text)
+
+    def test_advance(self):
+        """ ~ Jumping many generations matches stepping them one by one. ~ """
+
+        for width, height in [(5, 3), (16, 16), (37, 23), (100, 60)]:
+            states = random_states(width, height, random.Random(width))
+
+            reference = eng.create("numpy", width, height)
+            reference.load(states)
+
+            engine = eng.create("hashlife", width, height)
+            engine.load(states)
+
+            for generations in (1, 3, 64, 1000):
+                with self.subTest(width=width, height=height,
+                                  generations=generations):
+                    reference.advance(generations)
+                    engine.advance(generations)
+
+                    self.assertEqual(engine.rows(), reference.rows())
+
+    def test_bands(self):
+        """ ~ Stepping a few rows at a time matches the Python engine. ~ """
+
+        cells = eng.BAND_CELLS
+
+        try:
+            for band in (1, 2, 3):
+                eng.BAND_CELLS = 13*band
+
+                for rule in ("B3/S23", "highlife"):
+                    with self.subTest(band=band, rule=rule):
+                        self.compare(["numpy"], 13, 10, rule, seed=band)
+        finally:
+            eng.BAND_CELLS = cells
+
+    def test_sparse(self):
+        """ ~ The sparse engine matches the Python engine either way. ~ """
+
+        fraction = sparse.DENSE_FRACTION
+
+        try:
+            # ~ Always sparse after the first step, then always dense. ~ #
+            for limit in (1, 0):
+                sparse.DENSE_FRACTION = limit
+
+                for seed, (width, height) in enumerate(SIZES):
+                    for rule in ("B3/S23", "B1/S12"):
+                        with self.subTest(limit=limit, width=width,
+                                          height=height, rule=rule):
+                            self.compare(["sparse"], width, height, rule,
+                                         seed)
+        finally:
+            sparse.DENSE_FRACTION = fraction
+
+    def test_parallel(self):
+        """ ~ Banded stepping matches the Python engine. ~ """
+
+        for rule in ("B3/S23", "highlife"):
+            width, height = 33, 17
+            states = random_states(width, height, random.Random(7))
+
+            reference = eng.create("python", width, height, rule=rule)
+            reference.load(states)
+
+            engine = eng.create("numpy", width, height, workers=2,
+                                rule=rule)
+
+            try:
+                engine.load(states)
+
+                for generation in range(GENERATIONS):
+                    reference.step()
+                    engine.step()
+
+                    self.assertEqual(engine.rows(), reference.rows(),
+                                     f"{rule} generation {generation+1}")
+            finally:
+                engine.close()
+
+    def test_changes(self):
+        """ ~ Engines report exactly the words seeds and steps change. ~ """
+
+        for name in ENGINES + ["python"]:
+            engine = eng.create(name, 65, 9)
+
+            if not engine.reports_changes:
+                continue
+
+            rng = random.Random(5)
+            engine.load(random_states(65, 9, rng))
+
+            # ~ The words as the reports say they are. ~ #
+            words = bitpack.pack(engine.array(), 65).ravel()
+
+            def on_change(index, new):
+                words[index] = new
+
+            engine.on_change = on_change
+
+            for generation in range(GENERATIONS):
+                with self.subTest(engine=name, generation=generation):
+                    points = [(rng.randrange(65), rng.randrange(9))
+                              for _ in range(4)]
+                    engine.seed(points + points[:1])
+                    engine.step()
+
+                    self.assertEqual(
+                        words.tolist(),
+                        bitpack.pack(engine.array(), 65).ravel().tolist())
+
+    def test_rows_and_get(self):
+        """ ~ rows, get and array report the same cells. ~ """
+
+        width, height = 70, 9
+        states = random_states(width, height, random.Random(3))
+
+        for name in ENGINES + ["python"]:
+            with self.subTest(engine=name):
+                engine = eng.create(name, width, height)
+                engine.load(states)
+                engine.step()
+
+                rows = engine.rows()
+
+                self.assertEqual(engine.array().tolist(), rows)
+                self.assertEqual([[engine.get(x, y) for x in range(width)]
+                                  for y in range(height)], rows)
+
+    def test_compiled(self):
+        """ ~ Compiled rules give every count's next state. ~ """
+
+        for born in range(0, 512, 37):
+            for survive in range(0, 512, 53):
+                rule = rules.Rule(
+                    tuple(count for count in range(9) if born >> count & 1),
+                    tuple(count for count in range(9)
+                          if survive >> count & 1))
+                network = rules.network(rule)
+                dead, live, offset, eights = rules.masks(rule)
+
+                for state, count in itertools.product((0, 1), range(9)):
+                    with self.subTest(rule=rules.notation(rule),
+                                      state=state, count=count):
+                        expected = rules.next_state(rule)[state][count]
+
+                        # ~ The network on one cell's planes. ~ #
+                        slots = [count >> bit & 1 for bit in range(4)]
+                        slots.append(state)
+
+                        for op, left, right in network:
+                            left = slots[left] if left is not None else 0
+                            right = slots[right] if right is not None else 0
+                            slots.append({"and": left & right,
+                                          "or": left | right,
+                                          "xor": left ^ right,
+                                          "not": 1-left, "copy": left,
+                                          "zero": 0, "one": 1}[op])
+
+                        self.assertEqual(slots[-1], expected)
+
+                        # ~ The byte of the state, shifted by the count. ~ #
+                        shift = (count-offset) % 256
+                        found = (live if state else dead) >> shift & 1
+
+                        if eights is not None and count == 8:
+                            found = eights[state]
+
+                        self.assertEqual(found, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
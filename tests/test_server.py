@@ -0,0 +1,280 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_server.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The simulation server: commands from viewers, and frames coalesced for a
+    slow one.
+"""
+
+
+# ~ Standard libraries. ~ #
+import asyncio
+import unittest
+import zlib
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import engine as eng
+from core import server as srv
+from core import world
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Seconds to wait for anything the server should do at once. ~ #
+TIMEOUT = 10
+
+
+def cells_of(payload, last, shape):
+    """
+        ~ Decode the cells of a FRAME payload. ~
+
+        Arguments:
+            payload (bytes) : The payload.
+            last (ndarray)  : The frame before it, or None.
+            shape (tuple)   : (height, width) of the world.
+
+        Returns:
+            (tuple) : The record kind, the generation and the cells.
+    """
+
+    record, generation = srv.FRAME_HEAD.unpack_from(payload)
+    data = zlib.decompress(payload[srv.FRAME_HEAD.size:])
+
+    return record, generation, srv.stm.decode(record, data, last, shape)
+
+
+async def eventually(predicate):
+    """
+        ~ Wait until a condition holds. ~
+
+        Arguments:
+            predicate (func) : The condition.
+    """
+
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), TIMEOUT)
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    """
+        ~ Serves a world to viewers over TCP. ~
+
+        Methods:
+            asyncSetUp       : Serve a world and connect a viewer.
+            asyncTearDown    : Disconnect and stop the server.
+            frame            : Wait for a frame matching a condition.
+            pause            : Pause, and wait for stepping to stop.
+            test_pause       : Pausing stops stepping, resuming starts it.
+            test_step        : STEP runs generations while paused.
+            test_seed        : SEED brings a pattern to life.
+            test_unknown     : Unknown patterns and commands get an ERROR.
+            test_malformed   : Malformed commands get an ERROR too.
+            test_coalesce    : A slow viewer gets the newest generation.
+    """
+
+    async def asyncSetUp(self):
+        """ ~ Serve a world and connect a viewer. ~ """
+
+        self.world = world.World(24, 16, entropy="numpy", seed=3,
+                                 seeds_per_generation=0)
+        await asyncio.wrap_future(self.world.loading)
+
+        self.server = await srv.Server(self.world, rate=200).start()
+        self.client = await srv.Client.connect(self.server.address)
+
+        self.frames = asyncio.Queue()
+        self.viewer = asyncio.create_task(self.watch())
+
+    async def asyncTearDown(self):
+        """ ~ Disconnect and stop the server. ~ """
+
+        self.viewer.cancel()
+        await self.client.close()
+        await self.server.close()
+        self.world.engine.close()
+
+    async def watch(self):
+        """ ~ Queue every frame the viewer is sent. ~ """
+
+        async for generation, cells in self.client.frames():
+            await self.frames.put((generation, cells.copy()))
+
+    async def frame(self, predicate):
+        """
+            ~ Wait for a frame matching a condition. ~
+
+            Arguments:
+                predicate (func) : Called with the generation and cells.
+
+            Returns:
+                (tuple) : The generation and cells of the frame.
+        """
+
+        async def wait():
+            while True:
+                generation, cells = await self.frames.get()
+
+                if predicate(generation, cells):
+                    return generation, cells
+
+        return await asyncio.wait_for(wait(), TIMEOUT)
+
+    async def pause(self):
+        """
+            ~ Pause, and wait for the step in flight to land. ~
+
+            Returns:
+                (int) : The generation stepping stopped at.
+        """
+
+        await self.client.pause()
+        await eventually(lambda: self.server.paused)
+
+        # ~ A step queued before the pause lands on the world's thread. ~ #
+        await asyncio.get_running_loop().run_in_executor(
+            self.server._executor, lambda: None)
+
+        return self.world.generation
+
+    async def test_pause(self):
+        """ ~ Pausing holds the generation, resuming moves it on. ~ """
+
+        generation = await self.pause()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.world.generation, generation)
+
+        await self.client.pause(False)
+        await eventually(lambda: self.world.generation > generation+5)
+
+        self.assertFalse(self.server.paused)
+
+    async def test_step(self):
+        """ ~ STEP runs exactly that many generations while paused. ~ """
+
+        generation = await self.pause()
+
+        reference = eng.create("numpy", 24, 16)
+        reference.load(self.world.grid.tolist())
+
+        for _ in range(5):
+            reference.step()
+
+        await self.client.step(5)
+        _, cells = await self.frame(lambda number, _: number ==
+                                    generation+5)
+
+        np.testing.assert_array_equal(cells, reference.array())
+        self.assertEqual(self.world.generation, generation+5)
+        self.assertTrue(self.server.paused)
+
+    async def test_seed(self):
+        """ ~ A seeded pattern turns up in the next frame. ~ """
+
+        generation = await self.pause()
+        cells = [((5+x) % 24, (14+y) % 16)
+                 for x, y in world.PATTERNS["glider"]]
+
+        await self.client.seed("glider", 5, 14)
+        number, grid = await self.frame(
+            lambda _, grid: all(grid[y, x] for x, y in cells))
+
+        self.assertEqual(number, generation)
+        np.testing.assert_array_equal(grid, self.world.grid)
+
+    async def test_unknown(self):
+        """ ~ Unknown patterns and commands are answered with an ERROR. ~ """
+
+        await self.client.seed("spaceship", 0, 0)
+        self.client._writer.write(srv._message(99))
+
+        await eventually(lambda: len(self.client.errors) == 2)
+
+        self.assertEqual(self.client.errors,
+                         ["Unknown pattern: spaceship!",
+                          "Unknown command: 99!"])
+
+    async def test_malformed(self):
+        """ ~ Short or undecodable payloads don't drop the viewer. ~ """
+
+        generation = await self.pause()
+
+        for kind, payload in [(srv.SEED, b"\1\2"),
+                              (srv.SEED, srv.SEED_HEAD.pack(0, 0)+b"\xff"),
+                              (srv.STEP, b"")]:
+            self.client._writer.write(srv._message(kind, payload))
+
+        await eventually(lambda: len(self.client.errors) == 3)
+
+        self.assertEqual(self.client.errors,
+                         ["Malformed SEED command!"]*2 +
+                         ["Malformed STEP command!"])
+
+        await self.client.step(2)
+        await self.frame(lambda number, _: number == generation+2)
+
+    async def test_coalesce(self):
+        """ ~ A viewer that doesn't keep up skips to the newest frame. ~ """
+
+        reader, writer = await asyncio.open_connection(*self.server.address)
+
+        try:
+            kind, _ = await srv._read_message(reader)
+            self.assertEqual(kind, srv.HELLO)
+
+            kind, payload = await srv._read_message(reader)
+            record, first, cells = cells_of(payload, None, (16, 24))
+
+            self.assertEqual((kind, record), (srv.FRAME, srv.stm.KEYFRAME))
+
+            # ~ Stay behind while generations go by, then catch up. ~ #
+            await eventually(lambda: self.world.generation > first+10)
+            generation = await self.pause()
+
+            writer.write(srv._message(srv.ACK))
+            kind, payload = await asyncio.wait_for(
+                srv._read_message(reader), TIMEOUT)
+            record, number, cells = cells_of(payload, cells, (16, 24))
+
+            # ~ One delta from the frame the viewer has to the newest. ~ #
+            self.assertEqual(kind, srv.FRAME)
+            self.assertNotEqual(record, srv.stm.KEYFRAME)
+            self.assertEqual(number, generation)
+            np.testing.assert_array_equal(cells, self.world.grid)
+            self.assertGreaterEqual(self.server.coalesced,
+                                    generation-first-1)
+        finally:
+            writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
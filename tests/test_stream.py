@@ -0,0 +1,267 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_stream.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Generation streams encode each kind of record and read back in order or
+    by seeking.
+"""
+
+
+# ~ Standard libraries. ~ #
+import io
+import unittest
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import stream
+
+
+def evolve(generations, shape, density, seed=0):
+    """
+        ~ Random generations, each flipping a share of the last one's cells. ~
+
+        Arguments:
+            generations (int) : Generations to make.
+            shape (tuple)     : (height, width) of each.
+            density (float)   : Share of the cells flipped per generation.
+            seed (int)        : Seed of the generator. (Default: 0)
+
+        Returns:
+            (list[ndarray]) : The generations.
+    """
+
+    rng = np.random.default_rng(seed)
+    cells = (rng.random(shape) < 0.5).astype(np.uint8)
+    frames = [cells]
+
+    for _ in range(generations-1):
+        cells = cells ^ (rng.random(shape) < density)
+        frames.append(cells.astype(np.uint8))
+
+    return frames
+
+
+class RecordTest(unittest.TestCase):
+    """
+        ~ Encodes and decodes single records. ~
+
+        Methods:
+            test_keyframe : Full generations, and the first of any stream.
+            test_indices  : A few flips are written as gaps.
+            test_bitmap   : Many flips are written as a bitmap.
+            test_gaps     : Gaps widen past 2^32 cells.
+            test_errors   : Deltas without a base, and unknown kinds.
+    """
+
+    def test_keyframe(self):
+        """ ~ Keyframes stand alone and survive odd sizes. ~ """
+
+        for shape in [(1, 1), (7, 13), (16, 16)]:
+            with self.subTest(shape=shape):
+                last, cells = evolve(2, shape, 0.1)
+
+                for keyframe, base in [(True, last), (False, None)]:
+                    kind, payload = stream.encode(cells, base, keyframe)
+
+                    self.assertEqual(kind, stream.KEYFRAME)
+                    np.testing.assert_array_equal(
+                        stream.decode(kind, payload, None, shape), cells)
+
+    def test_indices(self):
+        """ ~ A quiet generation is stored as the gaps between flips. ~ """
+
+        last = np.zeros((40, 50), dtype=np.uint8)
+
+        for flips in [[], [0], [3, 4, 999], [1999]]:
+            with self.subTest(flips=flips):
+                cells = last.copy()
+                cells.flat[flips] = 1
+
+                kind, payload = stream.encode(cells, last, False)
+
+                self.assertEqual(kind, stream.INDICES)
+                self.assertEqual(len(payload), 4*len(flips))
+                np.testing.assert_array_equal(
+                    stream.decode(kind, payload, last, cells.shape), cells)
+
+    def test_bitmap(self):
+        """ ~ A busy generation is stored as a bitmap of flips. ~ """
+
+        for shape in [(9, 11), (64, 64)]:
+            with self.subTest(shape=shape):
+                last, cells = evolve(2, shape, 0.3)
+
+                kind, payload = stream.encode(cells, last, False)
+
+                self.assertEqual(kind, stream.BITMAP)
+                self.assertEqual(len(payload), -(-cells.size//8))
+                np.testing.assert_array_equal(
+                    stream.decode(kind, payload, last, shape), cells)
+
+    def test_gaps(self):
+        """ ~ Four byte gaps up to 2^32 cells, eight past it. ~ """
+
+        self.assertEqual(stream.gap_dtype(1), "<u4")
+        self.assertEqual(stream.gap_dtype(1 << 32), "<u4")
+        self.assertEqual(stream.gap_dtype((1 << 32)+1), "<u8")
+
+    def test_errors(self):
+        """ ~ Records that can't be decoded raise a ValueError. ~ """
+
+        with self.assertRaises(ValueError):
+            stream.decode(stream.INDICES, b"", None, (2, 2))
+
+        with self.assertRaises(ValueError):
+            stream.decode(7, b"", np.zeros((2, 2), np.uint8), (2, 2))
+
+
+class StreamTest(unittest.TestCase):
+    """
+        ~ Writes whole streams and reads them back. ~
+
+        Methods:
+            write        : Stream generations into memory.
+            test_kinds   : Every kind of record turns up where expected.
+            test_iterate : Reading in order returns every generation.
+            test_seek    : Seeking decodes any one generation.
+            test_cut     : A record cut off mid-write is left out.
+            test_errors  : Bad streams and bad input are refused.
+    """
+
+    def write(self, frames, keyframe, start=0):
+        """
+            ~ Stream generations into memory. ~
+
+            Arguments:
+                frames (list)  : The generations.
+                keyframe (int) : Generations between full keyframes.
+                start (int)    : Number of the first generation.
+                                 (Default: 0)
+
+            Returns:
+                (bytes) : The stream.
+        """
+
+        target = io.BytesIO()
+        height, width = frames[0].shape
+        writer = stream.StreamWriter(target, width, height, keyframe,
+                                     buffer=4)
+
+        for generation, cells in enumerate(frames, start):
+            writer.write(generation, cells)
+
+        writer.close()
+        self.assertEqual(writer.written, len(target.getvalue()))
+
+        return target.getvalue()
+
+    def test_kinds(self):
+        """ ~ Keyframes on schedule, indices or bitmaps in between. ~ """
+
+        quiet = evolve(10, (30, 30), 0.002, seed=1)
+        busy = evolve(10, (30, 30), 0.4, seed=2)
+
+        for frames, delta in [(quiet, stream.INDICES),
+                              (busy, stream.BITMAP)]:
+            with self.subTest(delta=delta):
+                reader = stream.StreamReader(io.BytesIO(self.write(frames,
+                                                                   4)))
+                kinds = [entry[0] for entry in reader._scan()]
+                keyframes = [stream.KEYFRAME if index % 4 == 0 else delta
+                             for index in range(10)]
+
+                self.assertEqual(kinds, keyframes)
+
+    def test_iterate(self):
+        """ ~ Every generation comes back in order, with its number. ~ """
+
+        for shape in [(1, 1), (5, 13), (33, 17)]:
+            for keyframe in (1, 3, 256):
+                with self.subTest(shape=shape, keyframe=keyframe):
+                    frames = evolve(20, shape, 0.05)
+                    reader = stream.StreamReader(
+                        io.BytesIO(self.write(frames, keyframe, start=7)))
+
+                    self.assertEqual((reader.height, reader.width), shape)
+                    self.assertEqual(reader.keyframe, keyframe)
+
+                    numbers = []
+
+                    for (generation, cells), frame in zip(reader, frames):
+                        numbers.append(generation)
+                        np.testing.assert_array_equal(cells, frame)
+
+                    self.assertEqual(numbers, list(range(7, 27)))
+
+    def test_seek(self):
+        """ ~ Any generation decodes alone, in any order. ~ """
+
+        frames = evolve(25, (20, 24), 0.01, seed=3)
+        reader = stream.StreamReader(io.BytesIO(self.write(frames, 6)))
+
+        self.assertEqual(reader.generations, list(range(25)))
+
+        for generation in [24, 0, 5, 6, 7, 13, 12]:
+            with self.subTest(generation=generation):
+                np.testing.assert_array_equal(reader.seek(generation),
+                                              frames[generation])
+
+        with self.assertRaises(ValueError):
+            reader.seek(25)
+
+    def test_cut(self):
+        """ ~ A stream still being written reads up to its last record. ~ """
+
+        frames = evolve(8, (10, 10), 0.3, seed=4)
+        data = self.write(frames, 4)[:-1]
+
+        reader = stream.StreamReader(io.BytesIO(data))
+
+        self.assertEqual(len(list(reader)), 7)
+        self.assertEqual(reader.generations, list(range(7)))
+
+    def test_errors(self):
+        """ ~ Foreign streams and misshapen grids raise a ValueError. ~ """
+
+        with self.assertRaises(ValueError):
+            stream.StreamReader(io.BytesIO(b"\0"*stream.HEADER.size))
+
+        with self.assertRaises(ValueError):
+            stream.StreamWriter(io.BytesIO(), 4, 4, keyframe=0)
+
+        writer = stream.StreamWriter(io.BytesIO(), 4, 4)
+
+        with self.assertRaises(ValueError):
+            writer.write(0, np.zeros((4, 5), np.uint8))
+
+        writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
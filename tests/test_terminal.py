@@ -0,0 +1,247 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                Programmer: Aaron "A.J." Cassell. (@BrotatoBoi)
+                        Program Name: Game of Life.
+Description: A recreation of Conway's Game of Life using Quantum Computing for
+                        more natural randomness.
+                          File: test_terminal.py
+                            Date: 2026/10/18
+                        Version: 2.6-2026.10.18
+
+===============================================================================
+
+                        Copyright (C) 2025 BrotatoBoi
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The terminal renderer: replaying what it writes onto a virtual screen
+    must show every frame exactly, colors included.
+"""
+
+
+# ~ Standard libraries. ~ #
+import io
+import re
+import unittest
+
+# ~ Third-party libraries. ~ #
+import numpy as np
+
+# ~ Custom modules. ~ #
+from core import terminal
+
+
+# ~ Initialize GLOBAL Variables. ~ #
+# ~ Cursor moves, other escapes, and plain characters. ~ #
+TOKENS = re.compile(r"\x1b\[(\d+);(\d+)H|(\x1b\[[0-9;?]*[A-Za-z])|(.)",
+                    re.S)
+
+STATES = {char: state for state, char in terminal.CHARS.items()}
+PAINTS = {color: state for state, color in terminal.COLORS.items()}
+
+
+class Screen:
+    """
+        ~ A terminal that only understands what the renderer writes. ~
+
+        Methods:
+            __init__ : Initialize a blank screen.
+            write    : Apply text to the screen.
+            states   : The cell state each character shows.
+    """
+
+    def __init__(self, width, height):
+        """
+            ~ Initialize a blank screen. ~
+
+            Arguments:
+                width (int)  : Columns of the screen.
+                height (int) : Rows of the screen.
+
+            Attributes:
+                width (int)   : Columns of the screen.
+                height (int)  : Rows of the screen.
+                chars (list)  : The character in every cell.
+                colors (list) : The state whose color every cell is drawn
+                                in.
+        """
+
+        self.width = width
+        self.height = height
+        self.chars = [[None]*width for _ in range(height)]
+        self.colors = [[None]*width for _ in range(height)]
+
+        self._x = 0
+        self._y = 0
+        self._color = None
+
+    def write(self, text):
+        """
+            ~ Apply text to the screen, refusing to wrap past a row. ~
+
+            Arguments:
+                text (str) : What the renderer wrote.
+        """
+
+        for match in TOKENS.finditer(text):
+            row, column, escape, char = match.groups()
+
+            if row is not None:
+                self._y, self._x = int(row)-1, int(column)-1
+            elif escape == terminal.CLEAR:
+                self.__init__(self.width, self.height)
+            elif escape in PAINTS:
+                self._color = PAINTS[escape]
+            elif char is not None:
+                if not (0 <= self._x < self.width and
+                        0 <= self._y < self.height):
+                    raise AssertionError(f"Wrote off the screen at "
+                                         f"({self._x}, {self._y})!")
+
+                self.chars[self._y][self._x] = char
+                self.colors[self._y][self._x] = self._color
+                self._x += 1
+
+    def states(self):
+        """
+            ~ The cell state each character shows, checking its color. ~
+
+            Returns:
+                (ndarray) : Cell states; -1 where nothing was drawn.
+        """
+
+        states = np.full((self.height, self.width), -1)
+
+        for y in range(self.height):
+            for x in range(self.width):
+                state = STATES.get(self.chars[y][x], -1)
+
+                if state != -1 and self.colors[y][x] != state:
+                    raise AssertionError(f"Cell ({x}, {y}) is drawn in "
+                                         "the wrong color!")
+
+                states[y, x] = state
+
+        return states
+
+
+class RendererTest(unittest.TestCase):
+    """
+        ~ Replays the renderer's output and compares it with the frames. ~
+
+        Methods:
+            replay         : Render frames and check the screen after each.
+            frames         : Random frames flipping cells as they go.
+            test_quiet     : Frames with few changes, drawn as diffs.
+            test_busy      : Frames with many changes, redrawn whole.
+            test_resize    : A frame of another size is redrawn from scratch.
+            test_unchanged : An unchanged frame writes nothing.
+    """
+
+    def replay(self, frames):
+        """
+            ~ Render frames and check the screen shows each exactly. ~
+
+            Arguments:
+                frames (list) : The frames, in order.
+
+            Returns:
+                (list[int]) : Characters written for each frame.
+        """
+
+        output = io.StringIO()
+        renderer = terminal.TerminalRenderer(output)
+        screen = None
+        written = []
+
+        for index, cells in enumerate(frames):
+            if screen is None or (screen.height, screen.width) != \
+                    cells.shape:
+                screen = Screen(cells.shape[1], cells.shape[0])
+
+            start = output.tell()
+            renderer.render(cells)
+            text = output.getvalue()[start:]
+            screen.write(text)
+            written.append(len(text))
+
+            np.testing.assert_array_equal(screen.states(), cells,
+                                          f"frame {index}")
+
+        return written
+
+    def frames(self, shape, flips, count=30, seed=0):
+        """
+            ~ Random frames, each flipping a share of the last one's cells. ~
+
+            Arguments:
+                shape (tuple) : (height, width) of the frames.
+                flips (float) : Largest share of the cells flipped per frame.
+                count (int)   : Frames to make. (Default: 30)
+                seed (int)    : Seed of the generator. (Default: 0)
+
+            Returns:
+                (list[ndarray]) : The frames.
+        """
+
+        rng = np.random.default_rng(seed)
+        cells = (rng.random(shape) < 0.4).astype(np.uint8)
+        frames = [cells]
+
+        for _ in range(count-1):
+            cells = cells ^ (rng.random(shape) < rng.random()*flips)
+            frames.append(cells.astype(np.uint8))
+
+        return frames
+
+    def test_quiet(self):
+        """ ~ A few scattered changes are drawn in place. ~ """
+
+        for shape in [(1, 1), (3, 70), (24, 80), (50, 9)]:
+            with self.subTest(shape=shape):
+                frames = self.frames(shape, 0.05)
+                written = self.replay(frames)
+
+                # ~ Never more than redrawing every frame whole. ~ #
+                whole = [len(terminal.render_frame(cells))
+                         for cells in frames[1:]]
+
+                self.assertLessEqual(sum(written[1:]), sum(whole))
+
+    def test_busy(self):
+        """ ~ Frames that change almost everywhere are still exact. ~ """
+
+        for shape in [(2, 2), (24, 80), (7, 130)]:
+            with self.subTest(shape=shape):
+                self.replay(self.frames(shape, 0.9, seed=1))
+
+    def test_resize(self):
+        """ ~ A frame of a new size starts on a cleared screen. ~ """
+
+        small = self.frames((5, 8), 0.2, count=3)
+        large = self.frames((9, 12), 0.2, count=3, seed=2)
+
+        self.replay(small + large + small)
+
+    def test_unchanged(self):
+        """ ~ Drawing the same frame again writes nothing. ~ """
+
+        cells = self.frames((10, 10), 0, count=1)[0]
+
+        self.assertEqual(self.replay([cells, cells.copy()])[1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()